@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+badge 批量生成基准测试 / Batch Badge Rendering Benchmark
+
+用真实 CSV 行扩充出 N 个（默认 10000）名称唯一的合成资源，在临时目录中测量：
+冷启动全部生成（单进程与进程池）、无变化的重复运行，以及逐个调用 save_resource_badge_svg 的基线。
+Expands the real CSV into N synthetic resources with unique names (10000 by default) and
+measures, in a temporary directory: a cold full render (single process and process pool),
+a warm re-run with nothing changed, and a baseline calling save_resource_badge_svg one by one.
+
+用法 / Usage:
+    python benchmarks/bench_badges.py [--rows 10000] [--workers 4]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List
+
+# 添加项目根目录到 path
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from scripts.generate_readme import load_csv_resources, save_resource_badge_svg
+from scripts.render_badges import render_badges
+
+
+def synthesize_resources(rows: int) -> List[Dict]:
+    """基于真实资源生成名称唯一的合成资源 / Build uniquely named synthetic resources from real ones"""
+    base = load_csv_resources(PROJECT_ROOT / "THE_RESOURCES_TABLE.csv")
+    return [dict(base[i % len(base)], DisplayName=f"{base[i % len(base)]['DisplayName']} {i}") for i in range(rows)]
+
+
+def print_run(label: str, stats: Dict):
+    """打印一次运行的阶段耗时 / Print one run's phase timings"""
+    phases = "  ".join(f"{phase} {ms:.0f} ms" for phase, ms in stats["timings"].items())
+    total = sum(stats["timings"].values())
+    print(f"{label:<28} 生成 {stats['written']:>6}  总计 {total:>8.0f} ms  ({phases})")
+
+
+def main():
+    """主函数 / Main function"""
+    parser = argparse.ArgumentParser(description="Benchmark batch badge rendering")
+    parser.add_argument("--rows", type=int, default=10000, help="Synthetic resources")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="Worker processes")
+    parser.add_argument("--skip-baseline", action="store_true", help="Skip the one-by-one baseline")
+    args = parser.parse_args()
+
+    print("⏱️  badge 批量生成基准测试 / Batch Badge Rendering Benchmark")
+    print("=" * 50)
+
+    resources = synthesize_resources(args.rows)
+    print(f"\n📊 {len(resources)} 个资源，{args.workers} 个进程\n")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        single_dir = Path(tmp) / "single"
+        print_run("冷启动 / cold, 1 process", render_badges(resources, single_dir, workers=1))
+
+        pool_dir = Path(tmp) / "pool"
+        print_run(f"冷启动 / cold, {args.workers} processes", render_badges(resources, pool_dir, workers=args.workers))
+        print_run("无变化 / warm", render_badges(resources, pool_dir, workers=args.workers))
+
+        if not args.skip_baseline:
+            baseline_dir = Path(tmp) / "baseline"
+            baseline_dir.mkdir()
+            start = time.perf_counter()
+            for resource in resources:
+                save_resource_badge_svg(resource["DisplayName"], resource.get("Author", "").strip(), str(baseline_dir))
+            print(f"{'逐个调用 / one by one':<28} 总计 {(time.perf_counter() - start) * 1000:>8.0f} ms")
+
+    print("\n✅ 完成！")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+README 生成基准测试 / README Generation Benchmark
+
+用真实 CSV 行扩充出 N 行（默认 50000）的合成资源表，分散到 categories.yaml 的所有
+分类和子分类中，分别测量 1/4、1/2 和全部行数下加载、分组和渲染的耗时，验证随行数线性增长，
+并与按分类/子分类逐次过滤整个列表的原始实现对比。
+Expands the real CSV into a synthetic N-row table (50000 by default) spread over every
+category and subcategory in categories.yaml, and times loading, grouping and rendering at
+1/4, 1/2 and all of the rows to check the cost grows linearly, compared with the original
+path that filters the whole list once per category and subcategory.
+
+用法 / Usage:
+    python benchmarks/bench_readme.py [--rows 50000] [--skip-filter]
+"""
+
+import argparse
+import csv
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List
+
+# 添加项目根目录到 path
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from scripts.generate_readme import (
+    generate_stats,
+    generate_toc,
+    group_resources,
+    load_categories,
+    load_csv_resources,
+    render_category,
+    render_resource,
+)
+
+
+def write_synthetic_csv(path: Path, rows: int, categories: List[Dict]):
+    """
+    基于真实资源生成合成 CSV / Write a synthetic CSV built from real resources
+
+    每行轮流分配到一个（分类, 子分类）组合，名称和 URL 唯一。
+    Each row is assigned round-robin to a (category, subcategory) pair, with unique names and URLs.
+    """
+    with open(PROJECT_ROOT / "THE_RESOURCES_TABLE.csv", "r", encoding="utf-8", newline="") as f:
+        reader = csv.DictReader(f)
+        fieldnames = reader.fieldnames
+        base = list(reader)
+
+    slots = [
+        (category["id"], subcat["id"])
+        for category in categories
+        for subcat in category.get("subcategories", [{"id": "general"}])
+    ]
+
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=fieldnames)
+        writer.writeheader()
+        for i in range(rows):
+            src = base[i % len(base)]
+            category_id, subcat_id = slots[i % len(slots)]
+            writer.writerow(
+                dict(
+                    src,
+                    ID=f"bench-{i:06d}",
+                    DisplayName=f"{src['DisplayName']} {i}",
+                    PrimaryLink=f"https://github.com/bench-{i}/{src['ID']}",
+                    Category=category_id,
+                    SubCategory=subcat_id,
+                    IsActive="TRUE",
+                )
+            )
+
+
+def filtered_sections(resources: List[Dict], categories: List[Dict]) -> str:
+    """
+    原始实现：每个分类、每个子分类都过滤一次整个列表
+    Original path: filters the whole list once per category and per subcategory
+    """
+    parts = []
+    for category in categories:
+        count = len([r for r in resources if r["Category"] == category["id"]])  # 目录 / TOC
+        count += len([r for r in resources if r["Category"] == category["id"]])  # 统计 / stats
+        category_resources = [r for r in resources if r["Category"] == category["id"]]
+        if not count or not category_resources:
+            continue
+        for subcat in category.get("subcategories", []):
+            subcat_resources = [r for r in category_resources if r.get("SubCategory", "").strip() == subcat["id"]]
+            parts.extend(render_resource(r) for r in subcat_resources)
+    return "\n".join(parts)
+
+
+def render_all(resources: List[Dict], categories: List[Dict]) -> Dict[str, float]:
+    """分阶段渲染并计时（毫秒）/ Render in phases and time each one in milliseconds"""
+    timings = {}
+
+    start = time.perf_counter()
+    groups = group_resources(resources)
+    timings["group"] = (time.perf_counter() - start) * 1000
+
+    start = time.perf_counter()
+    generate_stats(resources, categories, groups)
+    generate_toc(categories, groups)
+    timings["stats+toc"] = (time.perf_counter() - start) * 1000
+
+    start = time.perf_counter()
+    for category in categories:
+        group = groups.get(category["id"])
+        if group:
+            render_category(category, group)
+    timings["render"] = (time.perf_counter() - start) * 1000
+
+    return timings
+
+
+def main():
+    """主函数 / Main function"""
+    parser = argparse.ArgumentParser(description="Benchmark README generation")
+    parser.add_argument("--rows", type=int, default=50000, help="Rows in the synthetic CSV")
+    parser.add_argument("--skip-filter", action="store_true", help="Skip the per-category filtering baseline")
+    args = parser.parse_args()
+
+    print("⏱️  README 生成基准测试 / README Generation Benchmark")
+    print("=" * 50)
+
+    categories = load_categories(PROJECT_ROOT / "templates" / "categories.yaml")
+
+    print(f"\n{'行数':>8} {'加载 ms':>10} {'分组 ms':>10} {'统计+目录 ms':>14} {'渲染 ms':>10} {'µs/行':>8}")
+    print("-" * 66)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for rows in (args.rows // 4, args.rows // 2, args.rows):
+            csv_path = Path(tmp) / f"resources-{rows}.csv"
+            write_synthetic_csv(csv_path, rows, categories)
+
+            start = time.perf_counter()
+            resources = load_csv_resources(csv_path)
+            load_ms = (time.perf_counter() - start) * 1000
+
+            timings = render_all(resources, categories)
+            total_ms = load_ms + sum(timings.values())
+            print(
+                f"{rows:>8} {load_ms:>10.1f} {timings['group']:>10.1f} {timings['stats+toc']:>14.1f} "
+                f"{timings['render']:>10.1f} {total_ms * 1000 / rows:>8.2f}"
+            )
+
+        if not args.skip_filter:
+            start = time.perf_counter()
+            filtered_sections(resources, categories)
+            filter_ms = (time.perf_counter() - start) * 1000
+            grouped_ms = timings["group"] + timings["stats+toc"] + timings["render"]
+            print(f"\n📊 {len(resources)} 行: 分组渲染 {grouped_ms:.1f} ms，逐次过滤 {filter_ms:.1f} ms")
+
+    print("\n✅ 完成！")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
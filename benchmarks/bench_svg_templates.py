@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+SVG 模板渲染基准测试 / SVG Template Rendering Benchmark
+
+对 ticker、README 标题/badge 和 logo 的每个模板，用同一组插槽值比较：
+- 之前：每次调用 str.format 重新解析模板源码
+- 之后：导入时预编译的 SvgTemplate.render
+两者输出必须逐字节一致；最后给出各生成器整体一次调用的耗时。
+
+For every ticker, README heading/badge and logo template, compares with the same slot values:
+- before: str.format re-parses the template source on every call
+- after: SvgTemplate.render, precompiled at import
+Both outputs must be byte-identical; per-call timings of each whole generator follow.
+
+用法 / Usage:
+    python benchmarks/bench_svg_templates.py [--repeat 20000]
+"""
+
+import argparse
+import sys
+import timeit
+from pathlib import Path
+
+# 添加项目根目录到 path
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from scripts.generate_logo_svgs import LOGO_SVG, generate_logo_svg
+from scripts.generate_readme import (
+    BADGE_AUTHOR_SVG,
+    BADGE_SVG,
+    H2_SVG,
+    H3_SVG,
+    generate_h2_svg,
+    generate_h3_svg,
+    generate_resource_badge_svg,
+)
+from scripts.generate_ticker_svg import (
+    REPO_GROUP_SVG,
+    STAR_SNIPPET_SVG,
+    TICKER_SVG,
+    generate_ticker_svg,
+    load_repos,
+)
+
+# 示例插槽值 / Sample slot values
+GROUP_VALUES = {
+    "full_name": "anthropics/claude-code",
+    "x_offset": 300,
+    "text": "#ffffff",
+    "repo_name": "claude-code",
+    "owner_start_x": 140,
+    "owner_font_size": 24,
+    "owner": "anthropics",
+    "star_snippet": "",
+}
+
+CASES = [
+    ("ticker star", STAR_SNIPPET_SVG, {"star_x": 282, "y_pos": 64, "stars": "#00ffff", "metrics": " | 1.2K ⭐ +5"}),
+    ("ticker group", REPO_GROUP_SVG, GROUP_VALUES),
+    ("ticker", TICKER_SVG, {"content_width": 3000, "duration": 54, "repos_svg_1": "", "repos_svg_2": ""}),
+    ("h2", H2_SVG, {"left_bound": 180, "viewbox_width": 440, "text_escaped": "官方资源 📘"}),
+    ("h3", H3_SVG, {"total_width": 106, "text_escaped": "官方文档"}),
+    (
+        "badge",
+        BADGE_SVG,
+        {"width": 400, "line_end": 396, "initials": "CC", "name": "Claude Code", "author_element": ""},
+    ),
+    ("badge author", BADGE_AUTHOR_SVG, {"x": 212, "author": "Anthropic"}),
+    (
+        "logo",
+        LOGO_SVG,
+        {
+            "theme": "dark",
+            "primary_color": "#FF8C5A",
+            "secondary_color": "#e1e4e8",
+            "accent_color": "#B47FFF",
+            "glow_opacity": "0.4",
+            "glow_peak": 0.6000000000000001,
+        },
+    ),
+]
+
+
+def fill_ticker_colors(values: dict) -> dict:
+    """ticker 模板的配色插槽用同一个颜色填充 / Fill the ticker template's color slots with one color"""
+    return {slot: values.get(slot, "#33ff33") for slot in TICKER_SVG.slots}
+
+
+def per_call_us(func, repeat: int) -> float:
+    """单次调用耗时（微秒，取 3 轮最小值）/ Per-call time in microseconds (best of 3 rounds)"""
+    return min(timeit.repeat(func, number=repeat, repeat=3)) / repeat * 1e6
+
+
+def main():
+    """主函数 / Main function"""
+    parser = argparse.ArgumentParser(description="Benchmark precompiled SVG templates")
+    parser.add_argument("--repeat", type=int, default=20000, help="Calls per timing round")
+    args = parser.parse_args()
+
+    print("⏱️  SVG 模板渲染基准测试 / SVG Template Rendering Benchmark")
+    print("=" * 50)
+
+    print(f"\n{'模板':<14} {'format µs':>10} {'render µs':>10} {'加速':>7}")
+    print("-" * 46)
+    for name, template, values in CASES:
+        if template is TICKER_SVG:
+            values = fill_ticker_colors(values)
+        before = template.source.format(**values)
+        if template.render(**values) != before:
+            print(f"❌ {name}: 输出不一致 / outputs differ")
+            return 1
+
+        format_us = per_call_us(lambda: template.source.format(**values), args.repeat)
+        render_us = per_call_us(lambda: template.render(**values), args.repeat)
+        print(f"{name:<14} {format_us:>10.2f} {render_us:>10.2f} {format_us / render_us:>6.1f}x")
+
+    repos = load_repos(PROJECT_ROOT / "data" / "repo-ticker.csv")
+    generators = [
+        ("ticker", lambda: generate_ticker_svg(repos, "dark")),
+        ("h2", lambda: generate_h2_svg("官方资源", "📘")),
+        ("h3", lambda: generate_h3_svg("官方文档")),
+        ("badge", lambda: generate_resource_badge_svg("Claude Code <Docs>", "Anthropic & Co")),
+        ("logo", lambda: generate_logo_svg("dark")),
+    ]
+
+    print(f"\n{'生成器':<14} {'µs/次':>10}")
+    print("-" * 26)
+    for name, func in generators:
+        print(f"{name:<14} {per_call_us(func, max(1, args.repeat // 10)):>10.2f}")
+
+    print("\n✅ 完成！")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -29,6 +29,9 @@ import yaml
 
 # 项目根目录 / Project root
 PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from scripts.candidate_store import get_candidate_store
 
 
 def load_config() -> dict:
@@ -50,20 +53,7 @@ def load_categories() -> List[dict]:
 
 def load_pending_resources() -> List[dict]:
     """加载待审核资源 / Load pending resources"""
-    pending_file = PROJECT_ROOT / "candidates" / "pending_resources.json"
-    if pending_file.exists():
-        with open(pending_file, "r", encoding="utf-8") as f:
-            data = json.load(f)
-            return data.get("resources", [])
-    return []
-
-
-def save_pending_resources(resources: List[dict]):
-    """保存待审核资源 / Save pending resources"""
-    pending_file = PROJECT_ROOT / "candidates" / "pending_resources.json"
-    data = {"_comment": "候选资源队列 - 待审核的资源", "_schema_version": "1.0", "resources": resources}
-    with open(pending_file, "w", encoding="utf-8") as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+    return get_candidate_store().load("pending")
 
 
 def load_cache() -> dict:
@@ -566,22 +556,11 @@ def main():
 
         # 保存
         if args.save:
-            # 更新 pending 资源
-            pending = load_pending_resources()
-            enhanced_ids = {r.get("ID") for r in enhanced}
-
-            updated_pending = []
-            for res in pending:
-                if res.get("ID") in enhanced_ids:
-                    # 找到对应的增强版本
-                    for e in enhanced:
-                        if e.get("ID") == res.get("ID"):
-                            updated_pending.append(e)
-                            break
-                else:
-                    updated_pending.append(res)
-
-            save_pending_resources(updated_pending)
+            # 逐条更新 pending 资源 / Update the pending resources one by one
+            store = get_candidate_store()
+            for res in enhanced:
+                store.update("pending", res)
+            store.export()
             print("\n💾 已保存增强结果")
 
         return 0
@@ -24,6 +24,10 @@ import yaml
 
 # 项目根目录 / Project root
 PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from scripts.github_client import get_client
+from scripts.github_graphql import fetch_repos_metadata, repo_key
 
 
 def load_config() -> dict:
@@ -81,6 +85,29 @@ def extract_github_info(url: str) -> Optional[Tuple[str, str]]:
     return None
 
 
+def parse_repo_stats(data: dict) -> dict:
+    """
+    将 REST 仓库响应转换为统计 / Convert a REST repository response to stats
+
+    watchers 取 subscribers_count（关注者数），与 GraphQL 的 watchers.totalCount 含义一致；
+    REST 的 watchers_count 只是 stargazers_count 的旧别名。
+    watchers reads subscribers_count (people watching), matching GraphQL watchers.totalCount;
+    REST watchers_count is only a legacy alias of stargazers_count.
+    """
+    return {
+        "stars": data.get("stargazers_count", 0),
+        "forks": data.get("forks_count", 0),
+        "watchers": data.get("subscribers_count", 0),
+        "open_issues": data.get("open_issues_count", 0),
+        "pushed_at": data.get("pushed_at"),
+        "updated_at": data.get("updated_at"),
+        "archived": data.get("archived", False),
+        "description": data.get("description"),
+        "language": data.get("language"),
+        "topics": data.get("topics", []),
+    }
+
+
 def get_repo_stats(owner: str, repo: str, token: Optional[str] = None) -> Optional[dict]:
     """
     获取仓库统计信息 / Get repository statistics
@@ -88,27 +115,13 @@ def get_repo_stats(owner: str, repo: str, token: Optional[str] = None) -> Option
     Returns: {stars, forks, watchers, open_issues, pushed_at, ...}
     """
     headers = {"Accept": "application/vnd.github+json", "X-GitHub-Api-Version": "2022-11-28"}
-    if token:
-        headers["Authorization"] = f"Bearer {token}"
 
     url = f"https://api.github.com/repos/{owner}/{repo}"
 
     try:
-        response = requests.get(url, headers=headers, timeout=30)
+        response = get_client(token).get(url, headers=headers, timeout=30)
         if response.status_code == 200:
-            data = response.json()
-            return {
-                "stars": data.get("stargazers_count", 0),
-                "forks": data.get("forks_count", 0),
-                "watchers": data.get("watchers_count", 0),
-                "open_issues": data.get("open_issues_count", 0),
-                "pushed_at": data.get("pushed_at"),
-                "updated_at": data.get("updated_at"),
-                "archived": data.get("archived", False),
-                "description": data.get("description"),
-                "language": data.get("language"),
-                "topics": data.get("topics", []),
-            }
+            return parse_repo_stats(response.json())
         elif response.status_code == 404:
             return {"error": "not_found"}
     except requests.exceptions.RequestException as e:
@@ -212,11 +225,18 @@ def calculate_growth_metrics(current_stats: dict, previous_stats: dict, days_ela
 
 
 def analyze_resource(
-    resource: dict, trends_history: dict, token: Optional[str] = None, config: Optional[dict] = None
+    resource: dict,
+    trends_history: dict,
+    token: Optional[str] = None,
+    config: Optional[dict] = None,
+    prefetched_stats: Optional[Dict[str, dict]] = None,
 ) -> Optional[dict]:
     """
     分析单个资源的趋势 / Analyze trends for a single resource
 
+    prefetched_stats 为 GraphQL 批量获取的统计，命中时不再调用 REST API。
+    prefetched_stats holds GraphQL batch results; hits skip the REST call.
+
     Returns: 分析结果或 None
     """
     url = resource.get("PrimaryLink", "")
@@ -228,8 +248,10 @@ def analyze_resource(
     owner, repo = github_info
     full_name = f"{owner}/{repo}"
 
-    # 获取当前统计
-    current_stats = get_repo_stats(owner, repo, token)
+    # 获取当前统计（优先使用批量预取结果）
+    current_stats = (prefetched_stats or {}).get(repo_key(owner, repo))
+    if current_stats is None:
+        current_stats = get_repo_stats(owner, repo, token)
 
     if not current_stats or current_stats.get("error"):
         return {
@@ -439,6 +461,12 @@ def main():
     github_resources = github_resources[: args.limit]
     print(f"   将分析 {len(github_resources)} 个 GitHub 资源")
 
+    # GraphQL 批量预取统计 / Prefetch stats in GraphQL batches
+    repos = [info for info in (extract_github_info(r.get("PrimaryLink", "")) for r in github_resources) if info]
+    prefetched_stats = fetch_repos_metadata(repos, token)
+    if prefetched_stats:
+        print(f"   GraphQL 批量获取 {len(prefetched_stats)} 个仓库统计")
+
     # 分析资源
     print("\n🔬 分析资源趋势...")
     analysis_results = []
@@ -446,7 +474,7 @@ def main():
     for i, resource in enumerate(github_resources):
         print(f"   [{i + 1}/{len(github_resources)}] {resource.get('DisplayName', 'Unknown')}...", end=" ")
 
-        result = analyze_resource(resource, trends_history, token, config)
+        result = analyze_resource(resource, trends_history, token, config, prefetched_stats)
 
         if result:
             analysis_results.append(result)
@@ -7,6 +7,7 @@ Auto-extract Author and License from GitHub repositories
 import csv
 import os
 import re
+import sys
 import time
 from pathlib import Path
 from typing import Dict, Optional, Tuple
@@ -21,6 +22,10 @@ except ImportError:
     print("⚠️ PyGithub 未安装。运行: pip install PyGithub")
     print("⚠️ PyGithub not installed. Run: pip install PyGithub")
 
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from scripts.github_graphql import fetch_repos_metadata, repo_key
+
 
 def parse_github_url(url: str) -> Optional[Tuple[str, str]]:
     """
@@ -85,6 +90,25 @@ def fetch_github_metadata(owner: str, repo: str, github_token: Optional[str] = N
         return {"error": str(e)}
 
 
+def metadata_from_graphql(owner: str, stats: Dict) -> Dict:
+    """
+    将 GraphQL 批量结果转换为 fetch_github_metadata() 的格式
+    Convert a GraphQL batch result to the fetch_github_metadata() format
+    """
+    if stats.get("error"):
+        return {"error": f"GitHub API Error: {stats['error']}"}
+
+    return {
+        "author": owner,
+        "author_profile": f"https://github.com/{owner}",
+        "license": stats.get("license") or "",
+        "description": stats.get("description") or "",
+        "stars": stats.get("stars", 0),
+        "language": stats.get("language") or "",
+        "updated_at": (stats.get("updated_at") or "")[:10],
+    }
+
+
 def update_csv_with_github_data(csv_path: Path, github_token: Optional[str] = None, dry_run: bool = False):
     """
     更新 CSV 文件中的 GitHub 元数据
@@ -104,6 +128,16 @@ def update_csv_with_github_data(csv_path: Path, github_token: Optional[str] = No
     print(f"\n🔍 处理 {len(resources)} 条资源...")
     print(f"🔍 Processing {len(resources)} resources...\n")
 
+    # 使用 GraphQL 批量预取需要补全的仓库 / Prefetch repositories that need filling via GraphQL
+    to_fetch = [
+        parse_github_url(r.get("PrimaryLink", ""))
+        for r in resources
+        if not (r.get("Author", "").strip() and r.get("License", "").strip())
+    ]
+    prefetched = fetch_repos_metadata([info for info in to_fetch if info], github_token)
+    if prefetched:
+        print(f"⚡ GraphQL 批量获取 {len(prefetched)} 个仓库 / Prefetched {len(prefetched)} repositories\n")
+
     for idx, resource in enumerate(resources, start=1):
         url = resource.get("PrimaryLink", "")
         current_author = resource.get("Author", "").strip()
@@ -129,7 +163,11 @@ def update_csv_with_github_data(csv_path: Path, github_token: Optional[str] = No
 
         # 获取元数据
         # Fetch metadata
-        metadata = fetch_github_metadata(owner, repo, github_token)
+        stats = prefetched.get(repo_key(owner, repo))
+        if stats is not None:
+            metadata = metadata_from_graphql(owner, stats)
+        else:
+            metadata = fetch_github_metadata(owner, repo, github_token)
 
         if "error" in metadata:
             print(f"  ❌ {metadata['error']}")
@@ -155,7 +193,7 @@ def update_csv_with_github_data(csv_path: Path, github_token: Optional[str] = No
 
         # 速率限制：避免 API 限制
         # Rate limiting: avoid API limits
-        if (idx % 5 == 0) and not github_token:
+        if (idx % 5 == 0) and not github_token and stats is None:
             print("  ⏱️  等待 1 秒（避免速率限制）...")
             time.sleep(1)
 
@@ -195,8 +233,8 @@ def main():
         print("   无 token: 60 请求/小时 | With token: 5000 请求/小时")
         print()
 
-    if not GITHUB_AVAILABLE:
-        print("❌ 需要安装 PyGithub:")
+    if not GITHUB_AVAILABLE and not github_token:
+        print("❌ 需要安装 PyGithub（或设置 GITHUB_TOKEN 使用 GraphQL）:")
         print("   pip install PyGithub")
         return 1
 
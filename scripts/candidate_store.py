@@ -0,0 +1,580 @@
+#!/usr/bin/env python3
+"""
+候选队列存储 / Candidate Queue Storage
+
+待审核（pending）和已拒绝（rejected）队列的读写接口，两种后端：
+1. json（默认）：candidates/*_resources.json 为快照，写操作追加到
+   candidates/queue_journal.jsonl，定期或 export() 时合并回快照；读写持有文件锁
+2. sqlite：candidates/candidates.db，ID / URL / 状态 / 分类建索引，
+   追加、更新、移动都是单行事务；JSON 文件作为导出格式，export() 时写出
+
+写操作本身不导出 JSON；各脚本在进程结束前调用一次 export()，
+也可以单独运行 python scripts/candidate_store.py --export（make export-candidates）。
+
+Read/write interface for the pending and rejected queues, with two backends:
+1. json (default): candidates/*_resources.json are snapshots; writes append to
+   candidates/queue_journal.jsonl, which is folded back into the snapshots periodically
+   and on export(); reads and writes hold a file lock
+2. sqlite: candidates/candidates.db with indexed ID / URL / status / category columns;
+   appends, updates and moves are single-row transactions and the JSON files are
+   an export format written by export()
+
+Write operations never export JSON themselves; each script calls export() once before
+the process exits, or it can be run on its own with
+python scripts/candidate_store.py --export (make export-candidates).
+
+后端由环境变量 CANDIDATE_STORE（json / sqlite）选择。SQLite 后端打开时，若 JSON 文件
+与上次导出的内容不同（手工编辑、git 拉取），以 JSON 为准重新导入该队列。
+The backend is chosen by the CANDIDATE_STORE environment variable (json / sqlite).
+When the SQLite backend opens and a JSON file differs from what it last exported
+(hand edits, git pulls), that queue is re-imported from JSON.
+
+用法 / Usage:
+    from scripts.candidate_store import get_candidate_store
+
+    store = get_candidate_store()
+    store.append("pending", [resource])
+    store.move(resource_id, "pending", "rejected", _reject_reason="...")
+    store.export()  # 进程结束前一次 / once before the process exits
+
+    python scripts/candidate_store.py --export
+"""
+
+import argparse
+import copy
+import hashlib
+import json
+import os
+import sqlite3
+import sys
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+# 项目根目录 / Project root
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from scripts.url_index import canonical_url
+
+try:
+    import fcntl
+
+    HAS_FCNTL = True
+except ImportError:
+    HAS_FCNTL = False
+
+# 队列 → JSON 文件 / Queue → JSON file
+QUEUE_FILES = {
+    "pending": PROJECT_ROOT / "candidates" / "pending_resources.json",
+    "rejected": PROJECT_ROOT / "candidates" / "rejected_resources.json",
+}
+
+# JSON 文件头注释 / JSON file header comments
+QUEUE_COMMENTS = {
+    "pending": "候选资源队列 - 待审核的资源 / Candidate resource queue - resources pending review",
+    "rejected": "已拒绝的资源 - 用于去重检测 / Rejected resources - used for deduplication",
+}
+
+# 追加日志与锁文件（与快照同目录）/ Append-only journal and lock file (next to the snapshots)
+JOURNAL_NAME = "queue_journal.jsonl"
+LOCK_NAME = ".queue.lock"
+
+# 日志事件数达到该值时合并进快照 / Fold the journal into the snapshots after this many events
+JOURNAL_COMPACT_EVENTS = 500
+
+# SQLite 存储文件 / SQLite storage file
+CANDIDATE_DB_FILE = PROJECT_ROOT / "candidates" / "candidates.db"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS candidates (
+    queue TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    id TEXT NOT NULL,
+    url TEXT,
+    status TEXT,
+    category TEXT,
+    data TEXT NOT NULL,
+    PRIMARY KEY (queue, id)
+);
+CREATE INDEX IF NOT EXISTS idx_candidates_position ON candidates (queue, position);
+CREATE INDEX IF NOT EXISTS idx_candidates_url ON candidates (url);
+CREATE INDEX IF NOT EXISTS idx_candidates_status ON candidates (status);
+CREATE INDEX IF NOT EXISTS idx_candidates_category ON candidates (category);
+CREATE TABLE IF NOT EXISTS exports (queue TEXT PRIMARY KEY, sha1 TEXT);
+CREATE TABLE IF NOT EXISTS dirty (queue TEXT PRIMARY KEY);
+"""
+
+
+def read_queue_file(path: Path) -> List[dict]:
+    """读取 JSON 队列文件 / Read a JSON queue file"""
+    if not path.exists():
+        return []
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f).get("resources", [])
+
+
+def _file_signature(path: Path) -> Optional[tuple]:
+    """
+    文件签名（inode, mtime_ns, size）；原子替换会换 inode
+    File signature (inode, mtime_ns, size); an atomic replace changes the inode
+    """
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return stat.st_ino, stat.st_mtime_ns, stat.st_size
+
+
+def _resource_key(resource: dict) -> str:
+    """日志重放用的资源键：ID，其次规范化 URL / Resource key for journal replay: ID, else canonical URL"""
+    return resource.get("ID") or canonical_url(resource.get("PrimaryLink", "")) or json.dumps(resource, sort_keys=True)
+
+
+@contextmanager
+def file_lock(path: Path, shared: bool = False):
+    """
+    跨进程文件锁（fcntl.flock）；没有 fcntl 的平台退化为无锁
+    Cross-process file lock (fcntl.flock); a no-op on platforms without fcntl
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "a") as f:
+        if HAS_FCNTL:
+            fcntl.flock(f.fileno(), fcntl.LOCK_SH if shared else fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            if HAS_FCNTL:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+
+def write_queue_file(path: Path, queue: str, resources: List[dict]) -> bytes:
+    """
+    原子写入 JSON 队列文件 / Atomically write a JSON queue file
+
+    Returns:
+        写入的内容 / Bytes written
+    """
+    data = {"_comment": QUEUE_COMMENTS.get(queue, ""), "_schema_version": "1.0", "resources": resources}
+    content = json.dumps(data, ensure_ascii=False, indent=2).encode("utf-8")
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    tmp_path.write_bytes(content)
+    os.replace(tmp_path, path)
+    return content
+
+
+class JsonCandidateStore:
+    """
+    JSON 快照 + 追加日志存储 / JSON snapshot plus append-only journal storage
+
+    写操作只向 queue_journal.jsonl 追加事件行（O(新增条目)），读取时在快照上重放日志；
+    日志达到 compact_every 条或调用 export() 时合并回快照并清空。所有读写持有跨进程文件锁，
+    多个爬虫或工作流并行写入不会互相覆盖。
+    Writes only append event lines to queue_journal.jsonl (O(new items)) and reads replay
+    the journal over the snapshots; after compact_every events, or on export(), the journal
+    is folded back into the snapshots and emptied. Every read and write holds a
+    cross-process file lock, so parallel crawlers or workflows never overwrite each other.
+    """
+
+    backend = "json"
+
+    def __init__(
+        self,
+        queue_files: Optional[Dict[str, Path]] = None,
+        journal_file: Optional[Path] = None,
+        compact_every: int = JOURNAL_COMPACT_EVENTS,
+    ):
+        """
+        Args:
+            queue_files: 队列 → 快照文件 / Queue → snapshot file
+            journal_file: 日志文件，默认与快照同目录 / Journal file, next to the snapshots by default
+            compact_every: 日志合并阈值（事件数）/ Journal compaction threshold in events
+        """
+        self.queue_files = queue_files if queue_files is not None else QUEUE_FILES
+        self.journal_file = journal_file or self.queue_files["pending"].with_name(JOURNAL_NAME)
+        self.lock_file = self.journal_file.with_name(LOCK_NAME)
+        self.compact_every = compact_every
+        self._lock = threading.RLock()
+
+        # 物化后的队列：队列 → {键: 资源}（保持顺序）/ Materialized queues: queue → {key: resource} (ordered)
+        self._state: Dict[str, Dict[str, dict]] = {}
+        self._snapshots: Optional[tuple] = None
+        self._offset = 0
+        self._journal_size = 0
+        self._events = 0
+        # 日志中有改动、合并时需要重写快照的队列 / Queues the journal touched, rewritten on compaction
+        self._touched = set()
+        # 队列 → (状态版本, URL 集合) / Queue → (state version, URL set)
+        self._url_cache: Dict[str, tuple] = {}
+
+    @contextmanager
+    def _locked(self, shared: bool = False):
+        with self._lock, file_lock(self.lock_file, shared):
+            self._refresh()
+            yield
+
+    def _refresh(self):
+        """
+        追上磁盘状态：快照变化时重新加载，否则只重放日志中新增的行
+        Catch up with disk: reload when a snapshot changed, otherwise replay only new journal lines
+        """
+        snapshots = tuple(_file_signature(path) for path in self.queue_files.values())
+        journal = _file_signature(self.journal_file)
+        self._journal_size = journal[2] if journal else 0
+
+        if snapshots != self._snapshots or self._journal_size < self._offset:
+            self._state = {
+                queue: {_resource_key(r): r for r in read_queue_file(path)} for queue, path in self.queue_files.items()
+            }
+            self._snapshots = snapshots
+            self._offset = 0
+            self._events = 0
+            self._touched = set()
+
+        if self._journal_size <= self._offset:
+            return
+
+        with open(self.journal_file, "rb") as f:
+            f.seek(self._offset)
+            chunk = f.read(self._journal_size - self._offset)
+        # 末尾不完整的行（写入中断）留到下次 / An incomplete last line (interrupted write) is left for later
+        end = chunk.rfind(b"\n") + 1
+        for line in chunk[:end].splitlines():
+            try:
+                event = json.loads(line)
+            except ValueError:
+                continue
+            self._apply(event)
+            self._events += 1
+        self._offset += end
+
+    def _apply(self, event: dict):
+        """
+        应用一条日志事件；按键覆盖，重复应用结果相同
+        Apply one journal event; keyed, so applying it twice gives the same result
+        """
+        resources = self._state.setdefault(event["queue"], {})
+        self._touched.add(event["queue"])
+        op = event["op"]
+        if op == "append":
+            resource = event["resource"]
+            resources[_resource_key(resource)] = resource
+        elif op == "update":
+            key = _resource_key(event["resource"])
+            if key in resources:
+                resources[key] = event["resource"]
+        elif op == "remove":
+            for resource_id in event["ids"]:
+                resources.pop(resource_id, None)
+
+    def _write(self, events: List[dict]):
+        """追加日志事件（调用方持有锁）/ Append journal events (caller holds the lock)"""
+        content = b"".join(json.dumps(e, ensure_ascii=False).encode("utf-8") + b"\n" for e in events)
+        if self._journal_size > self._offset:
+            # 跳过上次中断留下的半行 / Step past a half line left by an interrupted write
+            content = b"\n" + content
+
+        self.journal_file.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.journal_file, "ab") as f:
+            f.write(content)
+        self._refresh()
+
+        if self._events >= self.compact_every:
+            self._compact()
+
+    def _compact(self):
+        """
+        将日志合并进快照并清空日志（调用方持有锁）/ Fold the journal into the snapshots and empty it (caller holds the lock)
+
+        只重写日志改动过的队列 / Only the queues the journal touched are rewritten
+        """
+        if not self._journal_size:
+            return
+        for queue in sorted(self._touched):
+            write_queue_file(self.queue_files[queue], queue, list(self._state.get(queue, {}).values()))
+        os.truncate(self.journal_file, 0)
+
+        self._snapshots = tuple(_file_signature(path) for path in self.queue_files.values())
+        self._offset = self._journal_size = self._events = 0
+        self._touched = set()
+
+    def _queue(self, queue: str) -> Dict[str, dict]:
+        if queue not in self.queue_files:
+            raise KeyError(queue)
+        return self._state.setdefault(queue, {})
+
+    def load(self, queue: str) -> List[dict]:
+        """读取队列 / Load a queue"""
+        with self._locked(shared=True):
+            return copy.deepcopy(list(self._queue(queue).values()))
+
+    def get(self, queue: str, resource_id: str) -> Optional[dict]:
+        """按 ID 查找 / Find by ID"""
+        with self._locked(shared=True):
+            return copy.deepcopy(self._queue(queue).get(resource_id))
+
+    def contains_url(self, queue: str, url: str) -> bool:
+        """队列中是否已有该 URL / Whether the queue already holds the URL"""
+        with self._locked(shared=True):
+            version = (self._snapshots, self._offset)
+            cached = self._url_cache.get(queue)
+            if cached is None or cached[0] != version:
+                urls = {canonical_url(r.get("PrimaryLink", "")) for r in self._queue(queue).values()}
+                cached = self._url_cache[queue] = (version, urls)
+        return canonical_url(url) in cached[1]
+
+    def append(self, queue: str, resources: Iterable[dict]):
+        """追加资源 / Append resources"""
+        events = [{"op": "append", "queue": queue, "resource": r} for r in resources]
+        if not events:
+            return
+        with self._locked():
+            self._queue(queue)
+            self._write(events)
+
+    def update(self, queue: str, resource: dict) -> bool:
+        """按 ID 替换资源 / Replace a resource by ID"""
+        with self._locked():
+            if _resource_key(resource) not in self._queue(queue):
+                return False
+            self._write([{"op": "update", "queue": queue, "resource": resource}])
+            return True
+
+    def remove(self, queue: str, resource_ids: Iterable[str]) -> List[dict]:
+        """移除资源，返回被移除的资源 / Remove resources, returning the removed ones"""
+        with self._locked():
+            resources = self._queue(queue)
+            ids = [i for i in dict.fromkeys(resource_ids) if i in resources]
+            removed = [copy.deepcopy(resources[i]) for i in ids]
+            if ids:
+                self._write([{"op": "remove", "queue": queue, "ids": ids}])
+            return removed
+
+    def move(self, resource_id: str, source: str, target: str, **fields) -> Optional[dict]:
+        """
+        将资源从一个队列移到另一个队列并更新字段（一次日志写入）
+        Move a resource between queues, updating fields on the way (one journal write)
+        """
+        with self._locked():
+            current = self._queue(source).get(resource_id)
+            if current is None:
+                return None
+            self._queue(target)
+            resource = dict(copy.deepcopy(current), **fields)
+            self._write(
+                [
+                    {"op": "remove", "queue": source, "ids": [resource_id]},
+                    {"op": "append", "queue": target, "resource": resource},
+                ]
+            )
+            return resource
+
+    def export(self):
+        """将日志合并进 JSON 快照 / Fold the journal into the JSON snapshots"""
+        with self._locked():
+            self._compact()
+
+
+class SqliteCandidateStore:
+    """
+    SQLite 存储 / SQLite storage
+
+    队列的每个操作是一条单行事务，并在同一事务中把队列记为待导出；export() 把这些队列写回 JSON，
+    因此由另一个进程（--export）导出也不会遗漏。
+    Each queue operation is a single-row transaction that also marks the queue for export in the
+    same transaction; export() writes those queues back to JSON, so exporting from another
+    process (--export) misses nothing.
+    """
+
+    backend = "sqlite"
+
+    def __init__(self, db_file: Path = CANDIDATE_DB_FILE, queue_files: Optional[Dict[str, Path]] = None):
+        self.db_file = db_file
+        self.queue_files = queue_files if queue_files is not None else QUEUE_FILES
+        self._lock = threading.RLock()
+
+        db_file.parent.mkdir(parents=True, exist_ok=True)
+        self._db = sqlite3.connect(str(db_file), timeout=30, check_same_thread=False)
+        with self._lock, self._db:
+            self._db.executescript(SCHEMA)
+            for queue, path in self.queue_files.items():
+                self._sync_from_json(queue, path)
+
+    def _sync_from_json(self, queue: str, path: Path):
+        """JSON 与上次导出不同时重新导入 / Re-import a queue whose JSON differs from the last export"""
+        content = path.read_bytes() if path.exists() else b""
+        sha1 = hashlib.sha1(content).hexdigest()
+        row = self._db.execute("SELECT sha1 FROM exports WHERE queue = ?", (queue,)).fetchone()
+        if row and row[0] == sha1:
+            return
+
+        self._db.execute("DELETE FROM candidates WHERE queue = ?", (queue,))
+        resources = json.loads(content).get("resources", []) if content.strip() else []
+        for position, resource in enumerate(resources):
+            self._insert(queue, position, resource)
+        self._db.execute("INSERT OR REPLACE INTO exports VALUES (?, ?)", (queue, sha1))
+        self._db.execute("DELETE FROM dirty WHERE queue = ?", (queue,))
+
+    def _insert(self, queue: str, position: int, resource: dict):
+        self._db.execute(
+            "INSERT OR REPLACE INTO candidates VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (
+                queue,
+                position,
+                resource.get("ID", ""),
+                canonical_url(resource.get("PrimaryLink", "")),
+                resource.get("_status", queue),
+                resource.get("Category", ""),
+                json.dumps(resource, ensure_ascii=False),
+            ),
+        )
+
+    def _mark_dirty(self, *queues: str):
+        """记录待导出的队列（调用方持有事务）/ Mark queues for export (caller holds the transaction)"""
+        self._db.executemany("INSERT OR IGNORE INTO dirty VALUES (?)", [(queue,) for queue in queues])
+
+    def _next_position(self, queue: str) -> int:
+        row = self._db.execute("SELECT MAX(position) FROM candidates WHERE queue = ?", (queue,)).fetchone()
+        return 0 if row[0] is None else row[0] + 1
+
+    def load(self, queue: str) -> List[dict]:
+        """读取队列 / Load a queue"""
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT data FROM candidates WHERE queue = ? ORDER BY position", (queue,)
+            ).fetchall()
+        return [json.loads(data) for (data,) in rows]
+
+    def get(self, queue: str, resource_id: str) -> Optional[dict]:
+        """按 ID 查找 / Find by ID"""
+        with self._lock:
+            row = self._db.execute(
+                "SELECT data FROM candidates WHERE queue = ? AND id = ?", (queue, resource_id)
+            ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def contains_url(self, queue: str, url: str) -> bool:
+        """队列中是否已有该 URL / Whether the queue already holds the URL"""
+        with self._lock:
+            row = self._db.execute(
+                "SELECT 1 FROM candidates WHERE url = ? AND queue = ?", (canonical_url(url), queue)
+            ).fetchone()
+        return row is not None
+
+    def append(self, queue: str, resources: Iterable[dict]):
+        """追加资源 / Append resources"""
+        with self._lock, self._db:
+            position = self._next_position(queue)
+            for offset, resource in enumerate(resources):
+                self._insert(queue, position + offset, resource)
+            self._mark_dirty(queue)
+
+    def update(self, queue: str, resource: dict) -> bool:
+        """按 ID 替换资源 / Replace a resource by ID"""
+        with self._lock, self._db:
+            cursor = self._db.execute(
+                "UPDATE candidates SET url = ?, status = ?, category = ?, data = ? WHERE queue = ? AND id = ?",
+                (
+                    canonical_url(resource.get("PrimaryLink", "")),
+                    resource.get("_status", queue),
+                    resource.get("Category", ""),
+                    json.dumps(resource, ensure_ascii=False),
+                    queue,
+                    resource.get("ID", ""),
+                ),
+            )
+            if cursor.rowcount:
+                self._mark_dirty(queue)
+            return cursor.rowcount > 0
+
+    def remove(self, queue: str, resource_ids: Iterable[str]) -> List[dict]:
+        """移除资源，返回被移除的资源 / Remove resources, returning the removed ones"""
+        removed = []
+        with self._lock, self._db:
+            for resource_id in resource_ids:
+                row = self._db.execute(
+                    "SELECT data FROM candidates WHERE queue = ? AND id = ?", (queue, resource_id)
+                ).fetchone()
+                if row:
+                    self._db.execute("DELETE FROM candidates WHERE queue = ? AND id = ?", (queue, resource_id))
+                    removed.append(json.loads(row[0]))
+            if removed:
+                self._mark_dirty(queue)
+        return removed
+
+    def move(self, resource_id: str, source: str, target: str, **fields) -> Optional[dict]:
+        """
+        将资源从一个队列移到另一个队列并更新字段（同一事务）
+        Move a resource between queues, updating fields on the way (one transaction)
+        """
+        with self._lock, self._db:
+            row = self._db.execute(
+                "SELECT data FROM candidates WHERE queue = ? AND id = ?", (source, resource_id)
+            ).fetchone()
+            if not row:
+                return None
+            resource = dict(json.loads(row[0]), **fields)
+            self._db.execute("DELETE FROM candidates WHERE queue = ? AND id = ?", (source, resource_id))
+            self._insert(target, self._next_position(target), resource)
+            self._mark_dirty(source, target)
+        return resource
+
+    def export(self):
+        """将有改动的队列导出为 JSON / Export changed queues to JSON"""
+        with self._lock:
+            dirty = [queue for (queue,) in self._db.execute("SELECT queue FROM dirty ORDER BY queue").fetchall()]
+            for queue in dirty:
+                content = write_queue_file(self.queue_files[queue], queue, self.load(queue))
+                with self._db:
+                    self._db.execute(
+                        "INSERT OR REPLACE INTO exports VALUES (?, ?)", (queue, hashlib.sha1(content).hexdigest())
+                    )
+                    self._db.execute("DELETE FROM dirty WHERE queue = ?", (queue,))
+
+
+CANDIDATE_STORES = {"json": JsonCandidateStore, "sqlite": SqliteCandidateStore}
+
+# 进程内共享的存储实例 / Process-wide shared store instances
+_stores: Dict[str, object] = {}
+_stores_lock = threading.Lock()
+
+
+def get_candidate_store(backend: Optional[str] = None):
+    """
+    获取进程内共享的候选队列存储 / Get the process-wide shared candidate store
+
+    Args:
+        backend: json 或 sqlite，默认取环境变量 CANDIDATE_STORE / json or sqlite, defaults to $CANDIDATE_STORE
+    """
+    backend = (backend or os.environ.get("CANDIDATE_STORE") or "json").lower()
+    if backend not in CANDIDATE_STORES:
+        raise ValueError(f"未知的候选队列存储后端 / Unknown candidate store backend: {backend}")
+
+    with _stores_lock:
+        if backend not in _stores:
+            _stores[backend] = CANDIDATE_STORES[backend]()
+        return _stores[backend]
+
+
+def main():
+    """主函数 / Main function"""
+    parser = argparse.ArgumentParser(description="Candidate queue storage")
+    parser.add_argument("--export", action="store_true", help="Write pending changes to the JSON queue files")
+    parser.add_argument("--backend", choices=sorted(CANDIDATE_STORES), help="Store backend (default: $CANDIDATE_STORE)")
+    args = parser.parse_args()
+
+    if not args.export:
+        parser.print_help()
+        return 0
+
+    store = get_candidate_store(args.backend)
+    store.export()
+    print(f"✅ 已导出候选队列 ({store.backend}) / Exported candidate queues")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -6,15 +6,20 @@ Provides crawler implementations for multi-source resource discovery.
 """
 
 from .base_crawler import BaseCrawler
+from .async_base_crawler import HAS_AIOHTTP, AsyncBaseCrawler
 from .reddit_crawler import RedditCrawler
 from .awesome_list_crawler import AwesomeListCrawler
-from .rss_crawler import RSSCrawler
-from .hackernews_crawler import HackerNewsCrawler
+from .rss_crawler import AsyncRSSCrawler, RSSCrawler
+from .hackernews_crawler import AsyncHackerNewsCrawler, HackerNewsCrawler
 
 __all__ = [
     "BaseCrawler",
+    "AsyncBaseCrawler",
+    "HAS_AIOHTTP",
     "RedditCrawler",
     "AwesomeListCrawler",
     "RSSCrawler",
     "HackerNewsCrawler",
+    "AsyncRSSCrawler",
+    "AsyncHackerNewsCrawler",
 ]
@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+"""
+异步爬虫基类 / Async Base Crawler Class
+
+基于 aiohttp 的 BaseCrawler 变体：crawl() 和 _make_request() 为协程，
+同一时刻可有几十个请求在途，按主机的令牌桶控制速率。
+An aiohttp based BaseCrawler variant: crawl() and _make_request() are coroutines,
+so dozens of requests can be in flight at once while per-host token buckets
+control the rate.
+
+结果的后续处理（去重、排序、保存）与同步爬虫完全一致。
+Post-processing of results (dedup, sorting, saving) is identical to the sync crawlers.
+"""
+
+import asyncio
+import json
+import threading
+import time
+from abc import abstractmethod
+from typing import Awaitable, Callable, Dict, Iterable, List, Optional
+from urllib.parse import urlparse
+
+try:
+    import aiohttp
+
+    HAS_AIOHTTP = True
+except ImportError:
+    HAS_AIOHTTP = False
+
+from .base_crawler import BaseCrawler
+
+# 默认在途请求数上限 / Default cap on in-flight requests
+DEFAULT_MAX_CONCURRENCY = 32
+
+# 令牌桶默认容量（允许的突发请求数）/ Default bucket capacity (allowed burst)
+DEFAULT_BURST = 5
+
+
+class TokenBucket:
+    """
+    令牌桶限速器 / Token bucket rate limiter
+
+    每秒补充 rate 个令牌，最多积攒 capacity 个。reserve() 立即扣除令牌并返回
+    需要等待的秒数，令牌可以透支，因此并发调用者会按顺序排队而不会同时醒来。
+    记账用线程锁保护，可在多个事件循环（多个爬虫线程）之间共享。
+    Refills rate tokens per second up to capacity. reserve() takes a token right away
+    and returns how long to wait; tokens may go negative so concurrent callers queue up
+    instead of waking together. Bookkeeping uses a thread lock so one bucket can be
+    shared by several event loops (crawler threads).
+    """
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = max(rate, 1e-6)
+        self.capacity = max(capacity, 1.0)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """预约一个令牌，返回等待时间（秒）/ Reserve one token, return the wait in seconds"""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+    async def acquire(self):
+        """等待直到获得令牌 / Wait until a token is available"""
+        delay = self.reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+class AsyncResponse:
+    """
+    已读取完毕的响应 / Fully read response
+
+    提供爬虫用到的 requests.Response 子集（status_code / headers / text / json()），
+    解析代码可在同步和异步爬虫间复用。
+    Offers the subset of requests.Response the crawlers use (status_code / headers /
+    text / json()) so parsing code is shared between sync and async crawlers.
+    """
+
+    def __init__(self, url: str, status_code: int, headers: dict, text: str):
+        self.url = url
+        self.status_code = status_code
+        self.headers = headers
+        self.text = text
+
+    def json(self):
+        return json.loads(self.text)
+
+
+class AsyncBaseCrawler(BaseCrawler):
+    """异步爬虫基类 / Async base crawler class"""
+
+    # 跨爬虫共享的主机令牌桶 / Per-host token buckets shared across crawlers
+    _token_buckets: Dict[str, TokenBucket] = {}
+    _token_buckets_lock = threading.Lock()
+
+    def __init__(self, config: dict, rate_limit_config: Optional[dict] = None):
+        super().__init__(config, rate_limit_config)
+
+        parallel_config = config.get("parallel", {})
+        self.max_concurrency = parallel_config.get("max_concurrency", DEFAULT_MAX_CONCURRENCY)
+        self._async_session = None
+
+    @abstractmethod
+    async def crawl(self) -> List[dict]:
+        """
+        执行爬取（协程）/ Execute crawl (coroutine)
+
+        Returns:
+            发现的资源列表 / List of discovered resources
+        """
+        pass
+
+    def _bucket_for(self, host: str) -> TokenBucket:
+        """
+        获取主机的令牌桶 / Get the token bucket for a host
+
+        速率取 max_requests_per_minute，未配置时取 1 / min_interval；容量取 burst。
+        Rate comes from max_requests_per_minute, or 1 / min_interval when absent; capacity from burst.
+        """
+        with self._token_buckets_lock:
+            bucket = self._token_buckets.get(host)
+            if bucket is None:
+                limits = self._rate_limits_for(host)
+                per_minute = limits.get("max_requests_per_minute")
+                rate = per_minute / 60 if per_minute else 1 / max(self._min_interval_for(host), 1e-3)
+                capacity = limits.get("burst", self.rate_limit_config.get("burst", DEFAULT_BURST))
+                bucket = self._token_buckets[host] = TokenBucket(rate, capacity)
+        return bucket
+
+    async def _rate_limit(self, url: str = ""):
+        """按主机的令牌桶限速 / Apply per-host token bucket rate limiting"""
+        await self._bucket_for(urlparse(url).netloc.lower()).acquire()
+
+    async def _make_request(self, url: str, method: str = "GET", **kwargs) -> Optional[AsyncResponse]:
+        """
+        发起异步 HTTP 请求（带速率限制）
+        Make async HTTP request (with rate limiting)
+        """
+        await self._rate_limit(url)
+
+        timeout = aiohttp.ClientTimeout(total=kwargs.pop("timeout", 30))
+
+        try:
+            async with self._async_session.request(method, url, timeout=timeout, **kwargs) as response:
+                response.raise_for_status()
+                text = await response.text(errors="replace")
+                return AsyncResponse(str(response.url), response.status, dict(response.headers), text)
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            print(f"   ⚠️ 请求失败 [{url}]: {e}")
+            return None
+
+    async def _stream_request(
+        self, url: str, consume: Callable[[bytes], bool], chunk_size: int = 16384, **kwargs
+    ) -> bool:
+        """
+        流式异步 GET 请求（带速率限制），consume 返回 True 时提前断开
+        Streamed async GET request (with rate limiting); disconnects early once consume returns True
+
+        Returns:
+            请求是否成功 / Whether the request succeeded
+        """
+        await self._rate_limit(url)
+
+        timeout = aiohttp.ClientTimeout(total=kwargs.pop("timeout", 30))
+
+        try:
+            async with self._async_session.get(url, timeout=timeout, **kwargs) as response:
+                response.raise_for_status()
+                async for chunk in response.content.iter_chunked(chunk_size):
+                    if consume(chunk):
+                        break
+            return True
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            print(f"   ⚠️ 请求失败 [{url}]: {e}")
+            return False
+
+    async def _gather(self, func: Callable[..., Awaitable], items: Iterable) -> List:
+        """
+        并发执行协程并按输入顺序返回结果 / Run coroutines concurrently, results in input order
+        """
+        return list(await asyncio.gather(*(func(item) for item in items)))
+
+    async def _crawl_with_session(self) -> List[dict]:
+        """在共享的 aiohttp 会话中执行 crawl() / Run crawl() inside a shared aiohttp session"""
+        connector = aiohttp.TCPConnector(limit=self.max_concurrency)
+        headers = {"User-Agent": self.session.headers["User-Agent"]}
+
+        async with aiohttp.ClientSession(headers=headers, connector=connector) as session:
+            self._async_session = session
+            try:
+                return await self.crawl()
+            finally:
+                self._async_session = None
+
+    def _crawl_resources(self) -> List[dict]:
+        """在新的事件循环中运行异步爬取 / Run the async crawl in a fresh event loop"""
+        return asyncio.run(self._crawl_with_session())
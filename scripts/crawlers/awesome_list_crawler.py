@@ -6,17 +6,28 @@ Awesome List 爬虫 / Awesome List Crawler
 Discovers Claude Code related resources from GitHub Awesome lists.
 """
 
+import base64
+import hashlib
+import json
 import os
 import re
+import threading
 from typing import Dict, List, Optional, Tuple
 from urllib.parse import urlparse
 
+import requests
+
+from ..github_client import get_client
 from .base_crawler import BaseCrawler
 
 
 class AwesomeListCrawler(BaseCrawler):
     """Awesome List 爬虫 / Awesome List crawler"""
 
+    # README 缓存：blob SHA、ETag 和解析出的链接列表
+    # README cache: blob SHA, ETag and the parsed link list
+    README_CACHE_FILE = BaseCrawler.PROJECT_ROOT / "candidates" / "awesome_readme_cache.json"
+
     @property
     def name(self) -> str:
         return "Awesome Lists"
@@ -34,10 +45,16 @@ class AwesomeListCrawler(BaseCrawler):
         self.deep_parse = self.awesome_config.get("deep_parse", True)
         self.max_links_per_list = self.awesome_config.get("max_links_per_list", 100)
 
-        # GitHub token
+        # 通过 contents API 获取 README（一次请求，未变化时 304）
+        # Resolve READMEs through the contents API (one request, 304 when unchanged)
+        self.use_contents_api = self.awesome_config.get("use_contents_api", True)
+        self._readme_cache = self._load_readme_cache()
+        self._readme_cache_lock = threading.Lock()
+
+        # GitHub API 请求走共享客户端（token 轮换 + 配额预算）
+        # GitHub API requests go through the shared client (token rotation + quota budgeting)
         self.github_token = os.environ.get("GITHUB_TOKEN")
-        if self.github_token:
-            self.session.headers["Authorization"] = f"Bearer {self.github_token}"
+        self.github_client = get_client(self.github_token)
 
     def _extract_github_repo(self, url: str) -> Optional[Tuple[str, str]]:
         """
@@ -90,6 +107,122 @@ class AwesomeListCrawler(BaseCrawler):
 
         return None
 
+    def _load_readme_cache(self) -> Dict[str, dict]:
+        """加载 README 缓存 / Load README cache"""
+        if not self.README_CACHE_FILE.exists():
+            return {}
+        try:
+            with open(self.README_CACHE_FILE, "r", encoding="utf-8") as f:
+                return json.load(f).get("lists", {})
+        except (OSError, json.JSONDecodeError):
+            return {}
+
+    def save_checkpoint(self):
+        """保存检查点和 README 缓存 / Save checkpoints and the README cache"""
+        super().save_checkpoint()
+
+        with self._readme_cache_lock:
+            data = {
+                "_comment": "Awesome List README 缓存 / Awesome list README cache",
+                "_schema_version": "1.0",
+                "lists": self._readme_cache,
+            }
+            with open(self.README_CACHE_FILE, "w", encoding="utf-8") as f:
+                json.dump(data, f, ensure_ascii=False, indent=2)
+
+    def _fetch_readme_via_api(self, owner: str, repo: str, list_url: str) -> Optional[Tuple[str, Optional[str]]]:
+        """
+        通过 contents API 获取 README / Fetch README through the contents API
+
+        带上缓存的 ETag，README 未变化时返回 304，不消耗配额也不下载内容。
+        Sends the cached ETag; an unchanged README yields a 304 that costs no quota and no download.
+
+        Returns:
+            (blob SHA, 内容)，304 时内容为 None；请求失败返回 None
+            (blob SHA, content), content is None on 304; None when the request fails
+        """
+        url = f"https://api.github.com/repos/{owner}/{repo}/readme"
+        headers = {"Accept": "application/vnd.github+json"}
+
+        cached = self._readme_cache.get(list_url, {})
+        # 只有链接列表已缓存时才能接受 304 / A 304 is only usable when the link list is cached
+        if cached.get("etag") and cached.get("sha") and "links" in cached:
+            headers["If-None-Match"] = cached["etag"]
+
+        try:
+            response = self.github_client.get(url, headers=headers)
+        except requests.exceptions.RequestException as e:
+            print(f"   ⚠️ 请求失败 [{url}]: {e}")
+            return None
+
+        if response.status_code == 304:
+            return cached["sha"], None
+
+        if response.status_code != 200:
+            return None
+
+        try:
+            data = response.json()
+            content = base64.b64decode(data["content"]).decode("utf-8", errors="replace")
+        except (ValueError, KeyError) as e:
+            print(f"   ⚠️ 解析 README 失败 [{url}]: {e}")
+            return None
+
+        sha = data.get("sha") or self._readme_sha(content)
+        with self._readme_cache_lock:
+            entry = self._readme_cache.setdefault(list_url, {})
+            if entry.get("sha") != sha:
+                entry.pop("links", None)
+            entry.update({"sha": sha, "etag": response.headers.get("ETag", ""), "path": data.get("path", "")})
+        return sha, content
+
+    def _resolve_readme(self, owner: str, repo: str, list_url: str) -> Optional[Tuple[str, Optional[str]]]:
+        """
+        获取 README 的 blob SHA 和内容 / Resolve the README's blob SHA and content
+
+        优先使用 contents API，失败时回退到逐个尝试 raw.githubusercontent.com 文件名。
+        Prefers the contents API and falls back to probing raw.githubusercontent.com file names.
+
+        Returns:
+            (blob SHA, 内容或 None) / (blob SHA, content or None)，无法获取时返回 None / None when unavailable
+        """
+        if self.use_contents_api:
+            result = self._fetch_readme_via_api(owner, repo, list_url)
+            if result:
+                return result
+
+        content = self._get_readme_content(owner, repo)
+        if content is None:
+            return None
+        return self._readme_sha(content), content
+
+    def _cached_links(self, list_url: str, sha: str, content: Optional[str]) -> List[Tuple[str, str, str]]:
+        """
+        返回 README 的链接列表，SHA 与缓存一致时不重新解析
+        Return the README's links, skipping the parse when the SHA matches the cache
+        """
+        cached = self._readme_cache.get(list_url, {})
+        if cached.get("sha") == sha and "links" in cached:
+            return [tuple(link) for link in cached["links"]]
+
+        links = self._parse_markdown_links(content or "")
+        with self._readme_cache_lock:
+            entry = self._readme_cache.setdefault(list_url, {})
+            entry["sha"] = sha
+            entry["links"] = [list(link) for link in links]
+        return links
+
+    @staticmethod
+    def _readme_sha(content: str) -> str:
+        """
+        计算 README 的 git blob SHA / Compute the README's git blob SHA
+
+        与 GitHub contents API 返回的 sha 一致。
+        Matches the sha returned by the GitHub contents API.
+        """
+        data = content.encode("utf-8")
+        return hashlib.sha1(b"blob %d\0" % len(data) + data).hexdigest()
+
     def _parse_markdown_links(self, content: str) -> List[Tuple[str, str, str]]:
         """
         解析 Markdown 中的链接 / Parse links from Markdown
@@ -170,12 +303,14 @@ class AwesomeListCrawler(BaseCrawler):
         url = f"https://api.github.com/repos/{owner}/{repo}"
 
         headers = {"Accept": "application/vnd.github+json"}
-        if self.github_token:
-            headers["Authorization"] = f"Bearer {self.github_token}"
 
-        response = self._make_request(url, headers=headers)
+        try:
+            response = self.github_client.get(url, headers=headers)
+        except requests.exceptions.RequestException as e:
+            print(f"   ⚠️ 请求失败 [{url}]: {e}")
+            return None
 
-        if response:
+        if response.status_code == 200:
             return response.json()
 
         return None
@@ -225,6 +360,38 @@ class AwesomeListCrawler(BaseCrawler):
             },
         )
 
+    def _rewind_cursors(self, resources: List[dict]):
+        """
+        未保存的链接从 processed_urls 中移除，本次完成的列表退回旧的 README SHA
+        Unsaved links are removed from processed_urls, and lists completed this run fall back to their old README SHA
+
+        退回 SHA 时，除未保存链接外的当前链接都记为已处理，下次运行只重新获取未保存的链接。
+        When the SHA falls back, every current link except the unsaved ones is recorded as processed,
+        so the next run only fetches the unsaved links again.
+        """
+        dropped: Dict[str, set] = {}
+        for resource in resources:
+            cursor = resource.get("_cursor") or {}
+            dropped.setdefault(cursor.get("key"), set()).add(cursor.get("url"))
+
+        with self._cursor_lock:
+            for key, urls in dropped.items():
+                cursor = self._new_cursors.get(key)
+                if cursor is None:
+                    continue
+
+                previous_sha = self._cursors.get(key, {}).get("readme_sha")
+                if cursor.get("readme_sha") == previous_sha:
+                    cursor["processed_urls"] = sorted(set(cursor.get("processed_urls", [])) - urls)
+                    continue
+
+                links = self._readme_cache.get(key, {}).get("links", [])
+                cursor["processed_urls"] = sorted({link[1] for link in links} - urls)
+                if previous_sha:
+                    cursor["readme_sha"] = previous_sha
+                else:
+                    cursor.pop("readme_sha", None)
+
     def _crawl_awesome_list(self, list_config: dict) -> List[dict]:
         """
         爬取单个 Awesome List / Crawl single Awesome List
@@ -250,32 +417,76 @@ class AwesomeListCrawler(BaseCrawler):
 
         owner, repo = github_repo
 
-        # 获取 README 内容
-        readme_content = self._get_readme_content(owner, repo)
-        if not readme_content:
+        # 获取 README 的 blob SHA（内容仅在变化时下载）
+        # Resolve the README blob SHA (content is only downloaded when it changed)
+        previous = self._readme_cache.get(list_url, {})
+        previous_urls = {link[1] for link in previous.get("links", [])}
+        previous_sha = previous.get("sha")
+
+        readme = self._resolve_readme(owner, repo, list_url)
+        if not readme:
             print("         ⚠️ 无法获取 README")
             return resources
 
-        # 解析链接
-        links = self._parse_markdown_links(readme_content)
+        # 游标的 readme_sha 只在全部链接处理完后才推进 / The cursor's readme_sha only advances once every link is processed
+        readme_sha, readme_content = readme
+        cursor = self._get_cursor(list_url)
+        if cursor.get("readme_sha") == readme_sha:
+            print(f"         ⏭️ README 未变化 ({readme_sha[:7]})，跳过")
+            return resources
+
+        if readme_content is None and previous_sha != readme_sha:
+            print("         ⚠️ README 缓存缺失")
+            return resources
+
+        # 解析链接（SHA 与缓存一致时直接复用）/ Parse links (reused when the SHA matches the cache)
+        links = self._cached_links(list_url, readme_sha, readme_content)
         print(f"         找到 {len(links)} 个链接")
 
+        # 增量模式下跳过已处理的链接：上一个 README 已完整处理时只处理新增链接，
+        # 上次因数量上限中断时跳过 processed_urls 中的链接
+        # In incremental mode processed links are skipped: only newly added links when the previous
+        # README was fully processed, and the links in processed_urls when the last pass hit the cap
+        current_urls = {link[1] for link in links}
+        done_urls = set(cursor.get("processed_urls", []))
+        if self.incremental:
+            if previous_sha and previous_sha == cursor.get("readme_sha"):
+                done_urls |= previous_urls
+            if done_urls:
+                links = [link for link in links if link[1] not in done_urls]
+                print(f"         其中 {len(links)} 个未处理")
+
         # 过滤和处理链接
         processed_count = 0
+        examined = 0
         for title, url, description in links:
             if processed_count >= self.max_links_per_list:
                 break
+            examined += 1
 
             if not self._filter_link(title, url, description, keywords):
                 continue
 
             resource = self._create_resource_from_link(title, url, description, list_name)
             if resource:
+                resource["_cursor"] = {"key": list_url, "url": url}
                 resources.append(resource)
                 processed_count += 1
 
         print(f"         发现 {len(resources)} 个相关资源")
 
+        if examined < len(links):
+            # 达到数量上限：README SHA 不推进，processed_urls 记录当前 README 中已处理的全部链接
+            # （包括上一个完整处理的 README 中的链接），下次运行不依赖已被覆盖的 README 缓存
+            # Cap reached: the README SHA stays, and processed_urls records every link of the current
+            # README already handled (including those from the last fully processed README), so the
+            # next run does not depend on the README cache, which now holds the new links
+            done_urls.update(link[1] for link in links[:examined])
+            print(f"         ⏸️ 达到上限，剩余 {len(links) - examined} 个链接下次处理")
+            self._advance_cursor(list_url, processed_urls=sorted(done_urls & current_urls))
+        else:
+            self._advance_cursor(list_url, readme_sha=readme_sha, processed_urls=[])
+
         return resources
 
     def crawl(self) -> List[dict]:
@@ -290,9 +501,7 @@ class AwesomeListCrawler(BaseCrawler):
 
         print(f"   📋 爬取 {len(self.lists)} 个 Awesome Lists...")
 
-        for list_config in self.lists:
-            list_resources = self._crawl_awesome_list(list_config)
-
+        for list_resources in self._parallel_map(self._crawl_awesome_list, self.lists):
             for res in list_resources:
                 url = res.get("PrimaryLink", "")
                 if url not in seen_urls:
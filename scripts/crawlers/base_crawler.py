@@ -6,20 +6,62 @@
 Abstract base class for all crawlers, defines common interface and utility methods.
 """
 
-import csv
 import hashlib
 import json
+import os
 import re
+import threading
 import time
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Set, Tuple
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
 from urllib.parse import urlparse
 
 import requests
 import yaml
 
+from ..candidate_store import get_candidate_store
+from ..url_index import UrlIndex, canonical_url
+
+
+# 主机名关键字到 rate_limits 配置键的映射；未匹配的主机使用爬虫 source_type 对应的配置
+# Host keyword to rate_limits config key; other hosts use the entry for the crawler's source_type
+HOST_RATE_LIMIT_KEYS = {
+    "reddit.com": "reddit",
+    "github.com": "github",
+    "githubusercontent.com": "github",
+    "algolia.com": "hackernews",
+    "ycombinator.com": "hackernews",
+    "hnrss.org": "hackernews",
+}
+
+
+class HostRateLimiter:
+    """
+    按主机的速率限制器 / Per-host rate limiter
+
+    所有爬虫实例共享，并发请求在同一主机上按最小间隔依次预约时间槽，
+    不同主机之间互不阻塞。
+    Shared by all crawler instances. Concurrent requests to the same host reserve
+    consecutive slots spaced by the minimum interval; different hosts never block each other.
+    """
+
+    def __init__(self):
+        self._next_slot: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def wait(self, host: str, min_interval: float):
+        """等待该主机的下一个可用时间槽 / Wait for the host's next free slot"""
+        with self._lock:
+            now = time.time()
+            slot = max(now, self._next_slot.get(host, 0.0))
+            self._next_slot[host] = slot + min_interval
+
+        if slot > now:
+            time.sleep(slot - now)
+
 
 class BaseCrawler(ABC):
     """爬虫基类 / Base crawler class"""
@@ -27,6 +69,16 @@ class BaseCrawler(ABC):
     # 项目根目录
     PROJECT_ROOT = Path(__file__).parent.parent.parent
 
+    # 跨爬虫共享的主机限速器 / Host rate limiter shared across crawlers
+    _host_limiter = HostRateLimiter()
+
+    # 保护 pending 队列读-改-写的锁 / Guards read-modify-write of the pending queue
+    _pending_lock = threading.Lock()
+
+    # 增量爬取检查点文件及其锁 / Incremental crawl checkpoint file and its lock
+    CHECKPOINT_FILE = PROJECT_ROOT / "candidates" / "crawl_checkpoints.json"
+    _checkpoint_file_lock = threading.Lock()
+
     def __init__(self, config: dict, rate_limit_config: Optional[dict] = None):
         """
         初始化爬虫 / Initialize crawler
@@ -45,11 +97,19 @@ class BaseCrawler(ABC):
         # 加载分类配置
         self._categories_prefix = self._load_categories()
 
-        # 加载已存在的 URL
-        self._existing_urls = self._load_existing_urls()
+        # 已存在资源的 URL 索引（CSV + pending + rejected）/ URL index of existing resources
+        self._url_index = UrlIndex()
 
-        # 速率限制状态
-        self._last_request_time = 0
+        # 每个爬虫内部的并发度（1 表示串行）/ Concurrency within a crawler (1 means serial)
+        parallel_config = config.get("parallel", {})
+        self.max_workers = parallel_config.get("workers_per_crawler", 4) if parallel_config.get("enabled") else 1
+
+        # 增量爬取：读取上次运行的游标，本次运行推进后的游标在 run() 结束时写回
+        # Incremental crawl: cursors from the last run are read here, advanced ones are written back by run()
+        self.incremental = config.get("incremental", {}).get("enabled", True)
+        self._cursors: Dict[str, dict] = self._load_checkpoint() if self.incremental else {}
+        self._new_cursors: Dict[str, dict] = {}
+        self._cursor_lock = threading.Lock()
 
     @property
     @abstractmethod
@@ -80,69 +140,147 @@ class BaseCrawler(ABC):
             data = yaml.safe_load(f)
         return {cat["id"]: cat["prefix"] for cat in data["categories"]}
 
-    def _load_existing_urls(self) -> Set[str]:
-        """加载所有已存在的资源 URL / Load all existing resource URLs"""
-        urls = set()
-
-        # 从 CSV 加载
-        csv_file = self.PROJECT_ROOT / "THE_RESOURCES_TABLE.csv"
-        if csv_file.exists():
-            with open(csv_file, "r", encoding="utf-8") as f:
-                reader = csv.DictReader(f)
-                for row in reader:
-                    url = self._normalize_url(row.get("PrimaryLink", ""))
-                    if url:
-                        urls.add(url)
-
-        # 从 pending 加载
-        pending_file = self.PROJECT_ROOT / "candidates" / "pending_resources.json"
-        if pending_file.exists():
-            with open(pending_file, "r", encoding="utf-8") as f:
-                data = json.load(f)
-                for res in data.get("resources", []):
-                    url = self._normalize_url(res.get("PrimaryLink", ""))
-                    if url:
-                        urls.add(url)
-
-        # 从 rejected 加载
-        rejected_file = self.PROJECT_ROOT / "candidates" / "rejected_resources.json"
-        if rejected_file.exists():
-            with open(rejected_file, "r", encoding="utf-8") as f:
+    def _load_checkpoint(self) -> Dict[str, dict]:
+        """加载本数据源的游标 / Load this source's cursors"""
+        if not self.CHECKPOINT_FILE.exists():
+            return {}
+        try:
+            with open(self.CHECKPOINT_FILE, "r", encoding="utf-8") as f:
                 data = json.load(f)
-                for res in data.get("resources", []):
-                    url = self._normalize_url(res.get("PrimaryLink", ""))
-                    if url:
-                        urls.add(url)
+        except (OSError, json.JSONDecodeError):
+            return {}
+        return data.get("sources", {}).get(self.source_type, {})
 
-        return urls
+    def _get_cursor(self, key: str) -> dict:
+        """
+        获取上次运行保存的游标 / Get the cursor saved by the last run
 
-    def _normalize_url(self, url: str) -> str:
-        """规范化 URL / Normalize URL"""
-        if not url:
-            return ""
-        return url.strip().rstrip("/").lower()
+        Args:
+            key: 游标键（关键词 / feed URL / 列表 URL）/ Cursor key (keyword / feed URL / list URL)
+        """
+        return self._cursors.get(key, {})
+
+    def _advance_cursor(self, key: str, **values):
+        """
+        记录新的游标值，资源保存成功后由 run() 持久化 / Record new cursor values, persisted by run() once resources are saved
+        """
+        with self._cursor_lock:
+            cursor = self._new_cursors.setdefault(key, dict(self._cursors.get(key, {})))
+            cursor.update({k: v for k, v in values.items() if v is not None})
+
+    def _rewind_cursors(self, resources: List[dict]):
+        """
+        让游标不越过未保存的资源，下次增量运行重新获取它们
+        Keep cursors from moving past resources that were not saved, so the next incremental run fetches them again
+
+        每个资源的 _cursor 元数据记录它来自哪个游标键以及对应的游标位置；
+        默认无操作，使用游标的爬虫覆盖此方法。
+        Each resource's _cursor metadata records the cursor key it came from and its position;
+        a no-op by default, overridden by crawlers that use cursors.
+
+        Args:
+            resources: 因数量限制未保存的资源 / Resources not saved because of the limit
+        """
+
+    def save_checkpoint(self):
+        """
+        将推进后的游标合并写入检查点文件 / Merge the advanced cursors into the checkpoint file
+        """
+        if not self._new_cursors:
+            return
+
+        with self._checkpoint_file_lock:
+            data = None
+            if self.CHECKPOINT_FILE.exists():
+                # 损坏的检查点（如中断的写入）重新开始 / A corrupt checkpoint (e.g. an interrupted write) starts over
+                try:
+                    with open(self.CHECKPOINT_FILE, "r", encoding="utf-8") as f:
+                        data = json.load(f)
+                except (OSError, json.JSONDecodeError):
+                    pass
+            if not isinstance(data, dict):
+                data = {"_comment": "增量爬取检查点 / Incremental crawl checkpoints", "_schema_version": "1.0"}
+
+            source = data.setdefault("sources", {}).setdefault(self.source_type, {})
+            source.update(self._new_cursors)
+            data["last_run"] = datetime.now().isoformat()
+
+            # 先写临时文件再替换，中断不会留下半个文件 / Write a temp file and replace, so an interruption leaves no half file
+            tmp_file = self.CHECKPOINT_FILE.with_name(f".{self.CHECKPOINT_FILE.name}.{os.getpid()}.tmp")
+            with open(tmp_file, "w", encoding="utf-8") as f:
+                json.dump(data, f, ensure_ascii=False, indent=2)
+            os.replace(tmp_file, self.CHECKPOINT_FILE)
 
     def _is_duplicate(self, url: str) -> bool:
         """检查 URL 是否已存在 / Check if URL already exists"""
-        normalized = self._normalize_url(url)
-        return normalized in self._existing_urls
+        return url in self._url_index
+
+    def _rate_limits_for(self, host: str) -> dict:
+        """
+        获取主机的 rate_limits 配置 / Get the rate_limits entry for a host
+
+        已知主机按 HOST_RATE_LIMIT_KEYS 匹配，其他主机（如各个 RSS feed）使用本爬虫 source_type 的配置。
+        Known hosts match HOST_RATE_LIMIT_KEYS; other hosts (such as individual RSS feeds) use
+        the entry for this crawler's source_type.
+        """
+        for keyword, key in HOST_RATE_LIMIT_KEYS.items():
+            if keyword in host:
+                return self.rate_limit_config.get(key, {})
+        return self.rate_limit_config.get(self.source_type, {})
+
+    def _min_interval_for(self, host: str) -> float:
+        """获取主机的最小请求间隔 / Get the minimum request interval for a host"""
+        default = self.rate_limit_config.get(
+            "min_request_interval", self.rate_limit_config.get("global_min_interval", 1.0)
+        )
+        return self._rate_limits_for(host).get("min_interval", default)
 
-    def _rate_limit(self):
-        """执行速率限制 / Apply rate limiting"""
-        min_interval = self.rate_limit_config.get("min_request_interval", 1.0)
-        elapsed = time.time() - self._last_request_time
+    def _rate_limit(self, url: str = ""):
+        """执行按主机的速率限制 / Apply per-host rate limiting"""
+        host = urlparse(url).netloc.lower()
+        self._host_limiter.wait(host, self._min_interval_for(host))
+
+    def _parallel_map(self, func: Callable, items: Iterable) -> List:
+        """
+        并发执行并按输入顺序返回结果 / Run concurrently and return results in input order
+
+        max_workers 为 1 时串行执行。
+        Runs serially when max_workers is 1.
+        """
+        items = list(items)
+        if self.max_workers <= 1 or len(items) <= 1:
+            return [func(item) for item in items]
 
-        if elapsed < min_interval:
-            time.sleep(min_interval - elapsed)
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(items))) as executor:
+            return list(executor.map(func, items))
 
-        self._last_request_time = time.time()
+    def _merge_unique(self, resource_lists: Iterable[List[dict]]) -> List[dict]:
+        """
+        按顺序合并多组资源并按 URL 去重 / Merge resource lists in order, deduplicating by URL
+        """
+        resources = []
+        seen_urls = set()
+        for batch in resource_lists:
+            for res in batch:
+                url = res.get("PrimaryLink", "")
+                if url not in seen_urls:
+                    seen_urls.add(url)
+                    resources.append(res)
+        return resources
+
+    def _crawl_resources(self) -> List[dict]:
+        """
+        执行 crawl() 并返回结果，异步爬虫会覆盖此方法
+        Run crawl() and return its results; async crawlers override this
+        """
+        return self.crawl()
 
     def _make_request(self, url: str, method: str = "GET", **kwargs) -> Optional[requests.Response]:
         """
         发起 HTTP 请求（带速率限制）
         Make HTTP request (with rate limiting)
         """
-        self._rate_limit()
+        self._rate_limit(url)
 
         timeout = kwargs.pop("timeout", 30)
 
@@ -154,6 +292,34 @@ class BaseCrawler(ABC):
             print(f"   ⚠️ 请求失败 [{url}]: {e}")
             return None
 
+    def _stream_request(self, url: str, consume: Callable[[bytes], bool], chunk_size: int = 16384, **kwargs) -> bool:
+        """
+        流式 GET 请求（带速率限制），consume 返回 True 时提前断开
+        Streamed GET request (with rate limiting); disconnects early once consume returns True
+
+        Args:
+            url: 请求 URL / Request URL
+            consume: 处理每个数据块的回调 / Callback for each chunk
+            chunk_size: 块大小 / Chunk size
+
+        Returns:
+            请求是否成功 / Whether the request succeeded
+        """
+        self._rate_limit(url)
+
+        timeout = kwargs.pop("timeout", 30)
+
+        try:
+            with self.session.get(url, timeout=timeout, stream=True, **kwargs) as response:
+                response.raise_for_status()
+                for chunk in response.iter_content(chunk_size=chunk_size):
+                    if consume(chunk):
+                        break
+            return True
+        except requests.exceptions.RequestException as e:
+            print(f"   ⚠️ 请求失败 [{url}]: {e}")
+            return False
+
     def _extract_github_url(self, text: str) -> Optional[str]:
         """
         从文本中提取 GitHub URL
@@ -164,9 +330,8 @@ class BaseCrawler(ABC):
         match = re.search(pattern, text)
         if match:
             url = match.group(0)
-            # 清理 URL（移除 .git 等后缀）
-            url = re.sub(r"\.git$", "", url)
-            url = re.sub(r"[/\?#].*$", "", url)
+            # 清理 URL（移除 .git 后缀和句末标点）
+            url = re.sub(r"\.git$", "", url.rstrip("."))
             return url
         return None
 
@@ -399,25 +564,23 @@ class BaseCrawler(ABC):
         Returns:
             添加的资源数量 / Number of resources added
         """
-        pending_file = self.PROJECT_ROOT / "candidates" / "pending_resources.json"
-
-        if pending_file.exists():
-            with open(pending_file, "r", encoding="utf-8") as f:
-                data = json.load(f)
-        else:
-            data = {"_comment": "候选资源队列 - 待审核的资源", "_schema_version": "1.0", "resources": []}
-
-        added_count = 0
-        for resource in resources:
-            # 再次检查重复
-            url = self._normalize_url(resource.get("PrimaryLink", ""))
-            if url and url not in self._existing_urls:
-                data["resources"].append(resource)
-                self._existing_urls.add(url)
-                added_count += 1
-
-        with open(pending_file, "w", encoding="utf-8") as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+        store = get_candidate_store()
+
+        # 并行爬虫共享同一个队列，检查和追加需要串行
+        # Parallel crawlers share the queue, so check-and-append is serialized
+        with self._pending_lock:
+            new_resources = []
+            for resource in resources:
+                # 再次检查重复（其他爬虫可能已写入相同 URL）/ Check again, other crawlers may have queued the URL
+                url = canonical_url(resource.get("PrimaryLink", ""))
+                if url and url not in self._url_index and not store.contains_url("pending", url):
+                    # 游标元数据只在本次运行内使用 / Cursor metadata only lives within this run
+                    new_resources.append({k: v for k, v in resource.items() if k != "_cursor"})
+                    self._url_index.add(url, resource.get("ID", ""))
+
+            if new_resources:
+                store.append("pending", new_resources)
+            added_count = len(new_resources)
 
         return added_count
 
@@ -435,7 +598,7 @@ class BaseCrawler(ABC):
         print(f"\n🕷️  运行 {self.name} 爬虫...")
 
         try:
-            resources = self.crawl()
+            resources = self._crawl_resources()
         except Exception as e:
             print(f"   ❌ 爬取失败: {e}")
             return 0, 0
@@ -450,13 +613,17 @@ class BaseCrawler(ABC):
         # 按相关性排序
         unique_resources.sort(key=lambda x: x.get("_relevance_score", 0), reverse=True)
 
-        # 限制数量
+        # 限制数量；超出的资源不保存，游标也不能越过它们
+        # Apply the limit; resources past it are not saved and cursors must not move past them
+        dropped_resources = unique_resources[limit:]
         unique_resources = unique_resources[:limit]
 
         discovered_count = len(unique_resources)
         print(f"   📊 发现 {discovered_count} 个新资源")
 
         if not unique_resources:
+            if not dry_run:
+                self.save_checkpoint()
             return 0, 0
 
         # 显示发现的资源
@@ -474,4 +641,10 @@ class BaseCrawler(ABC):
         added_count = self.save_to_pending(unique_resources)
         print(f"   ✅ 已添加 {added_count} 个资源到候选队列")
 
+        # 保存成功后才写入游标 / Cursors are only written once saving succeeded
+        if dropped_resources:
+            print(f"   ⏸️  {len(dropped_resources)} 个资源超出数量限制，下次运行重新获取")
+            self._rewind_cursors(dropped_resources)
+        self.save_checkpoint()
+
         return discovered_count, added_count
@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+"""
+流式 RSS/Atom 解析器 / Streaming RSS/Atom Parser
+
+基于 xml.etree.ElementTree.XMLPullParser 的增量解析：数据按块喂入，
+每解析完一个 <item>/<entry> 就立即提取字段并释放该元素，
+达到条目上限后即可停止下载。内存占用与条目数成正比，与文档大小无关。
+Incremental parsing on top of xml.etree.ElementTree.XMLPullParser: data is fed in
+chunks, every finished <item>/<entry> is turned into a dict and released right away,
+and the download can stop once the entry limit is reached. Memory grows with the
+number of entries, not with the document size.
+
+支持 RSS 2.0 与 Atom，正确处理 CDATA 和命名空间（dc:creator、content:encoded、atom:link 等）。
+Supports RSS 2.0 and Atom, handling CDATA and namespaces (dc:creator, content:encoded, atom:link, ...).
+"""
+
+import xml.etree.ElementTree as ET
+from typing import Dict, Iterable, List, Optional
+
+# 条目元素（本地名）/ Entry elements (local names)
+ENTRY_TAGS = {"item", "entry"}
+
+# 字段 → 候选子元素（本地名，按优先级）/ Field → candidate child elements (local names, by priority)
+FIELD_TAGS = {
+    "title": ("title",),
+    "description": ("description", "summary", "encoded", "content"),
+    "published": ("pubDate", "published", "updated", "date"),
+    "author": ("author", "creator"),
+    "guid": ("guid", "id"),
+}
+
+
+def local_name(tag: str) -> str:
+    """去掉命名空间前缀 / Strip the namespace from a tag"""
+    return tag.rsplit("}", 1)[-1] if tag.startswith("{") else tag
+
+
+def element_text(elem: ET.Element) -> str:
+    """
+    元素的全部文本 / All text of an element
+
+    CDATA 已由解析器展开为普通文本；Atom type="xhtml" 内容包含子元素，需拼接。
+    CDATA is already plain text after parsing; Atom type="xhtml" content has child elements to join.
+    """
+    return "".join(elem.itertext()).strip()
+
+
+def parse_entry(elem: ET.Element) -> dict:
+    """
+    从 <item>/<entry> 元素提取字段 / Extract fields from an <item>/<entry> element
+
+    只看直接子元素，避免 Atom <source> 等嵌套元素的字段混入。
+    Only direct children are considered so nested elements such as Atom <source> do not leak in.
+    """
+    children: Dict[str, List[ET.Element]] = {}
+    for child in elem:
+        children.setdefault(local_name(child.tag), []).append(child)
+
+    entry = {}
+    for field, tags in FIELD_TAGS.items():
+        entry[field] = ""
+        for tag in tags:
+            for child in children.get(tag, []):
+                if field == "author":
+                    # Atom: <author><name>..</name></author>
+                    name = next((c for c in child if local_name(c.tag) == "name"), None)
+                    text = element_text(name if name is not None else child)
+                else:
+                    text = element_text(child)
+                if text:
+                    entry[field] = text
+                    break
+            if entry[field]:
+                break
+
+    entry["link"] = _entry_link(children.get("link", []))
+    return entry
+
+
+def _entry_link(links: List[ET.Element]) -> str:
+    """
+    条目链接：RSS 取文本，Atom 取 rel="alternate"（或无 rel）的 href
+    Entry link: text for RSS, href of rel="alternate" (or no rel) for Atom
+    """
+    fallback = ""
+    for link in links:
+        text = element_text(link)
+        if text:
+            return text
+
+        href = link.get("href", "")
+        rel = link.get("rel", "alternate")
+        if href and rel == "alternate":
+            return href
+        fallback = fallback or href
+    return fallback
+
+
+class FeedStreamParser:
+    """
+    增量 feed 解析器 / Incremental feed parser
+
+    用法 / Usage:
+        parser = FeedStreamParser(limit=30)
+        for chunk in chunks:
+            if parser.feed(chunk):
+                break
+        entries = parser.close()
+    """
+
+    def __init__(self, limit: Optional[int] = None):
+        self.limit = limit
+        self.entries: List[dict] = []
+        self.error: Optional[str] = None
+        self._parser = ET.XMLPullParser(events=("start", "end"))
+        self._stack: List[ET.Element] = []
+
+    @property
+    def done(self) -> bool:
+        """是否已达到条目上限或遇到错误 / Whether the limit was reached or an error occurred"""
+        return self.error is not None or (self.limit is not None and len(self.entries) >= self.limit)
+
+    def feed(self, data: bytes) -> bool:
+        """
+        喂入一块数据 / Feed one chunk of data
+
+        Returns:
+            是否可以停止读取 / Whether reading can stop
+        """
+        if self.done:
+            return True
+
+        try:
+            self._parser.feed(data)
+            self._drain()
+        except ET.ParseError as e:
+            self.error = str(e)
+        return self.done
+
+    def close(self) -> List[dict]:
+        """结束解析并返回条目 / Finish parsing and return the entries"""
+        if not self.done:
+            try:
+                self._parser.close()
+                self._drain()
+            except ET.ParseError as e:
+                self.error = str(e)
+        return self.entries[: self.limit] if self.limit is not None else self.entries
+
+    def _drain(self):
+        """处理已解析的事件 / Process parsed events"""
+        for event, elem in self._parser.read_events():
+            if event == "start":
+                self._stack.append(elem)
+                continue
+
+            self._stack.pop()
+            if local_name(elem.tag) not in ENTRY_TAGS:
+                continue
+
+            entry = parse_entry(elem)
+            if entry["title"] and entry["link"]:
+                self.entries.append(entry)
+
+            # 释放已处理的条目 / Release the processed entry
+            elem.clear()
+            if self._stack:
+                self._stack[-1].remove(elem)
+
+            if self.done:
+                return
+
+
+def parse_feed(chunks: Iterable[bytes], limit: Optional[int] = None) -> List[dict]:
+    """
+    解析 feed 数据块，达到上限后停止读取 / Parse feed chunks, stop reading once the limit is hit
+
+    Args:
+        chunks: 字节块迭代器 / Iterable of byte chunks
+        limit: 最大条目数 / Maximum number of entries
+
+    Returns:
+        条目列表，字段为 title / link / description / published / author / guid
+        List of entries with title / link / description / published / author / guid
+    """
+    parser = FeedStreamParser(limit)
+    for chunk in chunks:
+        if parser.feed(chunk):
+            break
+    return parser.close()
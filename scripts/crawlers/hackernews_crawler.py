@@ -10,9 +10,10 @@ Uses Algolia HN Search API.
 """
 
 from datetime import datetime, timedelta, timezone
-from typing import Dict, List, Optional
+from typing import Dict, Iterable, List, Optional, Tuple
 from urllib.parse import quote_plus
 
+from .async_base_crawler import AsyncBaseCrawler
 from .base_crawler import BaseCrawler
 
 
@@ -43,18 +44,20 @@ class HackerNewsCrawler(BaseCrawler):
         self.max_age_days = self.hn_config.get("max_age_days", 30)
         self.sort_by = self.hn_config.get("sort_by", "popularity")  # popularity, date
 
-    def _search(self, query: str) -> List[dict]:
+        # 增量爬取时回看的时长，让分数仍在增长的帖子有机会通过 min_score
+        # Look-back for incremental crawls so stories still gaining points can pass min_score
+        self.checkpoint_overlap_hours = self.hn_config.get("checkpoint_overlap_hours", 24)
+
+    def _search_request(self, query: str) -> Tuple[str, dict]:
         """
-        执行搜索 / Execute search
+        构建搜索请求 / Build search request
 
         Args:
             query: 搜索查询 / Search query
 
         Returns:
-            搜索结果列表 / List of search results
+            (API URL, 请求参数) / (API URL, request params)
         """
-        results = []
-
         # 选择 API 端点
         if self.sort_by == "date":
             api_url = self.SEARCH_BY_DATE_API
@@ -74,12 +77,32 @@ class HackerNewsCrawler(BaseCrawler):
             params["tags"] = "comment"
         # 'all' 不需要 tags 参数
 
-        # 设置时间范围
+        # 设置时间范围：窗口起点与上次游标（减去回看时长）取较晚者
+        # Time range: the later of the window start and the last cursor minus the look-back
+        timestamp = 0
         if self.max_age_days:
             timestamp = int((datetime.now(timezone.utc) - timedelta(days=self.max_age_days)).timestamp())
+
+        last_seen = self._get_cursor(query).get("created_at_i")
+        if last_seen:
+            timestamp = max(timestamp, int(last_seen) - int(self.checkpoint_overlap_hours * 3600))
+
+        if timestamp:
             params["numericFilters"] = f"created_at_i>{timestamp}"
 
-        response = self._make_request(api_url, params=params)
+        return api_url, params
+
+    def _parse_hits(self, response) -> List[dict]:
+        """
+        解析搜索响应 / Parse search response
+
+        Args:
+            response: HTTP 响应或 None / HTTP response or None
+
+        Returns:
+            搜索结果列表 / List of search results
+        """
+        results = []
 
         if not response:
             return results
@@ -96,6 +119,20 @@ class HackerNewsCrawler(BaseCrawler):
 
         return results
 
+    def _search(self, query: str) -> List[dict]:
+        """
+        执行搜索 / Execute search
+
+        Args:
+            query: 搜索查询 / Search query
+
+        Returns:
+            搜索结果列表 / List of search results
+        """
+        api_url, params = self._search_request(query)
+        response = self._make_request(api_url, params=params)
+        return self._parse_hits(response)
+
     def _filter_hit(self, hit: dict) -> bool:
         """
         过滤搜索结果 / Filter search result
@@ -176,9 +213,12 @@ class HackerNewsCrawler(BaseCrawler):
             },
         )
 
-    def crawl(self) -> List[dict]:
+    def _resources_from_hits(self, keyword_hits: Iterable[Tuple[str, List[dict]]]) -> List[dict]:
         """
-        执行爬取 / Execute crawl
+        将各关键词的搜索结果转换为资源 / Turn per-keyword search results into resources
+
+        Args:
+            keyword_hits: [(关键词, 搜索结果), ...] / [(keyword, hits), ...]
 
         Returns:
             发现的资源列表 / List of discovered resources
@@ -186,13 +226,12 @@ class HackerNewsCrawler(BaseCrawler):
         resources = []
         seen_urls = set()
 
-        print(f"   📋 搜索 {len(self.keywords)} 个关键词...")
-
-        for keyword in self.keywords:
-            print(f'      搜索 "{keyword}"...')
+        for keyword, hits in keyword_hits:
+            print(f'      搜索 "{keyword}"... 找到 {len(hits)} 个结果')
 
-            hits = self._search(keyword)
-            print(f"         找到 {len(hits)} 个结果")
+            newest = max((hit.get("created_at_i") or 0 for hit in hits), default=0)
+            if newest > self._get_cursor(keyword).get("created_at_i", 0):
+                self._advance_cursor(keyword, created_at_i=newest)
 
             for hit in hits:
                 if not self._filter_hit(hit):
@@ -203,6 +242,55 @@ class HackerNewsCrawler(BaseCrawler):
                     url = resource.get("PrimaryLink", "")
                     if url not in seen_urls:
                         seen_urls.add(url)
+                        resource["_cursor"] = {"key": keyword, "created_at_i": hit.get("created_at_i") or 0}
                         resources.append(resource)
 
         return resources
+
+    def _rewind_cursors(self, resources: List[dict]):
+        """
+        把关键词游标退回到最早未保存的条目之前 / Move keyword cursors back before the oldest unsaved hit
+        """
+        with self._cursor_lock:
+            for resource in resources:
+                cursor = resource.get("_cursor") or {}
+                new_cursor = self._new_cursors.get(cursor.get("key"))
+                if new_cursor and cursor.get("created_at_i"):
+                    new_cursor["created_at_i"] = min(new_cursor.get("created_at_i", 0), cursor["created_at_i"] - 1)
+
+    def crawl(self) -> List[dict]:
+        """
+        执行爬取 / Execute crawl
+
+        Returns:
+            发现的资源列表 / List of discovered resources
+        """
+        print(f"   📋 搜索 {len(self.keywords)} 个关键词...")
+
+        return self._resources_from_hits(zip(self.keywords, self._parallel_map(self._search, self.keywords)))
+
+
+class AsyncHackerNewsCrawler(AsyncBaseCrawler, HackerNewsCrawler):
+    """
+    异步 Hacker News 爬虫 / Async Hacker News crawler
+
+    所有关键词的搜索同时发出，输出与 HackerNewsCrawler 相同。
+    Searches for all keywords are issued at once; output matches HackerNewsCrawler.
+    """
+
+    async def _search(self, query: str) -> List[dict]:
+        """执行搜索 / Execute search"""
+        api_url, params = self._search_request(query)
+        response = await self._make_request(api_url, params=params)
+        return self._parse_hits(response)
+
+    async def crawl(self) -> List[dict]:
+        """
+        执行爬取 / Execute crawl
+
+        Returns:
+            发现的资源列表 / List of discovered resources
+        """
+        print(f"   📋 搜索 {len(self.keywords)} 个关键词（异步）...")
+
+        return self._resources_from_hits(zip(self.keywords, await self._gather(self._search, self.keywords)))
@@ -245,56 +245,70 @@ class RedditCrawler(BaseCrawler):
 
         return None
 
-    def crawl(self) -> List[dict]:
+    def _crawl_subreddit(self, subreddit: str) -> List[dict]:
         """
-        执行爬取 / Execute crawl
+        爬取单个 subreddit / Crawl single subreddit
+
+        Args:
+            subreddit: Subreddit 名称 / Subreddit name
 
         Returns:
-            发现的资源列表 / List of discovered resources
+            发现的资源列表（可能含重复）/ List of discovered resources (may contain duplicates)
         """
         resources = []
-        seen_urls = set()
 
-        print(f"   📋 搜索 {len(self.subreddits)} 个 subreddits...")
+        print(f"      搜索 r/{subreddit}...")
 
         # 按关键词搜索
-        for subreddit in self.subreddits:
-            print(f"      搜索 r/{subreddit}...")
-
-            for keyword in self.keywords:
-                posts = self._search_subreddit(subreddit, keyword)
-
-                for post in posts:
-                    if not self._filter_post(post):
-                        continue
-
-                    resource = self._extract_resource_from_post(post)
-                    if resource:
-                        url = resource.get("PrimaryLink", "")
-                        if url not in seen_urls:
-                            seen_urls.add(url)
-                            resources.append(resource)
-
-            # 也获取热门帖子
-            hot_posts = self._get_hot_posts(subreddit)
-            for post in hot_posts:
-                if not self._filter_post(post):
-                    continue
+        for keyword in self.keywords:
+            posts = self._search_subreddit(subreddit, keyword)
 
-                # 检查标题/内容是否包含关键词
-                title = post.get("title", "").lower()
-                selftext = post.get("selftext", "").lower()
-                combined = f"{title} {selftext}"
-
-                has_keyword = any(kw.lower() in combined for kw in self.keywords)
-                if not has_keyword:
+            for post in posts:
+                if not self._filter_post(post):
                     continue
 
                 resource = self._extract_resource_from_post(post)
                 if resource:
-                    url = resource.get("PrimaryLink", "")
-                    if url not in seen_urls:
-                        seen_urls.add(url)
-                        resources.append(resource)
+                    resources.append(resource)
+
+        # 也获取热门帖子
+        hot_posts = self._get_hot_posts(subreddit)
+        for post in hot_posts:
+            if not self._filter_post(post):
+                continue
+
+            # 检查标题/内容是否包含关键词
+            title = post.get("title", "").lower()
+            selftext = post.get("selftext", "").lower()
+            combined = f"{title} {selftext}"
+
+            has_keyword = any(kw.lower() in combined for kw in self.keywords)
+            if not has_keyword:
+                continue
+
+            resource = self._extract_resource_from_post(post)
+            if resource:
+                resources.append(resource)
+
+        return resources
+
+    def crawl(self) -> List[dict]:
+        """
+        执行爬取 / Execute crawl
+
+        Returns:
+            发现的资源列表 / List of discovered resources
+        """
+        resources = []
+        seen_urls = set()
+
+        print(f"   📋 搜索 {len(self.subreddits)} 个 subreddits...")
+
+        for subreddit_resources in self._parallel_map(self._crawl_subreddit, self.subreddits):
+            for resource in subreddit_resources:
+                url = resource.get("PrimaryLink", "")
+                if url not in seen_urls:
+                    seen_urls.add(url)
+                    resources.append(resource)
 
         return resources
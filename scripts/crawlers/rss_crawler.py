@@ -18,7 +18,9 @@ try:
 except ImportError:
     HAS_FEEDPARSER = False
 
+from .async_base_crawler import AsyncBaseCrawler
 from .base_crawler import BaseCrawler
+from .feed_parser import FeedStreamParser
 
 
 class RSSCrawler(BaseCrawler):
@@ -41,8 +43,12 @@ class RSSCrawler(BaseCrawler):
         self.entries_per_feed = self.rss_config.get("entries_per_feed", 30)
         self.max_age_days = self.rss_config.get("max_age_days", 14)
 
-        if not HAS_FEEDPARSER:
-            print("   ⚠️ feedparser 未安装，RSS 爬虫功能受限")
+        # 解析方式：stream（内置流式解析，默认）或 feedparser
+        # Parser: stream (built-in streaming parser, default) or feedparser
+        self.parser = self.rss_config.get("parser", "stream")
+        if self.parser == "feedparser" and not HAS_FEEDPARSER:
+            print("   ⚠️ feedparser 未安装，改用流式解析")
+            self.parser = "stream"
 
     def _parse_feed(self, feed_url: str) -> List[dict]:
         """
@@ -54,92 +60,60 @@ class RSSCrawler(BaseCrawler):
         Returns:
             条目列表 / List of entries
         """
-        if HAS_FEEDPARSER:
+        if self.parser == "feedparser":
             return self._parse_with_feedparser(feed_url)
         else:
-            return self._parse_with_requests(feed_url)
+            return self._parse_streaming(feed_url)
 
     def _parse_with_feedparser(self, feed_url: str) -> List[dict]:
         """使用 feedparser 解析 / Parse with feedparser"""
-        entries = []
-
         try:
-            feed = feedparser.parse(feed_url)
-
-            for entry in feed.entries[: self.entries_per_feed]:
-                entries.append(
-                    {
-                        "title": entry.get("title", ""),
-                        "link": entry.get("link", ""),
-                        "description": entry.get("summary", entry.get("description", "")),
-                        "published": entry.get("published", ""),
-                        "author": entry.get("author", ""),
-                    }
-                )
-
+            return self._entries_from_feedparser(feedparser.parse(feed_url))
         except Exception as e:
             print(f"      ⚠️ 解析 feed 失败: {e}")
+            return []
 
-        return entries
-
-    def _parse_with_requests(self, feed_url: str) -> List[dict]:
-        """使用 requests 手动解析 / Parse manually with requests"""
+    def _entries_from_feedparser(self, feed) -> List[dict]:
+        """将 feedparser 结果转换为条目 / Convert a feedparser result to entries"""
         entries = []
 
-        response = self._make_request(feed_url)
-        if not response:
-            return entries
+        for entry in feed.entries[: self.entries_per_feed]:
+            entries.append(
+                {
+                    "title": entry.get("title", ""),
+                    "link": entry.get("link", ""),
+                    "description": entry.get("summary", entry.get("description", "")),
+                    "published": entry.get("published", ""),
+                    "author": entry.get("author", ""),
+                    "guid": entry.get("id", ""),
+                }
+            )
+
+        return entries
 
-        content = response.text
+    def _parse_streaming(self, feed_url: str) -> List[dict]:
+        """
+        边下载边解析，取满 entries_per_feed 个条目后停止下载
+        Parse while downloading, stopping once entries_per_feed entries are read
+        """
+        parser = FeedStreamParser(self.entries_per_feed)
+        if not self._stream_request(feed_url, parser.feed):
+            return []
+        return self._finish_stream(parser)
 
-        # 简单的 XML 解析（不依赖外部库）
-        # 匹配 <item> 或 <entry> 标签
-        item_pattern = r"<(?:item|entry)>(.*?)</(?:item|entry)>"
-        items = re.findall(item_pattern, content, re.DOTALL)
+    def _finish_stream(self, parser: FeedStreamParser) -> List[dict]:
+        """结束流式解析并清理字段 / Finish streaming parse and clean the fields"""
+        entries = parser.close()
+        if parser.error:
+            print(f"      ⚠️ 解析 feed 失败（已保留前 {len(entries)} 个条目）: {parser.error}")
 
-        for item in items[: self.entries_per_feed]:
-            title = self._extract_xml_value(item, "title")
-            link = self._extract_xml_value(item, "link")
-            description = (
-                self._extract_xml_value(item, "description")
-                or self._extract_xml_value(item, "summary")
-                or self._extract_xml_value(item, "content")
-            )
-            published = (
-                self._extract_xml_value(item, "pubDate")
-                or self._extract_xml_value(item, "published")
-                or self._extract_xml_value(item, "updated")
-            )
-            author = self._extract_xml_value(item, "author") or self._extract_xml_value(item, "dc:creator")
-
-            # 处理 Atom 格式的 link
-            if not link:
-                link_match = re.search(r'<link[^>]*href=["\']([^"\']+)["\']', item)
-                if link_match:
-                    link = link_match.group(1)
-
-            if title and link:
-                entries.append(
-                    {
-                        "title": self._clean_html(title),
-                        "link": link,
-                        "description": self._clean_html(description),
-                        "published": published,
-                        "author": self._clean_html(author),
-                    }
-                )
+        for entry in entries:
+            entry["title"] = self._clean_html(entry["title"])
+            entry["description"] = self._clean_html(entry["description"])
+            entry["author"] = self._clean_html(entry["author"])
 
         return entries
 
-    def _extract_xml_value(self, xml: str, tag: str) -> str:
-        """从 XML 中提取标签值 / Extract tag value from XML"""
-        # 处理 CDATA
-        pattern = rf"<{tag}[^>]*>(?:<!\[CDATA\[)?(.*?)(?:\]\]>)?</{tag}>"
-        match = re.search(pattern, xml, re.DOTALL | re.IGNORECASE)
-        if match:
-            return match.group(1).strip()
-        return ""
-
     def _clean_html(self, text: str) -> str:
         """清理 HTML 标签 / Clean HTML tags"""
         if not text:
@@ -176,6 +150,81 @@ class RSSCrawler(BaseCrawler):
 
         return None
 
+    def _entry_date(self, entry: dict) -> Optional[datetime]:
+        """条目的发布时间（时区感知）/ Entry publish time (timezone aware)"""
+        pub_date = self._parse_date(entry.get("published", ""))
+        if pub_date and pub_date.tzinfo is None:
+            pub_date = pub_date.replace(tzinfo=timezone.utc)
+        return pub_date
+
+    def _new_entries(self, feed_url: str, entries: List[dict]) -> List[dict]:
+        """
+        只保留上次运行之后的新条目并推进游标 / Keep entries newer than the last run and advance the cursor
+
+        已在上次抓取中出现过的 GUID 直接跳过（不依赖 feed 的排序）；
+        有发布时间的条目还要晚于 last_published。
+        GUIDs seen in the last fetch are skipped (independent of feed order);
+        dated entries must also be newer than last_published.
+
+        Args:
+            feed_url: Feed URL（游标键）/ Feed URL (cursor key)
+            entries: 条目列表 / List of entries
+
+        Returns:
+            新条目列表 / List of new entries
+        """
+        if not entries:
+            return entries
+
+        cursor = self._get_cursor(feed_url)
+        seen_guids = set(cursor.get("seen_guids", []))
+        last_published = self._parse_date(cursor.get("last_published", ""))
+
+        new_entries = []
+        newest = last_published
+        for entry in entries:
+            pub_date = self._entry_date(entry)
+            if pub_date and (newest is None or pub_date > newest):
+                newest = pub_date
+
+            if entry.get("guid") and entry["guid"] in seen_guids:
+                continue
+            if pub_date and last_published and pub_date <= last_published:
+                continue
+
+            new_entries.append(entry)
+
+        self._advance_cursor(
+            feed_url,
+            last_guid=entries[0].get("guid") or None,
+            last_published=newest.isoformat() if newest else None,
+            seen_guids=[entry["guid"] for entry in entries if entry.get("guid")] or None,
+        )
+
+        return new_entries
+
+    def _rewind_cursors(self, resources: List[dict]):
+        """
+        让 feed 游标不越过未保存的条目 / Keep feed cursors from moving past unsaved entries
+
+        未保存条目的 GUID 从 seen_guids 中移除，last_published 退回到其发布时间之前。
+        Unsaved entries' GUIDs leave seen_guids and last_published moves back before their publish time.
+        """
+        with self._cursor_lock:
+            for resource in resources:
+                cursor = resource.get("_cursor") or {}
+                new_cursor = self._new_cursors.get(cursor.get("key"))
+                if not new_cursor:
+                    continue
+
+                if cursor.get("guid") and cursor["guid"] in new_cursor.get("seen_guids", []):
+                    new_cursor["seen_guids"] = [guid for guid in new_cursor["seen_guids"] if guid != cursor["guid"]]
+
+                published = self._parse_date(cursor.get("published", ""))
+                last_published = self._parse_date(new_cursor.get("last_published", ""))
+                if published and last_published and published <= last_published:
+                    new_cursor["last_published"] = (published - timedelta(seconds=1)).isoformat()
+
     def _filter_entry(self, entry: dict, keywords: List[str]) -> bool:
         """
         过滤条目 / Filter entry
@@ -261,11 +310,12 @@ class RSSCrawler(BaseCrawler):
             },
         )
 
-    def _crawl_feed(self, feed_config: dict) -> List[dict]:
+    def _resources_from_entries(self, entries: List[dict], feed_config: dict) -> List[dict]:
         """
-        爬取单个 feed / Crawl single feed
+        将 feed 条目转换为资源 / Turn feed entries into resources
 
         Args:
+            entries: 条目列表 / List of entries
             feed_config: Feed 配置 / Feed configuration
 
         Returns:
@@ -273,13 +323,11 @@ class RSSCrawler(BaseCrawler):
         """
         resources = []
         feed_name = feed_config.get("name", "Unknown")
-        feed_url = feed_config.get("url", "")
         keywords = feed_config.get("keywords", [])
 
-        print(f"      爬取 {feed_name}...")
-
-        entries = self._parse_feed(feed_url)
-        print(f"         获取 {len(entries)} 个条目")
+        total = len(entries)
+        entries = self._new_entries(feed_config.get("url", ""), entries)
+        print(f"         获取 {total} 个条目，其中 {len(entries)} 个为新条目")
 
         for entry in entries:
             if not self._filter_entry(entry, keywords):
@@ -287,12 +335,33 @@ class RSSCrawler(BaseCrawler):
 
             resource = self._create_resource_from_entry(entry, feed_name)
             if resource:
+                pub_date = self._entry_date(entry)
+                resource["_cursor"] = {
+                    "key": feed_config.get("url", ""),
+                    "guid": entry.get("guid", ""),
+                    "published": pub_date.isoformat() if pub_date else "",
+                }
                 resources.append(resource)
 
         print(f"         发现 {len(resources)} 个相关资源")
 
         return resources
 
+    def _crawl_feed(self, feed_config: dict) -> List[dict]:
+        """
+        爬取单个 feed / Crawl single feed
+
+        Args:
+            feed_config: Feed 配置 / Feed configuration
+
+        Returns:
+            发现的资源列表 / List of discovered resources
+        """
+        print(f"      爬取 {feed_config.get('name', 'Unknown')}...")
+
+        entries = self._parse_feed(feed_config.get("url", ""))
+        return self._resources_from_entries(entries, feed_config)
+
     def crawl(self) -> List[dict]:
         """
         执行爬取 / Execute crawl
@@ -300,18 +369,50 @@ class RSSCrawler(BaseCrawler):
         Returns:
             发现的资源列表 / List of discovered resources
         """
-        resources = []
-        seen_urls = set()
-
         print(f"   📋 爬取 {len(self.feeds)} 个 RSS feeds...")
 
-        for feed_config in self.feeds:
-            feed_resources = self._crawl_feed(feed_config)
+        return self._merge_unique(self._parallel_map(self._crawl_feed, self.feeds))
 
-            for res in feed_resources:
-                url = res.get("PrimaryLink", "")
-                if url not in seen_urls:
-                    seen_urls.add(url)
-                    resources.append(res)
 
-        return resources
+class AsyncRSSCrawler(AsyncBaseCrawler, RSSCrawler):
+    """
+    异步 RSS 爬虫 / Async RSS crawler
+
+    所有 feed 同时下载，并用与 RSSCrawler 相同的方式解析。
+    Downloads every feed at once and parses them the same way as RSSCrawler.
+    """
+
+    async def _parse_feed(self, feed_url: str) -> List[dict]:
+        """下载并解析 RSS feed / Download and parse RSS feed"""
+        if self.parser == "feedparser":
+            response = await self._make_request(feed_url)
+            if not response:
+                return []
+            try:
+                return self._entries_from_feedparser(feedparser.parse(response.text))
+            except Exception as e:
+                print(f"      ⚠️ 解析 feed 失败: {e}")
+                return []
+
+        parser = FeedStreamParser(self.entries_per_feed)
+        if not await self._stream_request(feed_url, parser.feed):
+            return []
+        return self._finish_stream(parser)
+
+    async def _crawl_feed(self, feed_config: dict) -> List[dict]:
+        """爬取单个 feed / Crawl single feed"""
+        entries = await self._parse_feed(feed_config.get("url", ""))
+
+        print(f"      爬取 {feed_config.get('name', 'Unknown')}...")
+        return self._resources_from_entries(entries, feed_config)
+
+    async def crawl(self) -> List[dict]:
+        """
+        执行爬取 / Execute crawl
+
+        Returns:
+            发现的资源列表 / List of discovered resources
+        """
+        print(f"   📋 爬取 {len(self.feeds)} 个 RSS feeds（异步）...")
+
+        return self._merge_unique(await self._gather(self._crawl_feed, self.feeds))
@@ -13,7 +13,6 @@ Usage:
 
 import argparse
 import csv
-import json
 import os
 import subprocess
 import sys
@@ -23,6 +22,9 @@ from typing import List, Optional
 
 # 项目根目录 / Project root
 PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from scripts.candidate_store import get_candidate_store
 
 # CSV 字段顺序（必须与现有 CSV 匹配）
 CSV_FIELDS = [
@@ -48,48 +50,6 @@ CSV_FIELDS = [
 ]
 
 
-def load_pending_resources(pending_file: Path) -> List[dict]:
-    """加载待审核资源 / Load pending resources"""
-    if not pending_file.exists():
-        return []
-
-    with open(pending_file, "r", encoding="utf-8") as f:
-        data = json.load(f)
-        return data.get("resources", [])
-
-
-def save_pending_resources(resources: List[dict], pending_file: Path):
-    """保存待审核资源 / Save pending resources"""
-    data = {
-        "_comment": "候选资源队列 - 待审核的资源 / Candidate resource queue - resources pending review",
-        "_schema_version": "1.0",
-        "resources": resources,
-    }
-    with open(pending_file, "w", encoding="utf-8") as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
-
-
-def load_rejected_resources(rejected_file: Path) -> List[dict]:
-    """加载已拒绝资源 / Load rejected resources"""
-    if not rejected_file.exists():
-        return []
-
-    with open(rejected_file, "r", encoding="utf-8") as f:
-        data = json.load(f)
-        return data.get("resources", [])
-
-
-def save_rejected_resources(resources: List[dict], rejected_file: Path):
-    """保存已拒绝资源 / Save rejected resources"""
-    data = {
-        "_comment": "已拒绝的资源 - 用于去重检测 / Rejected resources - used for deduplication",
-        "_schema_version": "1.0",
-        "resources": resources,
-    }
-    with open(rejected_file, "w", encoding="utf-8") as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
-
-
 def clean_resource_for_csv(resource: dict) -> dict:
     """
     清理资源数据，移除元数据字段
@@ -256,72 +216,49 @@ def create_branch_and_pr(resources: List[dict], csv_file: Path) -> tuple:
     return True, output
 
 
-def approve_resource(resource_id: str, pending_file: Path, csv_file: Path) -> tuple:
+def approve_resource(resource_id: str, csv_file: Path) -> tuple:
     """
     批准单个资源（添加到 CSV）
     Approve single resource (add to CSV)
     """
-    resources = load_pending_resources(pending_file)
+    store = get_candidate_store()
 
-    # 查找资源
-    target = None
-    remaining = []
-    for r in resources:
-        if r["ID"] == resource_id:
-            target = r
-        else:
-            remaining.append(r)
-
-    if not target:
+    # 从待审核队列移除
+    removed = store.remove("pending", [resource_id])
+    if not removed:
         return False, f"未找到资源: {resource_id}"
+    target = removed[0]
 
     # 添加到 CSV
     append_resource_to_csv(target, csv_file)
 
-    # 从待审核列表移除
-    save_pending_resources(remaining, pending_file)
-
     return True, f"已批准资源: {target['DisplayName']}"
 
 
-def reject_resource(resource_id: str, reason: str, pending_file: Path, rejected_file: Path) -> tuple:
+def reject_resource(resource_id: str, reason: str) -> tuple:
     """
     拒绝资源（移到已拒绝列表）
     Reject resource (move to rejected list)
     """
-    resources = load_pending_resources(pending_file)
-    rejected = load_rejected_resources(rejected_file)
-
-    # 查找资源
-    target = None
-    remaining = []
-    for r in resources:
-        if r["ID"] == resource_id:
-            target = r
-        else:
-            remaining.append(r)
+    # 移到已拒绝列表，同时记录拒绝原因和时间
+    target = get_candidate_store().move(
+        resource_id,
+        "pending",
+        "rejected",
+        _rejected_at=datetime.now().isoformat(),
+        _reject_reason=reason,
+        _status="rejected",
+    )
 
     if not target:
         return False, f"未找到资源: {resource_id}"
 
-    # 添加拒绝原因和时间
-    target["_rejected_at"] = datetime.now().isoformat()
-    target["_reject_reason"] = reason
-    target["_status"] = "rejected"
-
-    # 添加到已拒绝列表
-    rejected.append(target)
-
-    # 保存
-    save_pending_resources(remaining, pending_file)
-    save_rejected_resources(rejected, rejected_file)
-
     return True, f"已拒绝资源: {target['DisplayName']}"
 
 
-def list_pending(pending_file: Path):
+def list_pending():
     """列出待审核资源 / List pending resources"""
-    resources = load_pending_resources(pending_file)
+    resources = get_candidate_store().load("pending")
 
     if not resources:
         print("📭 没有待审核的资源")
@@ -348,18 +285,18 @@ def main():
     parser.add_argument("--dry-run", action="store_true", help="Do not create PR")
     args = parser.parse_args()
 
-    pending_file = PROJECT_ROOT / "candidates" / "pending_resources.json"
-    rejected_file = PROJECT_ROOT / "candidates" / "rejected_resources.json"
     csv_file = PROJECT_ROOT / "THE_RESOURCES_TABLE.csv"
+    store = get_candidate_store()
 
     # 列出待审核资源
     if args.list:
-        list_pending(pending_file)
+        list_pending()
         return 0
 
     # 批准资源
     if args.approve:
-        success, msg = approve_resource(args.approve, pending_file, csv_file)
+        success, msg = approve_resource(args.approve, csv_file)
+        store.export()
         print(f"{'✅' if success else '❌'} {msg}")
         return 0 if success else 1
 
@@ -368,12 +305,13 @@ def main():
         if not args.reason:
             print("❌ 拒绝资源需要提供原因 (--reason)")
             return 1
-        success, msg = reject_resource(args.reject, args.reason, pending_file, rejected_file)
+        success, msg = reject_resource(args.reject, args.reason)
+        store.export()
         print(f"{'✅' if success else '❌'} {msg}")
         return 0 if success else 1
 
     # 处理资源创建 PR
-    resources = load_pending_resources(pending_file)
+    resources = store.load("pending")
 
     if args.resource_id:
         # 只处理指定的资源
@@ -395,10 +333,8 @@ def main():
 
     if success:
         # 从待审核列表移除已处理的资源
-        remaining = load_pending_resources(pending_file)
-        processed_ids = {r["ID"] for r in resources}
-        remaining = [r for r in remaining if r["ID"] not in processed_ids]
-        save_pending_resources(remaining, pending_file)
+        store.remove("pending", [r["ID"] for r in resources])
+        store.export()
 
         print(f"\n✅ 完成: {msg}")
         return 0
@@ -4,29 +4,58 @@
 
 检测候选资源与现有资源之间的重复，使用多种策略：
 1. URL 规范化匹配
-2. 名称相似度（Jaccard/编辑距离）
+2. 名称相似度（Jaccard/编辑距离，三元组索引 + 带上限的编辑距离）
 3. 描述相似度
 4. GitHub owner/repo 匹配
 
+描述相似度使用 MinHash 签名 + LSH 分桶索引，只对候选桶内的资源计算精确 Jaccard，
+签名按描述内容缓存在 candidates/dedup_index.json 中跨运行复用。
+Description similarity uses MinHash signatures with an LSH banding index so exact
+Jaccard is only computed for bucket candidates; signatures are cached by description
+content in candidates/dedup_index.json and reused across runs.
+
 用法 / Usage:
-    python scripts/dedup_detector.py [--check-pending] [--report]
+    python scripts/dedup_detector.py [--check-pending] [--report] [--rebuild-index]
+    python scripts/dedup_detector.py --batch [--report]   # 待审核队列内部聚类 / cluster the pending queue
 """
 
 import argparse
-import csv
+import base64
+import hashlib
 import json
+import random
 import re
 import sys
-from collections import defaultdict
+import zlib
+from array import array
+from collections import Counter, defaultdict
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Set, Tuple
+from typing import Dict, FrozenSet, Iterable, List, Optional, Set, Tuple
 from urllib.parse import urlparse
 
 import yaml
 
 # 项目根目录 / Project root
 PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from scripts.url_index import INDEX_SOURCES, UrlIndex, canonical_url, extract_github_repo
+
+# MinHash 签名缓存 / MinHash signature cache
+DEDUP_INDEX_FILE = PROJECT_ROOT / "candidates" / "dedup_index.json"
+
+# MinHash 参数：64 个哈希分成 16 个 band（每 band 4 行），候选阈值约 (1/16)^(1/4) ≈ 0.5，
+# 相似度 0.8 的描述成为候选的概率 > 99.9%
+# MinHash parameters: 64 hashes in 16 bands of 4 rows puts the candidate threshold near
+# (1/16)^(1/4) ≈ 0.5; descriptions at 0.8 similarity become candidates with > 99.9% probability
+DEFAULT_NUM_PERM = 64
+DEFAULT_LSH_BANDS = 16
+MINHASH_SEED = 42
+MINHASH_PRIME = (1 << 31) - 1
+
+# 名称/描述相似度达到该值即视为重复 / Name/description similarity at which a match counts as a duplicate
+DUPLICATE_SIMILARITY = 0.95
 
 
 def load_config() -> dict:
@@ -38,67 +67,181 @@ def load_config() -> dict:
     return {}
 
 
-def normalize_url(url: str, config: dict = None) -> str:
+def extract_package_name(url: str) -> Optional[str]:
     """
-    规范化 URL / Normalize URL
+    从 npm / PyPI 页面 URL 提取包名 / Extract the package name from an npm / PyPI page URL
 
-    Args:
-        url: 原始 URL / Original URL
-        config: 配置 / Configuration
+    作用域包返回 scope/name，可与同名 owner/repo 对应；PyPI 名称按 PEP 503 规范化。
+    Scoped packages return scope/name so they line up with owner/repo; PyPI names are PEP 503 normalized.
 
-    Returns:
-        规范化后的 URL / Normalized URL
+    Returns: 包名或 None / package name or None
     """
-    if not url:
-        return ""
+    normalized = canonical_url(url)
 
-    config = config or {}
-    dedup_config = config.get("deduplication", {})
+    match = re.match(r"npmjs\.com/package/(?:@([^/]+)/)?([^/]+)", normalized)
+    if match:
+        scope, name = match.groups()
+        return f"{scope}/{name}" if scope else name
 
-    # 基本清理
-    url = url.strip()
+    match = re.match(r"pypi\.org/project/([^/]+)", normalized)
+    if match:
+        return re.sub(r"[-_.]+", "-", match.group(1))
 
-    # 移除协议
-    url = re.sub(r"^https?://", "", url)
+    return None
 
-    # 移除 www
-    if dedup_config.get("strip_www", True):
-        url = re.sub(r"^www\.", "", url)
 
-    # 移除末尾斜杠
-    if dedup_config.get("strip_trailing_slash", True):
-        url = url.rstrip("/")
+class UnionFind:
+    """
+    并查集（路径减半 + 按大小合并）/ Union-find with path halving and union by size
+    """
 
-    # 转小写
-    if dedup_config.get("lowercase", True):
-        url = url.lower()
+    def __init__(self, size: int):
+        self.parent = list(range(size))
+        self.size = [1] * size
+
+    def find(self, x: int) -> int:
+        """查找根节点 / Find the root"""
+        parent = self.parent
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        return x
+
+    def union(self, a: int, b: int) -> bool:
+        """合并两个集合，返回是否发生合并 / Merge two sets, return whether they were separate"""
+        root_a, root_b = self.find(a), self.find(b)
+        if root_a == root_b:
+            return False
+        if self.size[root_a] < self.size[root_b]:
+            root_a, root_b = root_b, root_a
+        self.parent[root_b] = root_a
+        self.size[root_a] += self.size[root_b]
+        return True
+
+    def groups(self) -> List[List[int]]:
+        """所有集合，成员按位置排序 / All sets with members in position order"""
+        members: Dict[int, List[int]] = defaultdict(list)
+        for x in range(len(self.parent)):
+            members[self.find(x)].append(x)
+        return list(members.values())
+
+
+def tokenize(text: str) -> Set[str]:
+    """分词为小写词集合 / Tokenize into a set of lowercase words"""
+    return set(re.findall(r"\w+", text.lower())) if text else set()
+
+
+class MinHasher:
+    """
+    MinHash 签名生成器 / MinHash signature generator
 
-    # 移除查询参数和锚点
-    url = re.sub(r"[?#].*$", "", url)
+    词哈希使用 crc32，排列为 (a*x + b) mod p，种子固定，签名可跨进程持久化。
+    Token hashes use crc32 and permutations are (a*x + b) mod p with a fixed seed,
+    so signatures can be persisted across processes.
+    """
 
-    # 移除 .git 后缀
-    url = re.sub(r"\.git$", "", url)
+    def __init__(self, num_perm: int = DEFAULT_NUM_PERM, seed: int = MINHASH_SEED):
+        rng = random.Random(seed)
+        self.num_perm = num_perm
+        self.permutations = [
+            (rng.randrange(1, MINHASH_PRIME), rng.randrange(0, MINHASH_PRIME)) for _ in range(num_perm)
+        ]
 
-    return url
+    def signature(self, tokens: Set[str]) -> Tuple[int, ...]:
+        """
+        计算词集合的签名 / Compute the signature of a token set
 
+        Returns:
+            num_perm 个最小哈希值，空集合返回空元组 / num_perm min-hashes, empty tuple for an empty set
+        """
+        if not tokens:
+            return ()
 
-def extract_github_repo(url: str) -> Optional[Tuple[str, str]]:
+        hashes = [zlib.crc32(token.encode("utf-8")) for token in tokens]
+        return tuple(min((a * h + b) % MINHASH_PRIME for h in hashes) for a, b in self.permutations)
+
+
+class MinHashLSH:
     """
-    从 URL 提取 GitHub owner/repo / Extract GitHub owner/repo from URL
+    LSH 分桶索引 / LSH banding index
 
-    Returns: (owner, repo) or None
+    签名被切成 bands 段，任一段完全相同的条目成为候选。
+    Signatures are cut into bands; entries sharing any whole band become candidates.
     """
-    normalized = normalize_url(url)
 
-    if "github.com" not in normalized:
-        return None
+    def __init__(self, num_perm: int = DEFAULT_NUM_PERM, bands: int = DEFAULT_LSH_BANDS):
+        if num_perm % bands:
+            raise ValueError(f"num_perm ({num_perm}) 必须能被 bands ({bands}) 整除")
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.buckets: Dict[Tuple[int, Tuple[int, ...]], List[int]] = defaultdict(list)
+
+    def _band_keys(self, signature: Tuple[int, ...]):
+        for band in range(self.bands):
+            yield band, signature[band * self.rows : (band + 1) * self.rows]
+
+    def add(self, key: int, signature: Tuple[int, ...]):
+        """加入条目 / Add an entry"""
+        if signature:
+            for band_key in self._band_keys(signature):
+                self.buckets[band_key].append(key)
+
+    def query(self, signature: Tuple[int, ...]) -> Set[int]:
+        """查询候选条目 / Query candidate entries"""
+        candidates = set()
+        if signature:
+            for band_key in self._band_keys(signature):
+                candidates.update(self.buckets.get(band_key, ()))
+        return candidates
 
-    # 匹配 github.com/owner/repo
-    match = re.search(r"github\.com/([^/]+)/([^/]+)", normalized)
-    if match:
-        return (match.group(1).lower(), match.group(2).lower())
 
-    return None
+def pack_signature(signature: Tuple[int, ...]) -> str:
+    """签名编码为 base64 / Encode a signature as base64"""
+    return base64.b64encode(array("I", signature).tobytes()).decode("ascii")
+
+
+def unpack_signature(data: str) -> Tuple[int, ...]:
+    """从 base64 解码签名 / Decode a signature from base64"""
+    values = array("I")
+    values.frombytes(base64.b64decode(data))
+    return tuple(values)
+
+
+class TokenVocabulary:
+    """
+    词表：把词映射为整数 id / Vocabulary interning tokens as integer ids
+
+    语料只分词一次，之后的集合运算都在整数 frozenset 上进行。
+    The corpus is tokenized once; later set operations run on frozensets of ints.
+    """
+
+    def __init__(self):
+        self.ids: Dict[str, int] = {}
+
+    def intern(self, tokens: Iterable[str]) -> FrozenSet[int]:
+        """词集合转换为 id 集合 / Convert tokens to a set of ids"""
+        ids = self.ids
+        return frozenset(ids.setdefault(token, len(ids)) for token in tokens)
+
+
+def set_jaccard(set1: FrozenSet, set2: FrozenSet) -> float:
+    """
+    已分词集合的 Jaccard 相似度 / Jaccard similarity of pre-tokenized sets
+    """
+    if not set1 or not set2:
+        return 0.0
+    intersection = len(set1 & set2)
+    return intersection / (len(set1) + len(set2) - intersection)
+
+
+def normalize_name(name: str) -> str:
+    """规范化名称 / Normalize a name"""
+    return name.lower().strip() if name else ""
+
+
+def text_fingerprint(text: str) -> str:
+    """描述内容指纹，用作签名缓存键 / Description fingerprint used as the signature cache key"""
+    return hashlib.sha1(text.encode("utf-8")).hexdigest()[:16]
 
 
 def jaccard_similarity(str1: str, str2: str) -> float:
@@ -116,8 +259,8 @@ def jaccard_similarity(str1: str, str2: str) -> float:
         return 0.0
 
     # 分词
-    words1 = set(re.findall(r"\w+", str1.lower()))
-    words2 = set(re.findall(r"\w+", str2.lower()))
+    words1 = tokenize(str1)
+    words2 = tokenize(str2)
 
     if not words1 or not words2:
         return 0.0
@@ -159,6 +302,142 @@ def levenshtein_distance(s1: str, s2: str) -> int:
     return previous_row[-1]
 
 
+def bounded_levenshtein(s1: str, s2: str, max_dist: int) -> int:
+    """
+    带上限的编辑距离 / Edit distance with an upper bound
+
+    只计算对角线两侧 max_dist 宽的带状区域，整行都超过上限时提前退出。
+    Only fills the band of width max_dist around the diagonal and exits early
+    once a whole row exceeds the bound.
+
+    Returns:
+        编辑距离；超过 max_dist 时返回 max_dist + 1 / Edit distance, or max_dist + 1 when it exceeds max_dist
+    """
+    if len(s1) < len(s2):
+        s1, s2 = s2, s1
+
+    n, m = len(s1), len(s2)
+    if n - m > max_dist:
+        return max_dist + 1
+    if m == 0:
+        return n
+
+    over = max_dist + 1
+    previous_row = [j if j <= max_dist else over for j in range(m + 1)]
+
+    for i in range(1, n + 1):
+        lo = max(1, i - max_dist)
+        hi = min(m, i + max_dist)
+        current_row = [over] * (m + 1)
+        current_row[0] = i if i <= max_dist else over
+        c1 = s1[i - 1]
+        row_min = current_row[0]
+
+        for j in range(lo, hi + 1):
+            cost = previous_row[j - 1] + (c1 != s2[j - 1])
+            insert = current_row[j - 1] + 1
+            delete = previous_row[j] + 1
+            value = min(cost, insert, delete, over)
+            current_row[j] = value
+            if value < row_min:
+                row_min = value
+
+        if row_min > max_dist:
+            return over
+        previous_row = current_row
+
+    return min(previous_row[m], over)
+
+
+def name_edit_budget(threshold: float) -> float:
+    """
+    名称相似度阈值对应的编辑距离比例上限 / Edit-distance ratio allowed by a name threshold
+
+    相似度 = 0.4 * jaccard + 0.6 * (1 - d / L)，jaccard ≤ 1，
+    因此达到阈值需要 d ≤ L * (1 - threshold) / 0.6。
+    similarity = 0.4 * jaccard + 0.6 * (1 - d / L) with jaccard ≤ 1,
+    so reaching the threshold needs d ≤ L * (1 - threshold) / 0.6.
+    """
+    return (1 - threshold) / 0.6
+
+
+def padded_trigrams(text: str) -> Counter:
+    """
+    两侧各补两个空位的三元组多重集 / Trigram multiset with two pad characters on each side
+
+    长度为 n 的字符串有 n + 2 个三元组，每次编辑最多破坏 3 个。
+    A string of length n has n + 2 trigrams and each edit destroys at most 3 of them.
+    """
+    padded = f"\x00\x00{text}\x00\x00"
+    return Counter(padded[i : i + 3] for i in range(len(padded) - 2))
+
+
+class TrigramIndex:
+    """
+    名称三元组倒排索引 / Trigram inverted index over names
+
+    用 q-gram 计数过滤：编辑距离 ≤ k 的两个字符串至少共享
+    max(|x|, |y|) + 2 - 3k 个三元组，只有通过过滤的名称才需要计算编辑距离。
+    Uses the q-gram count filter: strings within edit distance k share at least
+    max(|x|, |y|) + 2 - 3k trigrams, so only names passing the filter get an edit distance.
+    """
+
+    def __init__(self):
+        self.postings: Dict[str, List[Tuple[int, int]]] = defaultdict(list)
+        self.lengths: Dict[int, int] = {}
+        self.by_length: Dict[int, List[int]] = defaultdict(list)
+
+    def add(self, key: int, name: str):
+        """加入名称 / Add a name"""
+        if not name:
+            return
+        self.lengths[key] = len(name)
+        self.by_length[len(name)].append(key)
+        for gram, count in padded_trigrams(name).items():
+            self.postings[gram].append((key, count))
+
+    def candidates(self, name: str, edit_budget: float) -> List[int]:
+        """
+        查找可能在编辑距离预算内的名称 / Find names that may be within the edit budget
+
+        Args:
+            name: 规范化后的名称 / Normalized name
+            edit_budget: 允许的编辑距离 / 较长名称长度之比 / Allowed edit distance / longer name length
+
+        Returns:
+            候选键列表（升序）/ Candidate keys in ascending order
+        """
+        q = len(name)
+        if not name or edit_budget >= 1:
+            return sorted(self.lengths)
+
+        # 长度过滤：|x| - |y| ≤ k ≤ budget * max(|x|, |y|) / Length filter
+        lo = q - int(edit_budget * q)
+        hi = int(q / (1 - edit_budget))
+
+        def required(length: int) -> int:
+            longer = max(q, length)
+            return longer + 2 - 3 * int(edit_budget * longer + 1e-9)
+
+        shared: Dict[int, int] = defaultdict(int)
+        for gram, count in padded_trigrams(name).items():
+            for key, key_count in self.postings.get(gram, ()):
+                shared[key] += min(count, key_count)
+
+        result = [
+            key
+            for key, common in shared.items()
+            if lo <= self.lengths[key] <= hi and common >= required(self.lengths[key])
+        ]
+
+        # 过滤下限 ≤ 0 的长度，即使没有共享三元组也可能匹配 / Lengths whose bound is ≤ 0 match even with no shared trigram
+        for length in range(max(lo, 1), hi + 1):
+            if required(length) <= 0:
+                result.extend(key for key in self.by_length.get(length, ()) if key not in shared)
+
+        return sorted(result)
+
+
 def name_similarity(name1: str, name2: str) -> float:
     """
     计算名称相似度 / Calculate name similarity
@@ -173,79 +452,96 @@ def name_similarity(name1: str, name2: str) -> float:
     Returns:
         相似度 (0-1) / Similarity (0-1)
     """
+    name1 = normalize_name(name1)
+    name2 = normalize_name(name2)
+    return prepared_name_similarity(name1, tokenize(name1), name2, tokenize(name2))
+
+
+def prepared_name_similarity(
+    name1: str, tokens1: FrozenSet, name2: str, tokens2: FrozenSet, threshold: Optional[float] = None
+) -> float:
+    """
+    已规范化名称的相似度 / Similarity of normalized names
+
+    与 name_similarity() 相同，但名称已规范化、词集合已预先计算。
+    给出 threshold 时使用带上限的编辑距离，确定低于阈值的名称返回 0.0。
+    Same as name_similarity() but with normalized names and precomputed token sets.
+    With a threshold the edit distance is bounded and names certain to fall below it return 0.0.
+    """
     if not name1 or not name2:
         return 0.0
 
-    name1 = name1.lower().strip()
-    name2 = name2.lower().strip()
-
     # 完全匹配
     if name1 == name2:
         return 1.0
 
     # Jaccard 相似度
-    jaccard = jaccard_similarity(name1, name2)
+    jaccard = set_jaccard(tokens1, tokens2)
 
     # 归一化编辑距离
     max_len = max(len(name1), len(name2))
-    edit_dist = levenshtein_distance(name1, name2)
+    if threshold is None:
+        edit_dist = levenshtein_distance(name1, name2)
+    else:
+        max_dist = int(name_edit_budget(threshold) * max_len + 1e-9)
+        edit_dist = bounded_levenshtein(name1, name2, max_dist)
+        if edit_dist > max_dist:
+            return 0.0
     normalized_edit = 1 - (edit_dist / max_len)
 
     # 加权平均
     return 0.4 * jaccard + 0.6 * normalized_edit
 
 
-def load_existing_resources() -> List[dict]:
-    """加载现有资源 / Load existing resources"""
-    resources = []
-
-    # 从 CSV 加载
-    csv_file = PROJECT_ROOT / "THE_RESOURCES_TABLE.csv"
-    if csv_file.exists():
-        with open(csv_file, "r", encoding="utf-8") as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                row["_source"] = "csv"
-                resources.append(row)
+def _load_partition(source: str) -> List[dict]:
+    """
+    经由资源索引加载一个分区 / Load one partition through the resource index
 
+    只刷新该分区的源文件，读完即关闭索引连接。
+    Only that partition's source file is refreshed, and the index connection is closed after reading.
+    """
+    with UrlIndex(sources={source: INDEX_SOURCES[source]}) as index:
+        resources = index.resources(source)
+    for r in resources:
+        r["_source"] = source
     return resources
 
 
+def load_existing_resources() -> List[dict]:
+    """加载现有资源（经由资源索引）/ Load existing resources (through the resource index)"""
+    return _load_partition("csv")
+
+
 def load_pending_resources() -> List[dict]:
-    """加载待审核资源 / Load pending resources"""
-    pending_file = PROJECT_ROOT / "candidates" / "pending_resources.json"
-    if pending_file.exists():
-        with open(pending_file, "r", encoding="utf-8") as f:
-            data = json.load(f)
-            resources = data.get("resources", [])
-            for r in resources:
-                r["_source"] = "pending"
-            return resources
-    return []
+    """加载待审核资源（经由资源索引）/ Load pending resources (through the resource index)"""
+    return _load_partition("pending")
 
 
 def load_rejected_resources() -> List[dict]:
-    """加载已拒绝资源 / Load rejected resources"""
-    rejected_file = PROJECT_ROOT / "candidates" / "rejected_resources.json"
-    if rejected_file.exists():
-        with open(rejected_file, "r", encoding="utf-8") as f:
-            data = json.load(f)
-            resources = data.get("resources", [])
-            for r in resources:
-                r["_source"] = "rejected"
-            return resources
-    return []
+    """加载已拒绝资源（经由资源索引）/ Load rejected resources (through the resource index)"""
+    return _load_partition("rejected")
 
 
 class DuplicateDetector:
     """重复检测器 / Duplicate Detector"""
 
-    def __init__(self, config: dict = None):
+    def __init__(
+        self,
+        config: dict = None,
+        rebuild_index: bool = False,
+        existing_resources: Optional[List[dict]] = None,
+        rejected_resources: Optional[List[dict]] = None,
+        persist_index: bool = True,
+    ):
         """
         初始化检测器 / Initialize detector
 
         Args:
             config: 配置 / Configuration
+            rebuild_index: 忽略缓存的 MinHash 签名并重建 / Ignore cached MinHash signatures and rebuild
+            existing_resources: 现有资源，默认从 CSV 加载 / Existing resources, loaded from the CSV by default
+            rejected_resources: 已拒绝资源，默认从 JSON 加载 / Rejected resources, loaded from JSON by default
+            persist_index: 是否读写签名缓存文件 / Whether to read and write the signature cache file
         """
         self.config = config or load_config()
         self.dedup_config = self.config.get("deduplication", {})
@@ -254,9 +550,15 @@ class DuplicateDetector:
         self.name_threshold = self.dedup_config.get("name_similarity_threshold", 0.85)
         self.desc_threshold = self.dedup_config.get("description_similarity_threshold", 0.80)
 
+        # MinHash / LSH 参数
+        self.num_perm = self.dedup_config.get("minhash_num_perm", DEFAULT_NUM_PERM)
+        self.lsh_bands = self.dedup_config.get("lsh_bands", DEFAULT_LSH_BANDS)
+        self.rebuild_index = rebuild_index
+        self.persist_index = persist_index
+
         # 加载资源
-        self.existing_resources = load_existing_resources()
-        self.rejected_resources = load_rejected_resources()
+        self.existing_resources = existing_resources if existing_resources is not None else load_existing_resources()
+        self.rejected_resources = rejected_resources if rejected_resources is not None else load_rejected_resources()
 
         # 构建索引
         self._build_indexes()
@@ -265,15 +567,19 @@ class DuplicateDetector:
         """构建索引以加速查找 / Build indexes for faster lookup"""
         self.url_index = {}  # normalized_url -> resource
         self.github_index = {}  # (owner, repo) -> resource
-        self.name_index = defaultdict(list)  # first_word -> [resources]
+        self.name_trigrams = TrigramIndex()  # normalized name trigrams -> corpus positions
 
-        all_resources = self.existing_resources + self.rejected_resources
+        # 预分词语料：与 self.corpus 按位置对齐 / Pre-tokenized corpus aligned with self.corpus by position
+        self.corpus = self.existing_resources + self.rejected_resources
+        self.vocab = TokenVocabulary()
+        self.corpus_names: List[str] = []
+        self.corpus_name_tokens: List[FrozenSet[int]] = []
 
-        for res in all_resources:
+        for position, res in enumerate(self.corpus):
             url = res.get("PrimaryLink", "")
 
             # URL 索引
-            normalized = normalize_url(url, self.config)
+            normalized = canonical_url(url)
             if normalized:
                 self.url_index[normalized] = res
 
@@ -282,12 +588,90 @@ class DuplicateDetector:
             if github_repo:
                 self.github_index[github_repo] = res
 
-            # 名称索引（用于加速相似度搜索）
-            name = res.get("DisplayName", "")
-            if name:
-                words = name.lower().split()
-                if words:
-                    self.name_index[words[0]].append(res)
+            # 规范化名称和词 id / Normalized name and token ids
+            name = normalize_name(res.get("DisplayName", ""))
+            self.corpus_names.append(name)
+            self.corpus_name_tokens.append(self.vocab.intern(tokenize(name)))
+
+            # 名称三元组索引（用于加速相似度搜索）
+            self.name_trigrams.add(position, name)
+
+        # 描述 MinHash / LSH 索引
+        self._build_description_index()
+
+    def _load_signature_cache(self) -> Dict[str, str]:
+        """
+        加载缓存的签名 / Load cached signatures
+
+        参数不一致或要求重建时返回空字典。
+        Returns an empty dict when the parameters differ or a rebuild is requested.
+        """
+        if self.rebuild_index or not DEDUP_INDEX_FILE.exists():
+            return {}
+
+        try:
+            with open(DEDUP_INDEX_FILE, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return {}
+
+        if data.get("num_perm") != self.num_perm or data.get("seed") != MINHASH_SEED:
+            return {}
+        return data.get("signatures", {})
+
+    def _save_signature_cache(self, signatures: Dict[str, str]):
+        """保存签名缓存 / Save the signature cache"""
+        data = {
+            "_comment": "重复检测 MinHash 签名缓存（按描述指纹）/ Dedup MinHash signature cache keyed by description fingerprint",
+            "_schema_version": "1.0",
+            "num_perm": self.num_perm,
+            "seed": MINHASH_SEED,
+            "updated_at": datetime.now().isoformat(),
+            "signatures": signatures,
+        }
+        DEDUP_INDEX_FILE.parent.mkdir(parents=True, exist_ok=True)
+        with open(DEDUP_INDEX_FILE, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+
+    def _build_description_index(self):
+        """
+        构建描述 MinHash / LSH 索引 / Build the description MinHash / LSH index
+
+        签名按描述指纹缓存，只有新增或修改过的描述需要重新计算。
+        Signatures are cached by description fingerprint; only new or edited descriptions are hashed.
+        """
+        self.minhasher = MinHasher(self.num_perm)
+        self.desc_lsh = MinHashLSH(self.num_perm, self.lsh_bands)
+        self.corpus_desc_tokens: List[FrozenSet[int]] = []
+        self.desc_indexed = 0
+
+        cached = self._load_signature_cache() if self.persist_index else {}
+        signatures: Dict[str, str] = {}
+        computed = 0
+
+        for position, res in enumerate(self.corpus):
+            res_desc = res.get("Description", "") or res.get("Description_ZH", "")
+            tokens = tokenize(res_desc)
+            self.corpus_desc_tokens.append(self.vocab.intern(tokens))
+            if not tokens:
+                continue
+
+            fingerprint = text_fingerprint(res_desc)
+            packed = cached.get(fingerprint) or signatures.get(fingerprint)
+            if packed:
+                signature = unpack_signature(packed)
+            else:
+                signature = self.minhasher.signature(tokens)
+                packed = pack_signature(signature)
+                computed += 1
+            signatures[fingerprint] = packed
+
+            self.desc_lsh.add(position, signature)
+            self.desc_indexed += 1
+
+        # 有新签名或缓存中有过期条目时写回 / Write back when signatures were added or went stale
+        if self.persist_index and (computed or self.rebuild_index or set(cached) != set(signatures)):
+            self._save_signature_cache(signatures)
 
     def check_url_duplicate(self, url: str) -> Optional[dict]:
         """
@@ -299,7 +683,7 @@ class DuplicateDetector:
         Returns:
             重复的资源或 None / Duplicate resource or None
         """
-        normalized = normalize_url(url, self.config)
+        normalized = canonical_url(url)
         if normalized in self.url_index:
             return self.url_index[normalized]
         return None
@@ -319,77 +703,90 @@ class DuplicateDetector:
             return self.github_index[github_repo]
         return None
 
-    def check_name_similarity(self, name: str) -> List[Tuple[dict, float]]:
+    def _similar_name_positions(self, name: str, threshold: float) -> List[Tuple[int, float]]:
         """
-        检查名称相似度 / Check name similarity
-
-        Args:
-            name: 要检查的名称 / Name to check
+        相似名称在语料中的位置 / Corpus positions of similar names
 
         Returns:
-            相似资源列表 [(resource, similarity), ...] / List of similar resources
+            [(position, similarity), ...]，按相似度降序 / sorted by similarity, descending
         """
         similar = []
 
         if not name:
             return similar
 
-        # 使用索引缩小搜索范围
-        words = name.lower().split()
-        candidates = set()
-
-        for word in words[:3]:  # 只用前3个词
-            for res in self.name_index.get(word, []):
-                candidates.add(id(res))
+        query = normalize_name(name)
+        query_tokens = self.vocab.intern(tokenize(query))
 
-        # 如果候选太少，搜索所有
-        if len(candidates) < 10:
-            all_resources = self.existing_resources + self.rejected_resources
-        else:
-            all_resources = [r for r in (self.existing_resources + self.rejected_resources) if id(r) in candidates]
+        # 三元组索引 + 长度过滤缩小搜索范围 / Trigram index and length filter narrow the search
+        positions = self.name_trigrams.candidates(query, name_edit_budget(threshold))
 
-        for res in all_resources:
-            res_name = res.get("DisplayName", "")
-            similarity = name_similarity(name, res_name)
+        names = self.corpus_names
+        name_tokens = self.corpus_name_tokens
+        for i in positions:
+            similarity = prepared_name_similarity(query, query_tokens, names[i], name_tokens[i], threshold=threshold)
 
-            if similarity >= self.name_threshold:
-                similar.append((res, similarity))
+            if similarity >= threshold:
+                similar.append((i, similarity))
 
         # 按相似度排序
         similar.sort(key=lambda x: x[1], reverse=True)
 
         return similar
 
-    def check_description_similarity(self, description: str) -> List[Tuple[dict, float]]:
+    def _similar_description_positions(self, description: str, threshold: float) -> List[Tuple[int, float]]:
         """
-        检查描述相似度 / Check description similarity
-
-        Args:
-            description: 要检查的描述 / Description to check
+        相似描述在语料中的位置 / Corpus positions of similar descriptions
 
         Returns:
-            相似资源列表 [(resource, similarity), ...] / List of similar resources
+            [(position, similarity), ...]，按相似度降序 / sorted by similarity, descending
         """
         similar = []
 
         if not description or len(description) < 20:
             return similar
 
-        all_resources = self.existing_resources + self.rejected_resources
-
-        for res in all_resources:
-            res_desc = res.get("Description", "") or res.get("Description_ZH", "")
-            if not res_desc:
-                continue
+        tokens = tokenize(description)
+        if not tokens:
+            return similar
 
-            similarity = jaccard_similarity(description, res_desc)
+        # LSH 候选 + 精确 Jaccard 校验 / LSH candidates verified with exact Jaccard
+        signature = self.minhasher.signature(tokens)
+        token_ids = self.vocab.intern(tokens)
+        for position in sorted(self.desc_lsh.query(signature)):
+            similarity = set_jaccard(token_ids, self.corpus_desc_tokens[position])
 
-            if similarity >= self.desc_threshold:
-                similar.append((res, similarity))
+            if similarity >= threshold:
+                similar.append((position, similarity))
 
         similar.sort(key=lambda x: x[1], reverse=True)
 
-        return similar[:5]  # 只返回前5个
+        return similar
+
+    def check_name_similarity(self, name: str) -> List[Tuple[dict, float]]:
+        """
+        检查名称相似度 / Check name similarity
+
+        Args:
+            name: 要检查的名称 / Name to check
+
+        Returns:
+            相似资源列表 [(resource, similarity), ...] / List of similar resources
+        """
+        return [(self.corpus[i], s) for i, s in self._similar_name_positions(name, self.name_threshold)]
+
+    def check_description_similarity(self, description: str) -> List[Tuple[dict, float]]:
+        """
+        检查描述相似度 / Check description similarity
+
+        Args:
+            description: 要检查的描述 / Description to check
+
+        Returns:
+            相似资源列表 [(resource, similarity), ...] / List of similar resources
+        """
+        similar = self._similar_description_positions(description, self.desc_threshold)
+        return [(self.corpus[i], s) for i, s in similar[:5]]  # 只返回前5个
 
     def check_resource(self, resource: dict) -> dict:
         """
@@ -453,7 +850,7 @@ class DuplicateDetector:
 
         if name_similar:
             best_match, best_score = name_similar[0]
-            if best_score >= 0.95:  # 非常相似
+            if best_score >= DUPLICATE_SIMILARITY:  # 非常相似
                 result["is_duplicate"] = True
                 result["duplicate_type"] = "name_similar"
                 result["matched_resource"] = best_match
@@ -469,7 +866,7 @@ class DuplicateDetector:
 
         if desc_similar:
             best_match, best_score = desc_similar[0]
-            if best_score >= 0.95:  # 非常相似
+            if best_score >= DUPLICATE_SIMILARITY:  # 非常相似
                 result["is_duplicate"] = True
                 result["duplicate_type"] = "description_similar"
                 result["matched_resource"] = best_match
@@ -494,6 +891,168 @@ class DuplicateDetector:
 
         return results
 
+    def cluster_pending(self, pending: Optional[List[dict]] = None) -> List[dict]:
+        """
+        将待审核队列内部聚类为重复组 / Cluster the pending queue into duplicate groups
+
+        在待审核资源上建立与主语料相同的 URL / GitHub / 三元组 / LSH 索引，每个资源只查询
+        一次索引，命中即用并查集合并，整体近似线性。除 PrimaryLink 外，爬虫记录的原始链接
+        也参与匹配；npm / PyPI 页面按包名与 GitHub 仓库关联：作用域包要求 scope/name 与 owner/repo
+        一致，无作用域的包只在待审核队列中恰好一个仓库同名时才关联。
+        Builds the same URL / GitHub / trigram / LSH indexes over the pending items, queries
+        them once per item and unions every hit, so the pass is roughly linear. Original links
+        recorded by crawlers are matched alongside PrimaryLink, and npm / PyPI pages are tied
+        to a GitHub repo by name: a scoped package needs scope/name to equal owner/repo, and an
+        unscoped package is only tied when exactly one pending repo has that name.
+
+        Args:
+            pending: 待审核资源，默认从 JSON 加载 / Pending resources, loaded from JSON by default
+
+        Returns:
+            重复组列表（按大小降序）/ Duplicate groups, largest first:
+            [{"canonical": resource, "duplicates": [resource, ...], "matches": [(id, id, type, score), ...]}]
+        """
+        pending = pending if pending is not None else load_pending_resources()
+        batch = DuplicateDetector(self.config, existing_resources=pending, rejected_resources=[], persist_index=False)
+
+        uf = UnionFind(len(pending))
+        matches: Dict[int, List[Tuple[int, int, str, float]]] = defaultdict(list)
+
+        def link(a: int, b: int, match_type: str, score: float):
+            # 只记录真正合并两个集合的边，即每组的一棵生成树
+            # Only edges that merge two sets are kept, i.e. one spanning tree per group
+            if uf.union(a, b):
+                matches[a].append((a, b, match_type, score))
+
+        first_seen: Dict[Tuple[str, object], int] = {}
+        package_owners: Dict[str, List[int]] = defaultdict(list)  # package name -> positions
+        repo_positions: Dict[str, List[int]] = defaultdict(list)  # "owner/repo" -> positions
+        repos_by_name: Dict[str, Set[str]] = defaultdict(set)  # "repo" -> {"owner/repo", ...}
+
+        for position, res in enumerate(pending):
+            links = [res.get(key, "") for key in ("PrimaryLink", "_original_url", "_original_link")]
+            links = [url for url in links if url]
+
+            keys = set()
+            for url in links:
+                normalized = canonical_url(url)
+                if normalized:
+                    keys.add(("url_exact", normalized))
+                github_repo = extract_github_repo(url)
+                if github_repo:
+                    keys.add(("github_repo", github_repo))
+                    repo_positions["/".join(github_repo)].append(position)
+                    repos_by_name[github_repo[1]].add("/".join(github_repo))
+
+            # SecondaryLink 常是主页或组织仓库，只用其中的 npm / PyPI 包名
+            # SecondaryLink is often a homepage or org repo; only its npm / PyPI package name is used
+            for url in links + [res.get("SecondaryLink", "")]:
+                package = extract_package_name(url)
+                if package and position not in package_owners[package]:
+                    package_owners[package].append(position)
+
+            for key in sorted(keys, key=str):
+                other = first_seen.setdefault(key, position)
+                if other != position:
+                    link(other, position, key[0], 1.0)
+
+            name = res.get("DisplayName", "")
+            for other, score in batch._similar_name_positions(name, DUPLICATE_SIMILARITY):
+                if other != position:
+                    link(other, position, "name_similar", score)
+
+            description = res.get("Description", "") or res.get("Description_ZH", "")
+            for other, score in batch._similar_description_positions(description, DUPLICATE_SIMILARITY):
+                if other != position:
+                    link(other, position, "description_similar", score)
+
+        # 包页面 ↔ 同名包页面 / 对应的 GitHub 仓库 / Package pages ↔ same-name packages / the matching GitHub repo
+        for package, positions in package_owners.items():
+            if "/" in package:
+                repo = package
+            else:
+                # 多个仓库同名时无法判断属于哪一个 / Ambiguous when several repos share the name
+                same_name = repos_by_name.get(package, set())
+                repo = next(iter(same_name)) if len(same_name) == 1 else None
+            for other in positions[1:] + repo_positions.get(repo, []):
+                if other != positions[0]:
+                    link(positions[0], other, "package_name", 1.0)
+
+        groups = []
+        for members in uf.groups():
+            if len(members) < 2:
+                continue
+            canonical = min(members, key=lambda i: canonical_rank(pending[i], i))
+            groups.append(
+                {
+                    "canonical": pending[canonical],
+                    "duplicates": [pending[i] for i in members if i != canonical],
+                    "matches": [
+                        (pending[a].get("ID", ""), pending[b].get("ID", ""), match_type, score)
+                        for i in members
+                        for a, b, match_type, score in matches[i]
+                    ],
+                }
+            )
+
+        groups.sort(key=lambda g: len(g["duplicates"]), reverse=True)
+        return groups
+
+
+def canonical_rank(resource: dict, position: int) -> tuple:
+    """
+    重复组中选择保留项的排序键（越小越优先）/ Sort key for the canonical pick in a group (smaller wins)
+
+    优先 GitHub 仓库，其次相关性分数、星标数，最后是最早发现的。
+    Prefers a GitHub repo, then relevance score, then stars, then the earliest discovery.
+    """
+    stars = resource.get("_stars") or resource.get("_github_stars") or 0
+    return (
+        extract_github_repo(resource.get("PrimaryLink", "")) is None,
+        -(resource.get("_relevance_score") or 0),
+        -stars,
+        resource.get("_discovered_at", ""),
+        position,
+    )
+
+
+def generate_batch_report(groups: List[dict], total: int) -> str:
+    """
+    生成待审核队列内部去重报告 / Generate the pending-queue batch dedup report
+
+    Args:
+        groups: cluster_pending() 的结果 / Result of cluster_pending()
+        total: 待审核资源总数 / Number of pending resources
+
+    Returns:
+        报告内容 / Report content
+    """
+    redundant = sum(len(g["duplicates"]) for g in groups)
+    lines = [
+        "# 待审核队列去重报告 / Pending Queue Dedup Report",
+        f"\n生成时间: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
+        "\n---\n",
+        "## 统计摘要 / Summary",
+        f"- 待审核总数: {total}",
+        f"- 重复组: {len(groups)}",
+        f"- 可移除的重复项: {redundant}",
+        "\n---\n",
+    ]
+
+    for number, group in enumerate(groups, 1):
+        canonical = group["canonical"]
+        lines.append(f"### {number}. {canonical.get('DisplayName', 'Unknown')}")
+        lines.append(f"\n保留 / Keep: `{canonical.get('ID', '')}` {canonical.get('PrimaryLink', '')}\n")
+        lines.append("| 重复资源 | ID | 链接 |")
+        lines.append("|---------|----|------|")
+        for res in group["duplicates"]:
+            lines.append(f"| {res.get('DisplayName', '')} | {res.get('ID', '')} | {res.get('PrimaryLink', '')} |")
+        lines.append("")
+        lines.append("匹配依据 / Matched by: " + ", ".join(f"{a}↔{b} ({t} {s:.2f})" for a, b, t, s in group["matches"]))
+        lines.append("")
+
+    return "\n".join(lines)
+
 
 def generate_report(results: List[dict]) -> str:
     """
@@ -556,10 +1115,16 @@ def main():
     """主函数 / Main function"""
     parser = argparse.ArgumentParser(description="Duplicate detection")
     parser.add_argument("--check-pending", action="store_true", help="Check pending resources")
+    parser.add_argument(
+        "--batch", action="store_true", help="Cluster pending resources against each other into duplicate groups"
+    )
     parser.add_argument("--report", action="store_true", help="Generate report")
     parser.add_argument("--output", type=str, help="Output file for report")
     parser.add_argument("--url", type=str, help="Check specific URL")
     parser.add_argument("--name", type=str, help="Check specific name")
+    parser.add_argument(
+        "--rebuild-index", action="store_true", help="Rebuild and persist the MinHash description index"
+    )
     args = parser.parse_args()
 
     print("🔍 重复检测 / Duplicate Detection")
@@ -567,10 +1132,15 @@ def main():
 
     # 加载配置
     config = load_config()
-    detector = DuplicateDetector(config)
+    detector = DuplicateDetector(config, rebuild_index=args.rebuild_index)
 
     print(f"\n📊 已加载 {len(detector.existing_resources)} 个现有资源")
     print(f"   已加载 {len(detector.rejected_resources)} 个已拒绝资源")
+    print(f"   描述索引: {detector.desc_indexed} 个签名，{len(detector.desc_lsh.buckets)} 个 LSH 桶")
+
+    if args.rebuild_index and not (args.url or args.name or args.check_pending or args.batch):
+        print(f"\n✅ 已重建描述索引: {DEDUP_INDEX_FILE.relative_to(PROJECT_ROOT)}")
+        return 0
 
     # 单个 URL 检查
     if args.url:
@@ -630,6 +1200,33 @@ def main():
 
         return 0
 
+    # 待审核队列内部去重
+    if args.batch:
+        print("\n🧩 待审核队列内部聚类...")
+        pending = load_pending_resources()
+        groups = detector.cluster_pending(pending)
+        redundant = sum(len(g["duplicates"]) for g in groups)
+        print(f"\n   聚类完成: {len(pending)} 个资源，{len(groups)} 个重复组，{redundant} 个重复项")
+
+        for group in groups:
+            canonical = group["canonical"]
+            print(f"\n   ✅ 保留: {canonical.get('DisplayName')} ({canonical.get('PrimaryLink')})")
+            for res in group["duplicates"]:
+                print(f"   - 重复: {res.get('DisplayName')} ({res.get('PrimaryLink')})")
+
+        if args.report:
+            report = generate_batch_report(groups, len(pending))
+
+            if args.output:
+                output_file = Path(args.output)
+                with open(output_file, "w", encoding="utf-8") as f:
+                    f.write(report)
+                print(f"\n   📄 报告已保存: {output_file}")
+            else:
+                print("\n" + report)
+
+        return 0
+
     # 默认：显示帮助
     parser.print_help()
     return 0
@@ -21,13 +21,18 @@ import sys
 from collections import Counter, defaultdict
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Set, Tuple
+from typing import Dict, List, Optional, Tuple
 
 import requests
 import yaml
 
 # 项目根目录 / Project root
 PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from scripts.candidate_store import get_candidate_store
+from scripts.github_client import get_client
+from scripts.url_index import UrlIndex, canonical_url
 
 
 def load_categories() -> dict:
@@ -52,33 +57,6 @@ def load_existing_resources() -> List[dict]:
     return resources
 
 
-def load_existing_urls() -> Set[str]:
-    """加载所有已存在的 URL / Load all existing URLs"""
-    urls = set()
-
-    # 从 CSV 加载
-    csv_file = PROJECT_ROOT / "THE_RESOURCES_TABLE.csv"
-    if csv_file.exists():
-        with open(csv_file, "r", encoding="utf-8") as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                url = row.get("PrimaryLink", "").strip().rstrip("/").lower()
-                if url:
-                    urls.add(url)
-
-    # 从 pending 加载
-    pending_file = PROJECT_ROOT / "candidates" / "pending_resources.json"
-    if pending_file.exists():
-        with open(pending_file, "r", encoding="utf-8") as f:
-            data = json.load(f)
-            for res in data.get("resources", []):
-                url = res.get("PrimaryLink", "").strip().rstrip("/").lower()
-                if url:
-                    urls.add(url)
-
-    return urls
-
-
 def extract_github_info(url: str) -> Optional[Tuple[str, str]]:
     """从 URL 提取 GitHub owner/repo / Extract GitHub owner/repo from URL"""
     if "github.com" not in url:
@@ -112,14 +90,11 @@ class DependencyAnalyzer:
 
     def __init__(self):
         self.github_token = os.environ.get("GITHUB_TOKEN")
-        self.session = requests.Session()
-        self.session.headers["User-Agent"] = "AwesomeClaudeCode-Bot/1.0"
-
-        if self.github_token:
-            self.session.headers["Authorization"] = f"Bearer {self.github_token}"
+        # 共享 GitHub 客户端（连接池 + 速率限制）/ Shared GitHub client (pooling + rate limits)
+        self.client = get_client(self.github_token)
 
         self.categories_prefix = load_categories()
-        self.existing_urls = load_existing_urls()
+        self.existing_urls = UrlIndex()
 
         # 依赖统计
         self.dependency_counts = Counter()
@@ -139,13 +114,13 @@ class DependencyAnalyzer:
         """
         url = f"https://raw.githubusercontent.com/{owner}/{repo}/main/{path}"
         try:
-            response = self.session.get(url, timeout=30)
+            response = self.client.get(url, timeout=30)
             if response.status_code == 200:
                 return response.text
 
             # 尝试 master 分支
             url = f"https://raw.githubusercontent.com/{owner}/{repo}/master/{path}"
-            response = self.session.get(url, timeout=30)
+            response = self.client.get(url, timeout=30)
             if response.status_code == 200:
                 return response.text
 
@@ -337,7 +312,7 @@ class DependencyAnalyzer:
             # 尝试找到包的 GitHub 仓库
             package_url = self._find_package_repo(dep)
 
-            if package_url and package_url.lower() not in self.existing_urls:
+            if package_url and package_url not in self.existing_urls:
                 candidate = self._create_candidate(dep, package_url, count)
                 if candidate:
                     candidates.append(candidate)
@@ -357,7 +332,7 @@ class DependencyAnalyzer:
         # 尝试 npm
         npm_url = f"https://registry.npmjs.org/{package}"
         try:
-            response = self.session.get(npm_url, timeout=10)
+            response = self.client.get(npm_url, timeout=10)
             if response.status_code == 200:
                 data = response.json()
                 repo = data.get("repository", {})
@@ -380,7 +355,7 @@ class DependencyAnalyzer:
         # 尝试 PyPI
         pypi_url = f"https://pypi.org/pypi/{package}/json"
         try:
-            response = self.session.get(pypi_url, timeout=10)
+            response = self.client.get(pypi_url, timeout=10)
             if response.status_code == 200:
                 data = response.json()
                 info = data.get("info", {})
@@ -462,28 +437,20 @@ class DependencyAnalyzer:
 
 def add_to_pending(resources: List[dict]) -> int:
     """添加资源到待审核队列 / Add resources to pending queue"""
-    pending_file = PROJECT_ROOT / "candidates" / "pending_resources.json"
-
-    if pending_file.exists():
-        with open(pending_file, "r", encoding="utf-8") as f:
-            data = json.load(f)
-    else:
-        data = {"_comment": "候选资源队列 - 待审核的资源", "_schema_version": "1.0", "resources": []}
-
-    existing_urls = {r.get("PrimaryLink", "").lower() for r in data["resources"]}
-    added_count = 0
+    store = get_candidate_store()
+    seen_urls = set()
+    new_resources = []
 
     for res in resources:
-        url = res.get("PrimaryLink", "").lower()
-        if url and url not in existing_urls:
-            data["resources"].append(res)
-            existing_urls.add(url)
-            added_count += 1
+        url = canonical_url(res.get("PrimaryLink", ""))
+        if url and url not in seen_urls and not store.contains_url("pending", url):
+            new_resources.append(res)
+            seen_urls.add(url)
 
-    with open(pending_file, "w", encoding="utf-8") as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+    if new_resources:
+        store.append("pending", new_resources)
 
-    return added_count
+    return len(new_resources)
 
 
 def main():
@@ -530,6 +497,7 @@ def main():
 
             if not args.dry_run:
                 added = add_to_pending(candidates)
+                get_candidate_store().export()
                 print(f"\n✅ 已添加 {added} 个资源到候选队列")
             else:
                 print("\n[Dry Run] 跳过保存")
@@ -10,14 +10,13 @@ Discovers new Claude Code related projects via GitHub Topics and keyword search.
 """
 
 import argparse
-import csv
 import hashlib
 import json
 import os
 import sys
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, List, Optional, Set, Tuple
+from typing import Dict, List, Optional, Tuple
 from urllib.parse import urlparse
 
 import requests
@@ -25,6 +24,11 @@ import yaml
 
 # 项目根目录 / Project root
 PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from scripts.candidate_store import get_candidate_store
+from scripts.github_client import get_client
+from scripts.url_index import UrlIndex
 
 
 def load_config() -> dict:
@@ -42,46 +46,6 @@ def load_categories() -> dict:
     return {cat["id"]: cat["prefix"] for cat in data["categories"]}
 
 
-def load_existing_urls() -> Set[str]:
-    """
-    加载所有已存在的资源 URL（CSV + pending + rejected）
-    Load all existing resource URLs (CSV + pending + rejected)
-    """
-    urls = set()
-
-    # 从 CSV 加载
-    csv_file = PROJECT_ROOT / "THE_RESOURCES_TABLE.csv"
-    if csv_file.exists():
-        with open(csv_file, "r", encoding="utf-8") as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                url = row.get("PrimaryLink", "").strip().rstrip("/").lower()
-                if url:
-                    urls.add(url)
-
-    # 从 pending 加载
-    pending_file = PROJECT_ROOT / "candidates" / "pending_resources.json"
-    if pending_file.exists():
-        with open(pending_file, "r", encoding="utf-8") as f:
-            data = json.load(f)
-            for res in data.get("resources", []):
-                url = res.get("PrimaryLink", "").strip().rstrip("/").lower()
-                if url:
-                    urls.add(url)
-
-    # 从 rejected 加载
-    rejected_file = PROJECT_ROOT / "candidates" / "rejected_resources.json"
-    if rejected_file.exists():
-        with open(rejected_file, "r", encoding="utf-8") as f:
-            data = json.load(f)
-            for res in data.get("resources", []):
-                url = res.get("PrimaryLink", "").strip().rstrip("/").lower()
-                if url:
-                    urls.add(url)
-
-    return urls
-
-
 def load_discovery_log() -> dict:
     """加载发现日志 / Load discovery log"""
     log_file = PROJECT_ROOT / "candidates" / "discovery_log.json"
@@ -116,8 +80,6 @@ def github_search(query: str, token: Optional[str] = None, max_results: int = 50
         仓库列表 / List of repositories
     """
     headers = {"Accept": "application/vnd.github+json", "X-GitHub-Api-Version": "2022-11-28"}
-    if token:
-        headers["Authorization"] = f"Bearer {token}"
 
     repos = []
     page = 1
@@ -128,7 +90,7 @@ def github_search(query: str, token: Optional[str] = None, max_results: int = 50
         params = {"q": query, "sort": "stars", "order": "desc", "per_page": per_page, "page": page}
 
         try:
-            response = requests.get(url, headers=headers, params=params, timeout=30)
+            response = get_client(token).get(url, headers=headers, params=params, timeout=30)
             response.raise_for_status()
             data = response.json()
 
@@ -190,7 +152,7 @@ def search_by_keyword(keyword: str, config: dict, token: Optional[str] = None) -
     return github_search(query, token, max_results)
 
 
-def filter_repo(repo: dict, config: dict, existing_urls: Set[str]) -> Tuple[bool, str]:
+def filter_repo(repo: dict, config: dict, existing_urls: UrlIndex) -> Tuple[bool, str]:
     """
     过滤仓库 / Filter repository
 
@@ -217,8 +179,8 @@ def filter_repo(repo: dict, config: dict, existing_urls: Set[str]) -> Tuple[bool
         return False, "所有者在排除列表中 / Owner in exclusion list"
 
     # 检查是否已存在
-    html_url = repo.get("html_url", "").strip().rstrip("/").lower()
-    if html_url in existing_urls:
+    html_url = repo.get("html_url", "")
+    if html_url in existing_urls or existing_urls.lookup_github(html_url):
         return False, "已存在 / Already exists"
 
     # 检查 Star 数
@@ -416,23 +378,9 @@ def create_candidate_from_repo(repo: dict, config: dict, categories_prefix: dict
     }
 
 
-def add_to_pending(resource: dict, pending_file: Path) -> bool:
-    """添加资源到待审核队列 / Add resource to pending queue"""
-    if pending_file.exists():
-        with open(pending_file, "r", encoding="utf-8") as f:
-            data = json.load(f)
-    else:
-        data = {
-            "_comment": "候选资源队列 - 待审核的资源 / Candidate resource queue - resources pending review",
-            "_schema_version": "1.0",
-            "resources": [],
-        }
-
-    data["resources"].append(resource)
-
-    with open(pending_file, "w", encoding="utf-8") as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
-
+def add_to_pending(resource: dict) -> bool:
+    """添加资源到待审核队列（追加日志，不重写整个文件）/ Add resource to pending queue (journal append, no full rewrite)"""
+    get_candidate_store().append("pending", [resource])
     return True
 
 
@@ -458,7 +406,7 @@ def main():
     print("\n📂 加载配置...")
     config = load_config()
     categories_prefix = load_categories()
-    existing_urls = load_existing_urls()
+    existing_urls = UrlIndex()
     discovery_log = load_discovery_log()
 
     print(f"   已有资源数: {len(existing_urls)}")
@@ -523,7 +471,6 @@ def main():
 
     # 创建候选资源
     print(f"\n📦 创建候选资源 (限制 {args.limit} 个)...")
-    pending_file = PROJECT_ROOT / "candidates" / "pending_resources.json"
     added_count = 0
 
     for repo, score in candidates:
@@ -538,7 +485,7 @@ def main():
         if args.dry_run:
             print("      [Dry Run] 跳过添加")
         else:
-            add_to_pending(resource, pending_file)
+            add_to_pending(resource)
             added_count += 1
             print("      ✅ 已添加到候选队列")
 
@@ -552,8 +499,9 @@ def main():
                 }
             )
 
-    # 保存发现日志
+    # 日志合并进快照，保存发现日志
     if not args.dry_run:
+        get_candidate_store().export()
         discovery_log["last_run"] = datetime.now().isoformat()
         discovery_log["stats"]["total_discovered"] += len(candidates)
         discovery_log["stats"]["total_added"] += added_count
@@ -12,18 +12,22 @@ Discovers related repositories from existing resources (dependencies, forks, sim
 import argparse
 import csv
 import hashlib
-import json
 import os
 import sys
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Set, Tuple
+from typing import Dict, List, Optional, Tuple
 
 import requests
 import yaml
 
 # 项目根目录 / Project root
 PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from scripts.candidate_store import get_candidate_store
+from scripts.github_client import get_client
+from scripts.url_index import UrlIndex
 
 
 def load_config() -> dict:
@@ -55,43 +59,6 @@ def load_existing_resources() -> List[dict]:
     return resources
 
 
-def load_existing_urls() -> Set[str]:
-    """加载所有已存在的 URL / Load all existing URLs"""
-    urls = set()
-
-    # 从 CSV 加载
-    csv_file = PROJECT_ROOT / "THE_RESOURCES_TABLE.csv"
-    if csv_file.exists():
-        with open(csv_file, "r", encoding="utf-8") as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                url = row.get("PrimaryLink", "").strip().rstrip("/").lower()
-                if url:
-                    urls.add(url)
-
-    # 从 pending 加载
-    pending_file = PROJECT_ROOT / "candidates" / "pending_resources.json"
-    if pending_file.exists():
-        with open(pending_file, "r", encoding="utf-8") as f:
-            data = json.load(f)
-            for res in data.get("resources", []):
-                url = res.get("PrimaryLink", "").strip().rstrip("/").lower()
-                if url:
-                    urls.add(url)
-
-    # 从 rejected 加载
-    rejected_file = PROJECT_ROOT / "candidates" / "rejected_resources.json"
-    if rejected_file.exists():
-        with open(rejected_file, "r", encoding="utf-8") as f:
-            data = json.load(f)
-            for res in data.get("resources", []):
-                url = res.get("PrimaryLink", "").strip().rstrip("/").lower()
-                if url:
-                    urls.add(url)
-
-    return urls
-
-
 def extract_github_info(url: str) -> Optional[Tuple[str, str]]:
     """
     从 URL 提取 GitHub owner/repo 信息
@@ -121,13 +88,11 @@ def extract_github_info(url: str) -> Optional[Tuple[str, str]]:
 def get_repo_info(owner: str, repo: str, token: Optional[str] = None) -> Optional[dict]:
     """获取仓库信息 / Get repository info"""
     headers = {"Accept": "application/vnd.github+json", "X-GitHub-Api-Version": "2022-11-28"}
-    if token:
-        headers["Authorization"] = f"Bearer {token}"
 
     url = f"https://api.github.com/repos/{owner}/{repo}"
 
     try:
-        response = requests.get(url, headers=headers, timeout=30)
+        response = get_client(token).get(url, headers=headers, timeout=30)
         if response.status_code == 200:
             return response.json()
     except requests.exceptions.RequestException:
@@ -150,14 +115,12 @@ def get_forks(owner: str, repo: str, token: Optional[str] = None, limit: int = 3
         Fork 列表 / List of forks
     """
     headers = {"Accept": "application/vnd.github+json", "X-GitHub-Api-Version": "2022-11-28"}
-    if token:
-        headers["Authorization"] = f"Bearer {token}"
 
     url = f"https://api.github.com/repos/{owner}/{repo}/forks"
     params = {"sort": "stargazers", "per_page": min(100, limit)}
 
     try:
-        response = requests.get(url, headers=headers, params=params, timeout=30)
+        response = get_client(token).get(url, headers=headers, params=params, timeout=30)
         if response.status_code == 200:
             return response.json()[:limit]
     except requests.exceptions.RequestException:
@@ -177,15 +140,13 @@ def get_stargazers_also_starred(
     This is a simplified implementation that only samples some users
     """
     headers = {"Accept": "application/vnd.github+json", "X-GitHub-Api-Version": "2022-11-28"}
-    if token:
-        headers["Authorization"] = f"Bearer {token}"
 
     # 获取部分 stargazers
     stargazers_url = f"https://api.github.com/repos/{owner}/{repo}/stargazers"
     params = {"per_page": sample_size}
 
     try:
-        response = requests.get(stargazers_url, headers=headers, params=params, timeout=30)
+        response = get_client(token).get(stargazers_url, headers=headers, params=params, timeout=30)
         if response.status_code != 200:
             return []
 
@@ -205,7 +166,7 @@ def get_stargazers_also_starred(
         params = {"per_page": 30}
 
         try:
-            response = requests.get(starred_url, headers=headers, params=params, timeout=30)
+            response = get_client(token).get(starred_url, headers=headers, params=params, timeout=30)
             if response.status_code == 200:
                 for starred_repo in response.json():
                     full_name = starred_repo.get("full_name", "")
@@ -219,7 +180,7 @@ def get_stargazers_also_starred(
     return list(related_repos.values())
 
 
-def filter_related_repo(repo: dict, config: dict, existing_urls: Set[str], is_fork: bool = False) -> Tuple[bool, str]:
+def filter_related_repo(repo: dict, config: dict, existing_urls: UrlIndex, is_fork: bool = False) -> Tuple[bool, str]:
     """
     过滤关联仓库 / Filter related repository
 
@@ -229,8 +190,8 @@ def filter_related_repo(repo: dict, config: dict, existing_urls: Set[str], is_fo
     related_config = config.get("related_discovery", {})
 
     # 检查 URL 是否已存在
-    html_url = repo.get("html_url", "").strip().rstrip("/").lower()
-    if html_url in existing_urls:
+    html_url = repo.get("html_url", "")
+    if html_url in existing_urls or existing_urls.lookup_github(html_url):
         return False, "已存在 / Already exists"
 
     # 检查是否在排除列表中
@@ -385,19 +346,9 @@ def create_candidate_from_repo(
     }
 
 
-def add_to_pending(resource: dict, pending_file: Path) -> bool:
-    """添加到待审核队列 / Add to pending queue"""
-    if pending_file.exists():
-        with open(pending_file, "r", encoding="utf-8") as f:
-            data = json.load(f)
-    else:
-        data = {"_comment": "候选资源队列 - 待审核的资源", "_schema_version": "1.0", "resources": []}
-
-    data["resources"].append(resource)
-
-    with open(pending_file, "w", encoding="utf-8") as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
-
+def add_to_pending(resource: dict) -> bool:
+    """添加到待审核队列（追加日志，不重写整个文件）/ Add to pending queue (journal append, no full rewrite)"""
+    get_candidate_store().append("pending", [resource])
     return True
 
 
@@ -424,7 +375,7 @@ def main():
     config = load_config()
     categories_prefix = load_categories()
     existing_resources = load_existing_resources()
-    existing_urls = load_existing_urls()
+    existing_urls = UrlIndex()
 
     # 过滤出 GitHub 资源
     github_resources = []
@@ -442,7 +393,6 @@ def main():
 
     # 发现关联项目
     candidates = []
-    pending_file = PROJECT_ROOT / "candidates" / "pending_resources.json"
 
     # 发现 Fork 项目
     if args.type in ["forks", "all"]:
@@ -510,10 +460,13 @@ def main():
         if args.dry_run:
             print("      [Dry Run] 跳过添加")
         else:
-            add_to_pending(resource, pending_file)
+            add_to_pending(resource)
             added_count += 1
             print("      ✅ 已添加到候选队列")
 
+    if added_count:
+        get_candidate_store().export()
+
     print(f"\n✅ 完成！添加了 {added_count} 个关联项目")
 
     # 输出供 GitHub Actions 使用
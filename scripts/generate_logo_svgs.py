@@ -12,34 +12,18 @@ This script creates:
 - Chinese text rendering support
 """
 
+import sys
 from pathlib import Path
 
+# 项目根目录 / Project root
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
 
-def generate_logo_svg(theme: str = "light") -> str:
-    """生成带有中英双语标题的 SVG logo。
-
-    Generate SVG with bilingual Chinese-English title.
-
-    Args:
-        theme: "light" or "dark"
-
-    Returns:
-        SVG content as string
-    """
-    # 根据主题选择颜色
-    # Choose colors based on theme
-    if theme == "light":
-        primary_color = "#FF6B35"  # 橙色 Orange
-        secondary_color = "#24292e"  # 深灰 Dark gray
-        accent_color = "#9C4EFF"  # 紫色 Purple
-        glow_opacity = "0.3"
-    else:  # dark
-        primary_color = "#FF8C5A"  # 浅橙 Light orange
-        secondary_color = "#e1e4e8"  # 浅灰 Light gray
-        accent_color = "#B47FFF"  # 浅紫 Light purple
-        glow_opacity = "0.4"
+from scripts.svg_template import SvgTemplate
 
-    svg_content = """<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 1000 200" preserveAspectRatio="xMidYMid meet">
+# logo 模板，导入时预编译一次 / Logo template, precompiled once at import
+LOGO_SVG = SvgTemplate(
+    """<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 1000 200" preserveAspectRatio="xMidYMid meet">
   <defs>
     <!-- 渐变定义 Gradient definitions -->
     <linearGradient id="titleGrad-{theme}" x1="0%" y1="0%" x2="100%" y2="0%">
@@ -82,7 +66,7 @@ def generate_logo_svg(theme: str = "light") -> str:
 
   <!-- 主标题 - 中文 Main title - Chinese -->
   <text x="500" y="85"
-        font-family="'PingFang SC', 'Microsoft YaHei', 'Noto Sans CJK SC', sans-seri"
+        font-family="'PingFang SC', 'Microsoft YaHei', 'Noto Sans CJK SC', sans-serif"
         font-size="52"
         font-weight="bold"
         fill="url(#titleGrad-{theme})"
@@ -94,7 +78,7 @@ def generate_logo_svg(theme: str = "light") -> str:
 
   <!-- 副标题 - 英文 Subtitle - English -->
   <text x="500" y="125"
-        font-family="system-ui, -apple-system, 'Helvetica Neue', sans-seri"
+        font-family="system-ui, -apple-system, 'Helvetica Neue', sans-serif"
         font-size="24"
         font-weight="400"
         fill="{secondary_color}"
@@ -110,7 +94,7 @@ def generate_logo_svg(theme: str = "light") -> str:
         stroke-width="2"
         stroke-linecap="round"
         opacity="{glow_opacity}">
-    <animate attributeName="opacity" values="{glow_opacity};{float(glow_opacity) + 0.2};{glow_opacity}" dur="3s" repeatCount="indefinite"/>
+    <animate attributeName="opacity" values="{glow_opacity};{glow_peak};{glow_opacity}" dur="3s" repeatCount="indefinite"/>
   </line>
 
   <!-- 左侧装饰点 Left decorative dot -->
@@ -125,8 +109,41 @@ def generate_logo_svg(theme: str = "light") -> str:
     <animate attributeName="opacity" values="0.5;0.8;0.5" dur="3s" begin="1.5s" repeatCount="indefinite"/>
   </circle>
 </svg>"""
+)
+
+
+def generate_logo_svg(theme: str = "light") -> str:
+    """生成带有中英双语标题的 SVG logo。
+
+    Generate SVG with bilingual Chinese-English title.
+
+    Args:
+        theme: "light" or "dark"
+
+    Returns:
+        SVG content as string
+    """
+    # 根据主题选择颜色
+    # Choose colors based on theme
+    if theme == "light":
+        primary_color = "#FF6B35"  # 橙色 Orange
+        secondary_color = "#24292e"  # 深灰 Dark gray
+        accent_color = "#9C4EFF"  # 紫色 Purple
+        glow_opacity = "0.3"
+    else:  # dark
+        primary_color = "#FF8C5A"  # 浅橙 Light orange
+        secondary_color = "#e1e4e8"  # 浅灰 Light gray
+        accent_color = "#B47FFF"  # 浅紫 Light purple
+        glow_opacity = "0.4"
 
-    return svg_content
+    return LOGO_SVG.render(
+        theme=theme,
+        primary_color=primary_color,
+        secondary_color=secondary_color,
+        accent_color=accent_color,
+        glow_opacity=glow_opacity,
+        glow_peak=float(glow_opacity) + 0.2,
+    )
 
 
 def main():
@@ -2,19 +2,41 @@
 """
 双语 README 生成器 / Bilingual README Generator
 增强版：集成 SVG 视觉系统 / Enhanced: Integrated SVG visual system
+
+分类区块按内容哈希缓存（data/readme_render_cache.json），未变化的分类直接复用；
+除更新日期外 README 内容未变化时不重写文件。
+Category sections are cached by content hash (data/readme_render_cache.json) and reused
+when unchanged; README.md is not rewritten when only its update date would change.
 """
 
 import csv
 import hashlib
+import inspect
+import json
 import os
 import re
+import sys
 from collections import Counter
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, List, Optional
 
 import yaml
 
+# 项目根目录 / Project root
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from scripts.svg_assets import asset_key, ensure_svg_asset
+from scripts.svg_template import SvgTemplate, xml_escape
+
+# 分类区块渲染缓存 / Category section render cache
+RENDER_CACHE_FILE = PROJECT_ROOT / "data" / "readme_render_cache.json"
+
+# 更新日期占位符 / Update date placeholder
+UPDATE_DATE_PLACEHOLDER = "<!--UPDATE_DATE-->"
+
 
 def load_categories(categories_file: Path) -> List[Dict]:
     """加载分类定义 / Load category definitions"""
@@ -85,37 +107,15 @@ def fix_duplicate_ids(resources: List[Dict]) -> List[Dict]:
     return resources
 
 
-def create_h2_svg_file(text: str, filename: str, assets_dir: str, icon: str = "") -> str:
-    """
-    创建动画 hero 风格的 H2 标题 SVG 文件（支持中文）。
-    Create an animated hero-centered H2 header SVG file (Chinese support).
-
-    Args:
-        text: The header text (e.g., "官方资源")
-        filename: The output filename
-        assets_dir: Directory to save the SVG
-        icon: Optional emoji icon to append (e.g., "📘")
-
-    Returns:
-        The filename of the created SVG
-    """
-    # 构建显示文本（可选图标）Build display text with optional icon
-    display_text = f"{text} {icon}" if icon else text
+@lru_cache(maxsize=None)
+def _source_version(func) -> str:
+    """生成函数源码的哈希，模板修改后资产自动重新生成 / Hash of a generator's source, so template edits regenerate assets"""
+    return hashlib.sha256(inspect.getsource(func).encode("utf-8")).hexdigest()[:16]
 
-    # 转义 XML 特殊字符 Escape XML special characters
-    text_escaped = display_text.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
 
-    # 根据文本长度计算 viewBox 边界（中文字符约 30px/字，emoji 约 50px）
-    # Calculate viewBox bounds based on text length (Chinese chars ~30px each, emoji ~50px)
-    text_width = len(text) * 30 + (50 if icon else 0)
-    half_text = text_width / 2
-    # 确保包含装饰元素（x=187 到 x=613）加上文本边界和充足的填充
-    # Ensure we include decorations (x=187 to x=613) plus text bounds with generous padding
-    left_bound = int(min(180, 400 - half_text - 30))
-    right_bound = int(max(620, 400 + half_text + 30))
-    viewbox_width = right_bound - left_bound
-
-    svg_content = """<svg width="100%" height="100" viewBox="{left_bound} 0 {viewbox_width} 100" xmlns="http://www.w3.org/2000/svg">
+# 标题模板，导入时预编译一次 / Heading templates, precompiled once at import
+H2_SVG = SvgTemplate(
+    """<svg width="100%" height="100" viewBox="{left_bound} 0 {viewbox_width} 100" xmlns="http://www.w3.org/2000/svg">
   <defs>
     <!-- 微妙的发光效果 - 减少模糊以提高可读性 -->
     <!-- Subtle glow for hero text - reduced blur for better readability -->
@@ -167,7 +167,7 @@ def create_h2_svg_file(text: str, filename: str, assets_dir: str, icon: str = ""
 
   <!-- 主 hero 文本 - 更大、更粗，带微妙的深色轮廓以提高对比度 -->
   <!-- Main hero text - larger, bolder, with subtle dark outline for contrast -->
-  <text x="400" y="58" font-family="'PingFang SC', 'Microsoft YaHei', 'Noto Sans CJK SC', system-ui, sans-seri" font-size="38" font-weight="900" fill="url(#heroGrad)" text-anchor="middle" filter="url(#heroGlow)" letter-spacing="0.5" stroke="#221111" stroke-width="0.5" paint-order="stroke fill">
+  <text x="400" y="58" font-family="'PingFang SC', 'Microsoft YaHei', 'Noto Sans CJK SC', system-ui, sans-serif" font-size="38" font-weight="900" fill="url(#heroGrad)" text-anchor="middle" filter="url(#heroGlow)" letter-spacing="0.5" stroke="#221111" stroke-width="0.5" paint-order="stroke fill">
     {text_escaped}
   </text>
 
@@ -212,37 +212,10 @@ def create_h2_svg_file(text: str, filename: str, assets_dir: str, icon: str = ""
     </circle>
   </g>
 </svg>"""
+)
 
-    # 写入 SVG 文件 Write SVG file
-    filepath = os.path.join(assets_dir, filename)
-    with open(filepath, "w", encoding="utf-8") as f:
-        f.write(svg_content)
-
-    return filename
-
-
-def create_h3_svg_file(text: str, filename: str, assets_dir: str) -> str:
-    """
-    创建动画最小内联 H3 标题 SVG 文件（支持中文）。
-    Create an animated minimal-inline H3 header SVG file (Chinese support).
-
-    Args:
-        text: The header text
-        filename: The output filename
-        assets_dir: Directory to save the SVG
-
-    Returns:
-        The filename of the created SVG
-    """
-    # 转义 XML 特殊字符 Escape XML special characters
-    text_escaped = text.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
-
-    # 计算大致文本宽度（中文字符约 14px/字，18px 字体）
-    # Calculate approximate text width (Chinese chars ~14px each for 18px font)
-    text_width = len(text) * 14
-    total_width = text_width + 50  # 为装饰元素添加填充 Add padding for decorative elements
-
-    svg_content = """<svg width="100%" height="36" viewBox="0 0 {total_width} 36" xmlns="http://www.w3.org/2000/svg">
+H3_SVG = SvgTemplate(
+    """<svg width="100%" height="36" viewBox="0 0 {total_width} 36" xmlns="http://www.w3.org/2000/svg">
   <defs>
     <!-- 非常微妙的发光 Very subtle glow -->
     <filter id="minimalGlow">
@@ -273,20 +246,149 @@ def create_h3_svg_file(text: str, filename: str, assets_dir: str) -> str:
   </g>
 
   <!-- 标题文本 Header text -->
-  <text x="30" y="24" font-family="'PingFang SC', 'Microsoft YaHei', 'Noto Sans CJK SC', system-ui, sans-seri" font-size="18" font-weight="600" fill="url(#minimalGrad)" filter="url(#minimalGlow)">
+  <text x="30" y="24" font-family="'PingFang SC', 'Microsoft YaHei', 'Noto Sans CJK SC', system-ui, sans-serif" font-size="18" font-weight="600" fill="url(#minimalGrad)" filter="url(#minimalGlow)">
     {text_escaped}
     <animate attributeName="opacity" values="0.93;1;0.93" dur="4s" repeatCount="indefinite"/>
   </text>
 </svg>"""
+)
 
-    # 写入 SVG 文件 Write SVG file
-    filepath = os.path.join(assets_dir, filename)
-    with open(filepath, "w", encoding="utf-8") as f:
-        f.write(svg_content)
 
+def create_h2_svg_file(text: str, filename: str, assets_dir: str, icon: str = "") -> str:
+    """
+    创建动画 hero 风格的 H2 标题 SVG 文件（支持中文）。
+    Create an animated hero-centered H2 header SVG file (Chinese support).
+
+    输入未变化且文件已存在时跳过生成和写入。
+    Generation and the write are skipped when the inputs are unchanged and the file exists.
+
+    Args:
+        text: The header text (e.g., "官方资源")
+        filename: The output filename
+        assets_dir: Directory to save the SVG
+        icon: Optional emoji icon to append (e.g., "📘")
+
+    Returns:
+        The filename of the created SVG
+    """
+    key = asset_key("h2", text=text, icon=icon, version=_source_version(generate_h2_svg) + H2_SVG.digest)
+    ensure_svg_asset(Path(assets_dir) / filename, key, lambda: generate_h2_svg(text, icon))
+    return filename
+
+
+def generate_h2_svg(text: str, icon: str = "") -> str:
+    """
+    生成 H2 标题 SVG 内容 / Generate H2 header SVG content
+
+    Args:
+        text: The header text (e.g., "官方资源")
+        icon: Optional emoji icon to append (e.g., "📘")
+
+    Returns:
+        SVG content as string
+    """
+    # 构建显示文本（可选图标）Build display text with optional icon
+    display_text = f"{text} {icon}" if icon else text
+
+    # 转义 XML 特殊字符 Escape XML special characters
+    text_escaped = xml_escape(display_text, quote=False)
+
+    # 根据文本长度计算 viewBox 边界（中文字符约 30px/字，emoji 约 50px）
+    # Calculate viewBox bounds based on text length (Chinese chars ~30px each, emoji ~50px)
+    text_width = len(text) * 30 + (50 if icon else 0)
+    half_text = text_width / 2
+    # 确保包含装饰元素（x=187 到 x=613）加上文本边界和充足的填充
+    # Ensure we include decorations (x=187 to x=613) plus text bounds with generous padding
+    left_bound = int(min(180, 400 - half_text - 30))
+    right_bound = int(max(620, 400 + half_text + 30))
+    viewbox_width = right_bound - left_bound
+
+    return H2_SVG.render(left_bound=left_bound, viewbox_width=viewbox_width, text_escaped=text_escaped)
+
+
+def create_h3_svg_file(text: str, filename: str, assets_dir: str) -> str:
+    """
+    创建动画最小内联 H3 标题 SVG 文件（支持中文）。
+    Create an animated minimal-inline H3 header SVG file (Chinese support).
+
+    输入未变化且文件已存在时跳过生成和写入。
+    Generation and the write are skipped when the inputs are unchanged and the file exists.
+
+    Args:
+        text: The header text
+        filename: The output filename
+        assets_dir: Directory to save the SVG
+
+    Returns:
+        The filename of the created SVG
+    """
+    key = asset_key("h3", text=text, version=_source_version(generate_h3_svg) + H3_SVG.digest)
+    ensure_svg_asset(Path(assets_dir) / filename, key, lambda: generate_h3_svg(text))
     return filename
 
 
+def generate_h3_svg(text: str) -> str:
+    """
+    生成 H3 标题 SVG 内容 / Generate H3 header SVG content
+
+    Args:
+        text: The header text
+
+    Returns:
+        SVG content as string
+    """
+    # 转义 XML 特殊字符 Escape XML special characters
+    text_escaped = xml_escape(text, quote=False)
+
+    # 计算大致文本宽度（中文字符约 14px/字，18px 字体）
+    # Calculate approximate text width (Chinese chars ~14px each for 18px font)
+    text_width = len(text) * 14
+    total_width = text_width + 50  # 为装饰元素添加填充 Add padding for decorative elements
+
+    return H3_SVG.render(total_width=total_width, text_escaped=text_escaped)
+
+
+# 资源 badge 模板，导入时预编译一次 / Resource badge templates, precompiled once at import
+BADGE_SVG = SvgTemplate(
+    """<svg width="{width}" height="44" xmlns="http://www.w3.org/2000/svg">
+  <style>
+    @media (prefers-color-scheme: light) {{
+      .line {{ stroke: #5c5247; }}
+      .box {{ stroke: #5c5247; }}
+      .initials {{ fill: #c96442; }}
+      .name {{ fill: #3d3530; }}
+      .author {{ fill: #5c5247; opacity: 0.7; }}
+    }}
+    @media (prefers-color-scheme: dark) {{
+      .line {{ stroke: #888; }}
+      .box {{ stroke: #888; }}
+      .initials {{ fill: #ff6b4a; }}
+      .name {{ fill: #e8e8e8; }}
+      .author {{ fill: #aaa; opacity: 0.8; }}
+    }}
+  </style>
+
+  <!-- 细顶线 Thin top line -->
+  <line class="line" x1="4" y1="6" x2="{line_end}" y2="6" stroke-width="1.25" opacity="0.4"/>
+
+  <!-- 首字母方框 Initials box -->
+  <rect class="box" x="4" y="12" width="32" height="26" fill="none" stroke-width="2.25" opacity="0.6"/>
+  <text class="initials" x="20" y="30" font-family="'Courier New', Courier, monospace" font-size="14" font-weight="700" text-anchor="middle">{initials}</text>
+
+  <!-- 资源名称 Resource name -->
+  <text class="name" x="48" y="30" font-family="'PingFang SC', 'Microsoft YaHei', 'Noto Sans CJK SC', system-ui, sans-serif" font-size="17" font-weight="600">{name}</text>{author_element}
+
+  <!-- 底部横线 Bottom rule -->
+  <line class="line" x1="48" y1="37" x2="{line_end}" y2="37" stroke-width="1.25" opacity="0.5"/>
+</svg>"""
+)
+
+BADGE_AUTHOR_SVG = SvgTemplate(
+    """
+  <text class="author" x="{x}" y="30" font-family="'PingFang SC', 'Microsoft YaHei', 'Noto Sans CJK SC', system-ui, sans-serif" font-size="14" font-weight="400">by {author}</text>"""
+)
+
+
 def generate_resource_badge_svg(display_name: str, author_name: str = "") -> str:
     """
     为资源名称 badge 生成 SVG 内容，支持主题自适应颜色和中文。
@@ -313,12 +415,8 @@ def generate_resource_badge_svg(display_name: str, author_name: str = "") -> str
         initials = display_name[:2].upper()
 
     # 转义 XML 特殊字符 Escape XML special characters
-    name_escaped = display_name.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;").replace('"', "&quot;")
-    author_escaped = (
-        author_name.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;").replace('"', "&quot;")
-        if author_name
-        else ""
-    )
+    name_escaped = xml_escape(display_name)
+    author_escaped = xml_escape(author_name)
 
     # 根据文本长度计算宽度（中文字符约 14px/字，更大字体需要更多空间）
     # Calculate width based on text length (Chinese chars ~14px each, larger fonts need more space)
@@ -331,43 +429,39 @@ def generate_resource_badge_svg(display_name: str, author_name: str = "") -> str
     name_end_x = 48 + name_width
 
     # 如果提供作者则构建作者文本元素 Build author text element if author provided
-    author_element = ""
-    if author_name:
-        author_element = """
-  <text class="author" x="{name_end_x + 10}" y="30" font-family="'PingFang SC', 'Microsoft YaHei', 'Noto Sans CJK SC', system-ui, sans-seri" font-size="14" font-weight="400">by {author_escaped}</text>"""
-
-    svg = """<svg width="{svg_width}" height="44" xmlns="http://www.w3.org/2000/svg">
-  <style>
-    @media (prefers-color-scheme: light) {{
-      .line {{ stroke: #5c5247; }}
-      .box {{ stroke: #5c5247; }}
-      .initials {{ fill: #c96442; }}
-      .name {{ fill: #3d3530; }}
-      .author {{ fill: #5c5247; opacity: 0.7; }}
-    }}
-    @media (prefers-color-scheme: dark) {{
-      .line {{ stroke: #888; }}
-      .box {{ stroke: #888; }}
-      .initials {{ fill: #ff6b4a; }}
-      .name {{ fill: #e8e8e8; }}
-      .author {{ fill: #aaa; opacity: 0.8; }}
-    }}
-  </style>
+    author_element = BADGE_AUTHOR_SVG.render(x=name_end_x + 10, author=author_escaped) if author_name else ""
+
+    return BADGE_SVG.render(
+        width=svg_width,
+        line_end=svg_width - 4,
+        initials=initials,
+        name=name_escaped,
+        author_element=author_element,
+    )
 
-  <!-- 细顶线 Thin top line -->
-  <line class="line" x1="4" y1="6" x2="{svg_width - 4}" y2="6" stroke-width="1.25" opacity="0.4"/>
 
-  <!-- 首字母方框 Initials box -->
-  <rect class="box" x="4" y="12" width="32" height="26" fill="none" stroke-width="2.25" opacity="0.6"/>
-  <text class="initials" x="20" y="30" font-family="'Courier New', Courier, monospace" font-size="14" font-weight="700" text-anchor="middle">{initials}</text>
+def badge_filename(display_name: str) -> str:
+    """
+    资源 badge 的文件名（无 -light 后缀，badge 是主题自适应的）
+    Filename of a resource badge (no -light suffix, badge is theme-adaptive)
+    """
+    safe_name = re.sub(r"[^a-zA-Z0-9]", "-", display_name.lower())
+    safe_name = re.sub(r"-+", "-", safe_name).strip("-")
+    # 中文等非 ASCII 名称会被替换掉，追加名称哈希避免文件名冲突
+    # Non-ASCII names (e.g. Chinese) are stripped, so append a name hash to avoid collisions
+    if not display_name.isascii():
+        digest = hashlib.sha1(display_name.encode("utf-8")).hexdigest()[:8]
+        safe_name = f"{safe_name}-{digest}" if safe_name else digest
+    return f"badge-{safe_name}.svg"
 
-  <!-- 资源名称 Resource name -->
-  <text class="name" x="48" y="30" font-family="'PingFang SC', 'Microsoft YaHei', 'Noto Sans CJK SC', system-ui, sans-seri" font-size="17" font-weight="600">{name_escaped}</text>{author_element}
 
-  <!-- 底部横线 Bottom rule -->
-  <line class="line" x1="48" y1="37" x2="{svg_width - 4}" y2="37" stroke-width="1.25" opacity="0.5"/>
-</svg>"""
-    return svg
+def badge_asset_key(display_name: str, author_name: str) -> str:
+    """
+    badge 的输入哈希（主题通过 CSS 媒体查询自适应）
+    Input hash of a badge (theme-adaptive via CSS media queries)
+    """
+    version = _source_version(generate_resource_badge_svg) + BADGE_SVG.digest + BADGE_AUTHOR_SVG.digest
+    return asset_key("badge", text=display_name, author=author_name, theme="auto", version=version)
 
 
 def save_resource_badge_svg(display_name: str, author_name: str, assets_dir: str) -> str:
@@ -375,6 +469,9 @@ def save_resource_badge_svg(display_name: str, author_name: str, assets_dir: str
     保存资源名称 SVG badge 到 assets 目录并返回文件名。
     Save a resource name SVG badge to the assets directory and return the filename.
 
+    输入未变化且文件已存在时跳过生成和写入。
+    Generation and the write are skipped when the inputs are unchanged and the file exists.
+
     Args:
         display_name: Resource display name (支持中文 supports Chinese)
         author_name: Author name
@@ -383,21 +480,12 @@ def save_resource_badge_svg(display_name: str, author_name: str, assets_dir: str
     Returns:
         Filename of the saved SVG
     """
-    # 从显示名称创建安全文件名（无 -light 后缀，badge 是主题自适应的）
-    # Create a safe filename from the display name (no -light suffix, badge is theme-adaptive)
-    safe_name = re.sub(r"[^a-zA-Z0-9]", "-", display_name.lower())
-    safe_name = re.sub(r"-+", "-", safe_name).strip("-")
-    filename = f"badge-{safe_name}.svg"
-
-    # 生成 SVG 内容（通过 CSS 媒体查询实现主题自适应）
-    # Generate the SVG content (theme-adaptive via CSS media queries)
-    svg_content = generate_resource_badge_svg(display_name, author_name)
-
-    # 保存到文件 Save to file
-    filepath = os.path.join(assets_dir, filename)
-    with open(filepath, "w", encoding="utf-8") as f:
-        f.write(svg_content)
-
+    filename = badge_filename(display_name)
+    ensure_svg_asset(
+        Path(assets_dir) / filename,
+        badge_asset_key(display_name, author_name),
+        lambda: generate_resource_badge_svg(display_name, author_name),
+    )
     return filename
 
 
@@ -435,9 +523,36 @@ def render_resource(resource: Dict) -> str:
     return "".join(parts)
 
 
-def render_category(category: Dict, resources: List[Dict]) -> str:
+def group_resources(resources: List[Dict]) -> Dict[str, Dict]:
+    """
+    一次遍历按分类 → 子分类分组，组内保持 CSV 顺序
+    Group resources by category → subcategory in a single pass, keeping CSV order
+
+    Returns:
+        {分类 ID: {"resources": [...], "subcategories": {子分类 ID: [...]}}}
+        {category ID: {"resources": [...], "subcategories": {subcategory ID: [...]}}}
+    """
+    groups: Dict[str, Dict] = {}
+    for resource in resources:
+        group = groups.get(resource["Category"])
+        if group is None:
+            group = groups[resource["Category"]] = {"resources": [], "subcategories": {}}
+        group["resources"].append(resource)
+        group["subcategories"].setdefault(resource.get("SubCategory", "").strip(), []).append(resource)
+    return groups
+
+
+# 没有资源的分类 / Group of a category without resources
+EMPTY_GROUP = {"resources": [], "subcategories": {}}
+
+
+def render_category(category: Dict, group: Dict) -> str:
     """
     渲染分类区块 / Render category block
+
+    Args:
+        category: 分类定义 / Category definition
+        group: group_resources() 中该分类的分组 / The category's group from group_resources()
     """
     # 分类标题（双语）/ Category title (bilingual)
     title_zh = category.get("name_zh", category["name"])
@@ -456,8 +571,7 @@ def render_category(category: Dict, resources: List[Dict]) -> str:
     if desc_zh:
         lines.append(f"> {desc_zh}\n")
 
-    # 过滤属于该分类的资源 / Filter resources for this category
-    category_resources = [r for r in resources if r["Category"] == category["id"]]
+    category_resources = group["resources"]
 
     if not category_resources:
         lines.append("_暂无资源 / No resources yet_\n")
@@ -471,10 +585,9 @@ def render_category(category: Dict, resources: List[Dict]) -> str:
             subcat_name = subcat["name"]
             subcat_name_zh = subcat.get("name_zh", subcat_name)
 
-            # 过滤该子分类的资源 / Filter resources for this subcategory
-            # 修复：只匹配精确的子分类，不再将 general 添加到所有子分类
-            # Fix: Only match exact subcategory, don't add general to all subcategories
-            subcat_resources = [r for r in category_resources if r.get("SubCategory", "").strip() == subcat["id"]]
+            # 只取精确匹配的子分类，不再将 general 添加到所有子分类
+            # Only the exact subcategory, general is not added to every subcategory
+            subcat_resources = group["subcategories"].get(subcat["id"], [])
 
             if subcat_resources:
                 lines.append(f"\n### {subcat_name_zh}")
@@ -495,7 +608,7 @@ def render_category(category: Dict, resources: List[Dict]) -> str:
     return "\n".join(lines)
 
 
-def generate_toc(categories: List[Dict], resources: List[Dict]) -> str:
+def generate_toc(categories: List[Dict], groups: Dict[str, Dict]) -> str:
     """
     生成目录 / Generate table of contents
     """
@@ -508,14 +621,14 @@ def generate_toc(categories: List[Dict], resources: List[Dict]) -> str:
         anchor = category["id"]
 
         # 统计该分类的资源数量 / Count resources in this category
-        count = len([r for r in resources if r["Category"] == category["id"]])
+        count = len(groups.get(category["id"], EMPTY_GROUP)["resources"])
 
         lines.append(f"- {icon} [{title_zh}](#{anchor}) ({count})")
 
     return "\n".join(lines) + "\n"
 
 
-def generate_stats(resources: List[Dict], categories: List[Dict]) -> str:
+def generate_stats(resources: List[Dict], categories: List[Dict], groups: Dict[str, Dict]) -> str:
     """
     生成统计信息 / Generate statistics
     """
@@ -526,8 +639,7 @@ def generate_stats(resources: List[Dict], categories: List[Dict]) -> str:
     # 按分类统计 / Statistics by category
     category_counts = {}
     for category in categories:
-        cat_id = category["id"]
-        count = len([r for r in resources if r["Category"] == cat_id])
+        count = len(groups.get(category["id"], EMPTY_GROUP)["resources"])
         if count > 0:
             category_counts[category.get("name_zh", category["name"])] = count
 
@@ -590,11 +702,112 @@ MIT License - 查看 [LICENSE](LICENSE) 文件了解详情。
         return f.read()
 
 
+def _sha256(data) -> str:
+    """JSON 序列化后的 SHA-256 / SHA-256 of the JSON-serialized data"""
+    payload = json.dumps(data, ensure_ascii=False, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _generator_hash() -> str:
+    """生成器源码哈希，渲染代码修改后缓存自动失效 / Generator source hash, so code changes invalidate the cache"""
+    return hashlib.sha256(Path(__file__).read_bytes()).hexdigest()
+
+
+class RenderCache:
+    """
+    分类区块渲染缓存 / Category section render cache
+
+    每个分类保存一条（键, Markdown），键为该分类的资源行、覆盖规则、分类 YAML 和生成器源码的哈希。
+    One (key, Markdown) entry per category, keyed on a hash of the category's rows, its
+    overrides, the category YAML and the generator source.
+    """
+
+    def __init__(self, cache_file: Path):
+        self.cache_file = cache_file
+        self.hits = 0
+        self.misses = 0
+        self._changed = False
+        self._generator = _generator_hash()
+
+        self.data = {"sections": {}}
+        if cache_file.exists():
+            try:
+                with open(cache_file, "r", encoding="utf-8") as f:
+                    self.data.update(json.load(f))
+            except (OSError, ValueError):
+                pass
+        self._seen = set()
+
+    def section_key(self, category: Dict, resources: List[Dict], overrides: Dict) -> str:
+        """计算分类区块的缓存键 / Compute the cache key of a category section"""
+        return _sha256(
+            {
+                "generator": self._generator,
+                "category": category,
+                "resources": resources,
+                "overrides": {r["ID"]: overrides[r["ID"]] for r in resources if r["ID"] in overrides},
+            }
+        )
+
+    def get(self, category_id: str, key: str) -> Optional[str]:
+        """读取未变化的分类区块 / Return the section if unchanged"""
+        self._seen.add(category_id)
+        entry = self.data["sections"].get(category_id)
+        if entry and entry.get("key") == key:
+            self.hits += 1
+            return entry["markdown"]
+        self.misses += 1
+        return None
+
+    def put(self, category_id: str, key: str, markdown: str):
+        """保存分类区块 / Store a section"""
+        self.data["sections"][category_id] = {"key": key, "markdown": markdown}
+        self._changed = True
+
+    def save(self):
+        """保存缓存并清理已删除的分类 / Save the cache, dropping categories that no longer exist"""
+        stale = set(self.data["sections"]) - self._seen
+        for category_id in stale:
+            del self.data["sections"][category_id]
+        if not (self._changed or stale):
+            return
+
+        self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = self.cache_file.with_name(self.cache_file.name + ".tmp")
+        with open(tmp_file, "w", encoding="utf-8") as f:
+            json.dump(self.data, f, ensure_ascii=False)
+        os.replace(tmp_file, self.cache_file)
+
+
+def readme_unchanged(output_path: Path, body: str) -> bool:
+    """
+    现有 README 是否与正文（日期替换前）只差更新日期
+    Whether the existing README differs from the body (before the date is filled in) only
+    in its update date
+    """
+    if not output_path.exists():
+        return False
+    # 日期位置匹配任意日期 / Any date matches at the date placeholder
+    pattern = r"\d{4}-\d{2}-\d{2}".join(re.escape(part) for part in body.split(UPDATE_DATE_PLACEHOLDER))
+    return re.fullmatch(pattern, output_path.read_text(encoding="utf-8")) is not None
+
+
 def generate_readme(
-    csv_path: Path, categories_path: Path, template_path: Path, output_path: Path, overrides_path: Optional[Path] = None
-):
+    csv_path: Path,
+    categories_path: Path,
+    template_path: Path,
+    output_path: Path,
+    overrides_path: Optional[Path] = None,
+    cache_path: Optional[Path] = None,
+) -> bool:
     """
     生成 README.md / Generate README.md
+
+    Args:
+        cache_path: 分类区块渲染缓存文件，None 表示不使用缓存 / Section render cache file, None disables caching
+
+    Returns:
+        是否写入了文件 / Whether the file was written
     """
     print("🚀 开始生成 README...")
     print("🚀 Starting README generation...\n")
@@ -623,20 +836,38 @@ def generate_readme(
     print("\n📄 加载模板...")
     template = load_template(template_path)
 
+    # 一次遍历分组，各部分共用 / Group once, shared by every section
+    groups = group_resources(resources)
+
     # 生成各个部分 / Generate sections
     print("⚙️  生成统计信息...")
-    stats = generate_stats(resources, categories)
+    stats = generate_stats(resources, categories, groups)
 
     print("⚙️  生成目录...")
-    toc = generate_toc(categories, resources)
+    toc = generate_toc(categories, groups)
 
     print("⚙️  生成内容...")
+    cache = RenderCache(cache_path) if cache_path else None
     content_parts = []
     for category in categories:
         # 只渲染有资源的分类 / Only render categories with resources
-        cat_resources = [r for r in resources if r["Category"] == category["id"]]
-        if cat_resources:
-            content_parts.append(render_category(category, resources))
+        group = groups.get(category["id"])
+        if not group:
+            continue
+
+        if cache is None:
+            content_parts.append(render_category(category, group))
+            continue
+
+        key = cache.section_key(category, group["resources"], overrides)
+        section = cache.get(category["id"], key)
+        if section is None:
+            section = render_category(category, group)
+            cache.put(category["id"], key, section)
+        content_parts.append(section)
+
+    if cache:
+        print(f"   ♻️  缓存命中 {cache.hits} 个分类，重新渲染 {cache.misses} 个")
 
     content = "\n".join(content_parts)
 
@@ -647,9 +878,18 @@ def generate_readme(
     readme = readme.replace("{{TOC}}", toc)
     readme = readme.replace("{{CONTENT}}", content)
 
+    if cache:
+        cache.save()
+
+    # 只有日期会变化时保留原文件（包括其中的日期）/ Keep the existing file (and its date) when only the date would change
+    if readme_unchanged(output_path, readme):
+        print(f"\n⏭️  内容未变化，跳过写入: {output_path}")
+        print(f"\n📊 总计: {len(resources)} 个资源，{len(categories)} 个分类")
+        return False
+
     # 替换日期占位符 / Replace date placeholders
     current_date = datetime.now().strftime("%Y-%m-%d")
-    readme = readme.replace("<!--UPDATE_DATE-->", current_date)
+    readme = readme.replace(UPDATE_DATE_PLACEHOLDER, current_date)
 
     # 写入文件 / Write file
     print(f"\n💾 写入文件: {output_path}")
@@ -659,6 +899,7 @@ def generate_readme(
     print("\n✅ README.md 生成成功！")
     print("✅ README.md generated successfully!")
     print(f"\n📊 总计: {len(resources)} 个资源，{len(categories)} 个分类")
+    return True
 
 
 def main():
@@ -681,7 +922,7 @@ def main():
         return 1
 
     try:
-        generate_readme(csv_path, categories_path, template_path, output_path, overrides_path)
+        generate_readme(csv_path, categories_path, template_path, output_path, overrides_path, RENDER_CACHE_FILE)
         return 0
     except Exception as e:
         print(f"\n❌ 生成失败: {e}")
@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""
+从趋势历史生成 ticker 数据 / Generate Ticker Data from Trends History
+
+用 analyze_github_trends.py --update-history 保存的快照生成 data/repo-ticker.csv，
+不调用任何 API：
+1. 对 THE_RESOURCES_TABLE.csv 中每个活跃的 GitHub 资源，取最新快照作为当前值
+2. 增量 = 最新快照 - 至少早 --window-days 天的最近一个快照（没有时用最早的快照）
+3. 用堆取增量最大的 --top 个仓库（按 stars、forks、watchers 增量依次比较）
+4. 内容未变化时不重写 CSV
+
+Builds data/repo-ticker.csv from the snapshots saved by
+analyze_github_trends.py --update-history, without any API calls:
+1. For every active GitHub resource in THE_RESOURCES_TABLE.csv, the latest snapshot
+   gives the current values
+2. Delta = latest snapshot minus the most recent snapshot at least --window-days older
+   (the oldest snapshot when there is none)
+3. A heap picks the --top repos with the largest deltas (stars, then forks, then watchers)
+4. The CSV is not rewritten when its content is unchanged
+
+用法 / Usage:
+    python scripts/generate_ticker_data.py [--top 30] [--window-days 1]
+"""
+
+import argparse
+import csv
+import heapq
+import io
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, List, Optional
+
+# 项目根目录 / Project root
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from scripts.analyze_github_trends import extract_github_info, load_trends_history
+from scripts.generate_readme import load_csv_resources
+from scripts.generate_ticker_svg import write_if_changed
+
+TICKER_CSV = PROJECT_ROOT / "data" / "repo-ticker.csv"
+
+TICKER_FIELDS = ["full_name", "stars", "watchers", "forks", "stars_delta", "watchers_delta", "forks_delta"]
+
+# 默认展示的涨幅最大仓库数（ticker 每天轮换 10 个）/ Top movers kept by default (the ticker rotates 10 a day)
+TOP_MOVERS = 30
+
+METRICS = ("stars", "watchers", "forks")
+
+
+def baseline_snapshot(snapshots: List[dict], window_days: int) -> Optional[dict]:
+    """
+    计算增量的基准快照 / Baseline snapshot for the deltas
+
+    快照按时间顺序追加；取最新快照之前、至少早 window_days 天的最近一个，没有时取最早的。
+    Snapshots are appended in time order; picks the most recent one at least window_days
+    older than the latest, falling back to the oldest.
+    """
+    if len(snapshots) < 2:
+        return None
+
+    cutoff = datetime.fromisoformat(snapshots[-1]["timestamp"]) - timedelta(days=window_days)
+    for snapshot in reversed(snapshots[:-1]):
+        if datetime.fromisoformat(snapshot["timestamp"]) <= cutoff:
+            return snapshot
+    return snapshots[0]
+
+
+def build_ticker_rows(
+    resources: List[Dict], trends_history: dict, top: int = TOP_MOVERS, window_days: int = 1
+) -> List[Dict]:
+    """
+    计算所有 GitHub 资源的增量并取涨幅最大的仓库
+    Compute deltas for every GitHub resource and keep the top movers
+
+    Args:
+        resources: 活跃资源 / Active resources
+        trends_history: load_trends_history() 的结果 / Result of load_trends_history()
+        top: 保留的仓库数 / Repos to keep
+        window_days: 增量窗口（天）/ Delta window in days
+
+    Returns:
+        按涨幅排序的 ticker 行 / Ticker rows ordered by movement
+    """
+    history = {name.lower(): entry for name, entry in trends_history.get("repos", {}).items()}
+
+    rows = []
+    seen = set()
+    for resource in resources:
+        github_info = extract_github_info(resource.get("PrimaryLink", ""))
+        if not github_info:
+            continue
+        full_name = "/".join(github_info)
+        if full_name.lower() in seen:
+            continue
+        seen.add(full_name.lower())
+
+        snapshots = history.get(full_name.lower(), {}).get("snapshots", [])
+        if not snapshots:
+            continue
+
+        latest = snapshots[-1]
+        baseline = baseline_snapshot(snapshots, window_days) or latest
+        row = {"full_name": full_name}
+        for metric in METRICS:
+            row[metric] = latest.get(metric, 0)
+            row[f"{metric}_delta"] = latest.get(metric, 0) - baseline.get(metric, 0)
+        rows.append(row)
+
+    # 堆取 top-k，O(n log k)；相同涨幅保持 CSV 顺序 / Heap top-k in O(n log k); ties keep CSV order
+    return heapq.nlargest(
+        top, rows, key=lambda row: (row["stars_delta"], row["forks_delta"], row["watchers_delta"], row["stars"])
+    )
+
+
+def format_delta(delta: int) -> str:
+    """增量带符号输出，与手工维护的 CSV 一致 / Signed delta, matching the hand-maintained CSV"""
+    return f"+{delta}" if delta > 0 else str(delta)
+
+
+def render_ticker_csv(rows: List[Dict]) -> str:
+    """渲染 ticker CSV / Render the ticker CSV"""
+    output = io.StringIO()
+    writer = csv.DictWriter(output, fieldnames=TICKER_FIELDS, lineterminator="\n")
+    writer.writeheader()
+    for row in rows:
+        writer.writerow({**row, **{f"{m}_delta": format_delta(row[f"{m}_delta"]) for m in METRICS}})
+    return output.getvalue()
+
+
+def main():
+    """主函数 / Main function"""
+    parser = argparse.ArgumentParser(description="Generate repo-ticker.csv from trends history")
+    parser.add_argument("--top", type=int, default=TOP_MOVERS, help="Top movers to keep")
+    parser.add_argument("--window-days", type=int, default=1, help="Delta window in days")
+    parser.add_argument("--output", type=Path, default=TICKER_CSV, help="Output CSV")
+    args = parser.parse_args()
+
+    print("📈 生成 ticker 数据 / Generating Ticker Data")
+    print("=" * 50)
+
+    trends_history = load_trends_history()
+    resources = load_csv_resources(PROJECT_ROOT / "THE_RESOURCES_TABLE.csv")
+    rows = build_ticker_rows(resources, trends_history, args.top, args.window_days)
+
+    if not rows:
+        print("⚠️  趋势历史中没有快照，保留现有 ticker 数据")
+        print("   先运行 analyze_github_trends.py --update-history")
+        return 0
+
+    movers = sum(1 for row in rows if row["stars_delta"] or row["forks_delta"] or row["watchers_delta"])
+    print(f"   📊 {len(resources)} 个资源，选出 {len(rows)} 个仓库（{movers} 个有变化）")
+
+    if write_if_changed(args.output, render_ticker_csv(rows)):
+        print(f"\n✅ 已写入: {args.output}")
+    else:
+        print(f"\n✅ 未变化，跳过写入: {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -4,17 +4,48 @@
 Generate dynamic stock ticker SVGs from repository data.
 
 This script reads the repo ticker CSV and generates animated SVG files
-with a random sampling of repositories for both dark and light themes.
+with a window of repositories for both dark and light themes.
 Displays deltas for each metric with color coding.
 
-本脚本读取仓库行情 CSV 并生成带有随机采样仓库的动画 SVG 文件，
+The window rotates deterministically: repositories are put in a stable
+order and each rotation step shows the next 10, so consecutive steps cover
+the whole list. The step comes from the date (one window per day) or from
+a hash of the CSV content. Unchanged input on the same step reproduces a
+byte-identical SVG, and the write is skipped.
+
+本脚本读取仓库行情 CSV 并生成带有一组仓库的动画 SVG 文件，
 支持深色和浅色主题。显示每个指标的增量，带颜色编码。
+
+展示的仓库按确定性方式轮换：仓库按稳定顺序排列，每个轮换步长展示接下来的 10 个，
+连续的步长覆盖全部仓库。步长来自日期（每天一组）或 CSV 内容哈希；
+同一步长下输入不变时生成逐字节相同的 SVG，并跳过写入。
+
+用法 / Usage:
+    python scripts/generate_ticker_svg.py [--rotation date|content|random] [--date 2026-01-31]
 """
 
+import argparse
 import csv
+import hashlib
+import json
 import random
+import sys
+from datetime import date
 from pathlib import Path
-from typing import Any
+from typing import Any, Optional
+
+# 项目根目录 / Project root
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from scripts.svg_template import SvgTemplate, xml_escape
+
+# 每次展示的仓库数 / Repositories shown per ticker
+TICKER_SIZE = 10
+
+# 轮换模式：按日期、按内容哈希，或旧的随机采样
+# Rotation modes: by date, by content hash, or the legacy random sample
+ROTATION_MODES = ("date", "content", "random")
 
 
 def format_number(num: int) -> str:
@@ -121,221 +152,132 @@ def load_repos(csv_path: Path) -> list[dict[str, Any]]:
     return repos
 
 
-def escape_xml(text: str) -> str:
+def rotation_order(repos: list[dict[str, Any]]) -> list[dict[str, Any]]:
     """
-    转义 XML 特殊字符以安全用于 SVG。
-    Escape XML special characters for safe use in SVG.
+    仓库的稳定轮换顺序（按名称哈希，与 CSV 行顺序无关）。
+    Stable rotation order of the repositories (by name hash, independent of CSV row order).
 
     Args:
-        text: Text to escape
+        repos: List of repository data
 
     Returns:
-        Escaped text
+        Repositories in rotation order
     """
-    return (
-        text.replace("&", "&amp;")
-        .replace("<", "&lt;")
-        .replace(">", "&gt;")
-        .replace('"', "&quot;")
-        .replace("'", "&apos;")
-    )
+    return sorted(repos, key=lambda repo: hashlib.sha256(repo["full_name"].encode("utf-8")).hexdigest())
 
 
-def generate_repo_group(repo: dict[str, Any], x_offset: int, colors: dict[str, str], flip: bool) -> str:
+def rotation_step(repos: list[dict[str, Any]], mode: str = "date", today: Optional[date] = None) -> Optional[int]:
     """
-    为单个仓库生成 SVG 组元素。
-    Generate SVG group element for a single repository.
+    计算轮换步长。
+    Compute the rotation step.
 
     Args:
-        repo: Repository data
-        x_offset: X position offset for this group
-        colors: Color scheme dictionary
-        flip: Whether to flip the layout (owner/repo positions)
+        repos: List of repository data
+        mode: "date" (one step per day), "content" (hash of the repo data) or "random"
+        today: Date used by the "date" mode (default: today)
 
     Returns:
-        SVG group element as string
+        Rotation step, or None for random sampling
     """
-    # 格式化增量 Format deltas
-    stars_delta = format_delta(repo["stars_delta"])
-    watchers_delta = format_delta(repo["watchers_delta"])
-    forks_delta = format_delta(repo["forks_delta"])
+    if mode == "date":
+        return (today or date.today()).toordinal()
+    if mode == "content":
+        # 与 CSV 行顺序无关 Independent of CSV row order
+        payload = json.dumps(rotation_order(repos), sort_keys=True).encode("utf-8")
+        return int(hashlib.sha256(payload).hexdigest()[:12], 16)
+    return None
+
+
+def select_repos(
+    repos: list[dict[str, Any]], step: Optional[int] = None, count: int = TICKER_SIZE
+) -> list[dict[str, Any]]:
+    """
+    选出本次展示的仓库。
+    Select the repositories to show.
 
-    # 获取增量颜色 Get delta colors
-    stars_delta_color = get_delta_color(repo["stars_delta"], colors)
-    watchers_delta_color = get_delta_color(repo["watchers_delta"], colors)
-    forks_delta_color = get_delta_color(repo["forks_delta"], colors)
+    第 step 步展示轮换顺序中从 step * count 开始的 count 个仓库（循环回绕），
+    所以连续 ceil(len(repos) / count) 步覆盖全部仓库。
+    Step `step` shows the `count` repositories starting at step * count in rotation order
+    (wrapping around), so ceil(len(repos) / count) consecutive steps cover every repository.
 
-    # 将 full_name 分割为 owner 和 repo
-    # Split full_name into owner and repo
-    parts = repo["full_name"].split("/", 1)
-    owner = parts[0] if len(parts) > 0 else ""
-    repo_name = parts[1] if len(parts) > 1 else ""
+    Args:
+        repos: List of repository data
+        step: Rotation step, None for a random sample
+        count: Repositories per ticker
 
-    # 截断仓库名以避免长名称重叠（移动端稍长的截断点）
-    # Truncate repo name to avoid overlap with long names (slightly longer cutoff for mobile)
-    truncated_repo_name = truncate_repo_name(repo_name, max_length=24)
+    Returns:
+        Selected repositories
+    """
+    if step is None:
+        return random.sample(repos, min(count, len(repos)))
 
-    # Stars 片段放在 owner 之后
-    # Stars snippet placed after owner
-    delta_text = format_delta(repo["stars_delta"])
-    show_delta = delta_text != "0"
-    approx_char_width = 12  # rough monospace estimate for 24px owner font
-    owner_start_x = 140
-    owner_font_size = 24
+    order = rotation_order(repos)
+    if len(order) <= count:
+        return order
+    start = step * count % len(order)
+    return [order[(start + i) % len(order)] for i in range(count)]
 
-    # XML 转义 XML escaping
-    owner_escaped = escape_xml(owner)
-    repo_name_escaped = escape_xml(truncated_repo_name)
-    delta_text_escaped = escape_xml(delta_text)
-
-    def star_snippet(y_pos: int) -> str:
-        star_str = f"{format_number(repo['stars'])} ⭐"
-        delta_str = f" {delta_text_escaped}" if show_delta else ""
-        metrics = f" | {star_str}{delta_str}"
-        star_x = owner_start_x + (len(owner) * approx_char_width) + 22
-        return """
+
+# 仓库组与行情模板，导入时预编译一次 / Repo group and ticker templates, precompiled once at import
+STAR_SNIPPET_SVG = SvgTemplate(
+    """
         <text x="{star_x}" y="{y_pos}" font-family="'Courier New', monospace" font-size="16" font-weight="normal"
-              fill="{colors['stars']}" opacity="0.95">{escape_xml(metrics)}</text>"""
+              fill="{stars}" opacity="0.95">{metrics}</text>"""
+)
 
-    if not flip:
-        # 名称在上，owner 在下
-        # Names on top, owner just below
-        return """      <!-- Repo: {repo['full_name']} -->
+REPO_GROUP_SVG = SvgTemplate(
+    """      <!-- Repo: {full_name} -->
       <g transform="translate({x_offset}, 0)">
         <!-- Repo name -->
         <text x="140" y="32" font-family="'Courier New', monospace" font-size="34" font-weight="bold"
-              fill="{colors['text']}" filter="url(#textGlow)">{repo_name_escaped}</text>
+              fill="{text}" filter="url(#textGlow)">{repo_name}</text>
         <!-- Owner name -->
         <text x="{owner_start_x}" y="64" font-family="'Courier New', monospace" font-size="{owner_font_size}" font-weight="normal"
-              fill="{colors['text']}" opacity="0.9" filter="url(#textGlow)">{owner_escaped}</text>{star_snippet(64)}
+              fill="{text}" opacity="0.9" filter="url(#textGlow)">{owner}</text>{star_snippet}
       </g>"""
-    else:
-        # Owner 在上，名称在下（下半部分）
-        # Owner on top, name just below (in lower half)
-        return """      <!-- Repo: {repo['full_name']} -->
+)
+
+REPO_GROUP_FLIPPED_SVG = SvgTemplate(
+    """      <!-- Repo: {full_name} -->
       <g transform="translate({x_offset}, 0)">
         <!-- Owner name -->
         <text x="{owner_start_x}" y="102" font-family="'Courier New', monospace" font-size="{owner_font_size}" font-weight="normal"
-              fill="{colors['text']}" opacity="0.9" filter="url(#textGlow)">{owner_escaped}</text>{star_snippet(102)}
+              fill="{text}" opacity="0.9" filter="url(#textGlow)">{owner}</text>{star_snippet}
         <!-- Repo name -->
         <text x="140" y="132" font-family="'Courier New', monospace" font-size="34" font-weight="bold"
-              fill="{colors['text']}" filter="url(#textGlow)">{repo_name_escaped}</text>
+              fill="{text}" filter="url(#textGlow)">{repo_name}</text>
       </g>"""
+)
 
-
-def generate_ticker_svg(repos: list[dict[str, Any]], theme: str = "dark") -> str:
-    """
-    生成完整的 ticker SVG。
-    Generate complete ticker SVG.
-
-    Args:
-        repos: List of repository data
-        theme: "dark" or "light"
-
-    Returns:
-        Complete SVG as string
-    """
-    # 随机采样 10 个仓库并复制以实现无缝滚动
-    # Sample 10 random repos and duplicate for seamless scrolling
-    sampled = random.sample(repos, min(10, len(repos)))
-
-    # 颜色方案 Color schemes
-    if theme == "dark":
-        colors = {
-            "bg_start": "#001a00",
-            "bg_mid": "#002200",
-            "bg_opacity_start": "0.95",
-            "bg_opacity_mid": "0.98",
-            "border_1": "#33ff33",
-            "border_2": "#00fff",
-            "border_3": "#66ff66",
-            "border_4": "#00ff99",
-            "label_bg": "#001100",
-            "label_title": "#33ff33",
-            "label_subtitle": "#00fff",
-            "pulse": "#33ff33",
-            "text": "#fffff",
-            "stars": "#00fff",
-            "watchers": "#66ff66",
-            "forks": "#00ff99",
-            "fade_color": "#001a00",
-            "delta_positive": "#33ff33",
-            "delta_negative": "#ff3333",
-            "delta_neutral": "#888888",
-            "glow_blur": "0.2",
-        }
-    else:  # light
-        colors = {
-            "bg_start": "#fff8f0",
-            "bg_mid": "#fff5eb",
-            "bg_opacity_start": "0.98",
-            "bg_opacity_mid": "1",
-            "border_1": "#FF6B35",
-            "border_2": "#9C4EFF",
-            "border_3": "#FFD700",
-            "border_4": "#FF6B35",
-            "label_bg": "#fff0e6",
-            "label_title": "#FF6B35",
-            "label_subtitle": "#9C4EFF",
-            "pulse": "#FF6B35",
-            "text": "#2d2d2d",
-            "stars": "#9C4EFF",
-            "watchers": "#FF6B35",
-            "forks": "#FFD700",
-            "fade_color": "#fff8f0",
-            "delta_positive": "#00aa00",
-            "delta_negative": "#cc0000",
-            "delta_neutral": "#888888",
-            "glow_blur": "0.15",
-        }
-
-    # 生成仓库组 Generate repo groups
-    repo_groups_1 = []
-    repo_groups_2 = []
-    x_pos = 0
-
-    for idx, repo in enumerate(sampled):
-        group_svg = generate_repo_group(repo, x_pos, colors, flip=bool(idx % 2))
-        repo_groups_1.append(group_svg)
-        repo_groups_2.append(group_svg)
-        x_pos += 300  # 仓库之间的间距（紧凑的股票行情样式）Space between repos (compact stock ticker style)
-
-    repos_svg_1 = "\n".join(repo_groups_1)
-    repos_svg_2 = "\n".join(repo_groups_2)
-
-    # 根据内容宽度计算动画持续时间
-    # Calculate animation duration based on content width
-    content_width = x_pos
-    duration = max(28, content_width // 55)  # slightly slower to aid legibility on mobile
-
-    return """<svg width="900" height="150" xmlns="http://www.w3.org/2000/svg">
+TICKER_SVG = SvgTemplate(
+    """<svg width="900" height="150" xmlns="http://www.w3.org/2000/svg">
   <defs>
     <!-- ticker 背景渐变 Gradient for ticker background -->
     <linearGradient id="tickerBg" x1="0%" y1="0%" x2="100%" y2="0%">
-      <stop offset="0%" style="stop-color:{colors['bg_start']};stop-opacity:{colors['bg_opacity_start']}"/>
-      <stop offset="50%" style="stop-color:{colors['bg_mid']};stop-opacity:{colors['bg_opacity_mid']}"/>
-      <stop offset="100%" style="stop-color:{colors['bg_start']};stop-opacity:{colors['bg_opacity_start']}"/>
+      <stop offset="0%" style="stop-color:{bg_start};stop-opacity:{bg_opacity_start}"/>
+      <stop offset="50%" style="stop-color:{bg_mid};stop-opacity:{bg_opacity_mid}"/>
+      <stop offset="100%" style="stop-color:{bg_start};stop-opacity:{bg_opacity_start}"/>
     </linearGradient>
 
     <!-- 边框线渐变 Gradient for border lines -->
     <linearGradient id="borderGrad" x1="0%" y1="0%" x2="100%" y2="0%">
-      <stop offset="0%" style="stop-color:{colors['border_1']};stop-opacity:0.85">
+      <stop offset="0%" style="stop-color:{border_1};stop-opacity:0.85">
         <animate attributeName="stop-opacity" values="0.85;1;0.85" dur="2s" repeatCount="indefinite"/>
       </stop>
-      <stop offset="33%" style="stop-color:{colors['border_2']};stop-opacity:0.9">
+      <stop offset="33%" style="stop-color:{border_2};stop-opacity:0.9">
         <animate attributeName="stop-opacity" values="0.9;1;0.9" dur="2.2s" repeatCount="indefinite"/>
       </stop>
-      <stop offset="66%" style="stop-color:{colors['border_3']};stop-opacity:0.85">
+      <stop offset="66%" style="stop-color:{border_3};stop-opacity:0.85">
         <animate attributeName="stop-opacity" values="0.85;1;0.85" dur="1.8s" repeatCount="indefinite"/>
       </stop>
-      <stop offset="100%" style="stop-color:{colors['border_4']};stop-opacity:0.85">
+      <stop offset="100%" style="stop-color:{border_4};stop-opacity:0.85">
         <animate attributeName="stop-opacity" values="0.85;1;0.85" dur="2s" repeatCount="indefinite"/>
       </stop>
     </linearGradient>
 
     <!-- 文本发光效果 Text glow effect -->
     <filter id="textGlow">
-      <feGaussianBlur stdDeviation="{colors['glow_blur']}" result="coloredBlur"/>
+      <feGaussianBlur stdDeviation="{glow_blur}" result="coloredBlur"/>
       <feMerge>
         <feMergeNode in="coloredBlur"/>
         <feMergeNode in="SourceGraphic"/>
@@ -353,12 +295,12 @@ def generate_ticker_svg(repos: list[dict[str, Any]], theme: str = "dark") -> str
 
   <!-- 边缘淡化效果 Edge fade effects -->
   <linearGradient id="leftFade" x1="0%" y1="0%" x2="100%" y2="0%">
-    <stop offset="0%" style="stop-color:{colors['fade_color']};stop-opacity:1"/>
-    <stop offset="100%" style="stop-color:{colors['fade_color']};stop-opacity:0"/>
+    <stop offset="0%" style="stop-color:{fade_color};stop-opacity:1"/>
+    <stop offset="100%" style="stop-color:{fade_color};stop-opacity:0"/>
   </linearGradient>
   <linearGradient id="rightFade" x1="0%" y1="0%" x2="100%" y2="0%">
-    <stop offset="0%" style="stop-color:{colors['fade_color']};stop-opacity:0"/>
-    <stop offset="100%" style="stop-color:{colors['fade_color']};stop-opacity:1"/>
+    <stop offset="0%" style="stop-color:{fade_color};stop-opacity:0"/>
+    <stop offset="100%" style="stop-color:{fade_color};stop-opacity:1"/>
   </linearGradient>
   </defs>
 
@@ -372,25 +314,25 @@ def generate_ticker_svg(repos: list[dict[str, Any]], theme: str = "dark") -> str
   <rect x="0" y="146" width="900" height="2" fill="url(#borderGrad)" rx="1"/>
 
   <!-- 分组参考中线 Midline for grouping reference -->
-  <line x1="0" y1="75" x2="900" y2="75" stroke="{colors['border_2']}" stroke-width="2" stroke-dasharray="8 6" opacity="0.6"/>
+  <line x1="0" y1="75" x2="900" y2="75" stroke="{border_2}" stroke-width="2" stroke-dasharray="8 6" opacity="0.6"/>
 
   <!-- 左侧 ticker 标签 Ticker label on left -->
-  <rect x="0" y="0" width="120" height="150" fill="{colors['label_bg']}" opacity="0.95" rx="8"/>
+  <rect x="0" y="0" width="120" height="150" fill="{label_bg}" opacity="0.95" rx="8"/>
   <text x="60" y="46" font-family="'Courier New', monospace" font-size="18" font-weight="bold"
-        fill="{colors['label_title']}" text-anchor="middle" filter="url(#textGlow)">
+        fill="{label_title}" text-anchor="middle" filter="url(#textGlow)">
     CLAUDE CODE
   </text>
   <text x="60" y="68" font-family="'Courier New', monospace" font-size="18" font-weight="bold"
-        fill="{colors['label_subtitle']}" text-anchor="middle" filter="url(#textGlow)">
+        fill="{label_subtitle}" text-anchor="middle" filter="url(#textGlow)">
     REPOS LIVE
   </text>
   <text x="60" y="92" font-family="'Courier New', monospace" font-size="14" font-weight="bold"
-        fill="{colors['delta_positive']}" text-anchor="middle">
+        fill="{delta_positive}" text-anchor="middle">
     DAILY Δ
   </text>
 
   <!-- 动画脉冲指示器 Animated pulse indicator -->
-  <circle cx="60" cy="118" r="5" fill="{colors['pulse']}" filter="url(#metricGlow)">
+  <circle cx="60" cy="118" r="5" fill="{pulse}" filter="url(#metricGlow)">
     <animate attributeName="r" values="4;6;4" dur="1.5s" repeatCount="indefinite"/>
     <animate attributeName="opacity" values="0.6;1;0.6" dur="1.5s" repeatCount="indefinite"/>
   </circle>
@@ -437,10 +379,196 @@ def generate_ticker_svg(repos: list[dict[str, Any]], theme: str = "dark") -> str
   <rect x="130" y="0" width="50" height="100" fill="url(#leftFade)"/>
   <rect x="850" y="0" width="50" height="100" fill="url(#rightFade)"/>
 </svg>"""
+)
+
+
+def generate_repo_group(repo: dict[str, Any], x_offset: int, colors: dict[str, str], flip: bool) -> str:
+    """
+    为单个仓库生成 SVG 组元素。
+    Generate SVG group element for a single repository.
+
+    Args:
+        repo: Repository data
+        x_offset: X position offset for this group
+        colors: Color scheme dictionary
+        flip: Whether to flip the layout (owner/repo positions)
+
+    Returns:
+        SVG group element as string
+    """
+    # 格式化增量 Format deltas
+    stars_delta = format_delta(repo["stars_delta"])
+    watchers_delta = format_delta(repo["watchers_delta"])
+    forks_delta = format_delta(repo["forks_delta"])
+
+    # 获取增量颜色 Get delta colors
+    stars_delta_color = get_delta_color(repo["stars_delta"], colors)
+    watchers_delta_color = get_delta_color(repo["watchers_delta"], colors)
+    forks_delta_color = get_delta_color(repo["forks_delta"], colors)
+
+    # 将 full_name 分割为 owner 和 repo
+    # Split full_name into owner and repo
+    parts = repo["full_name"].split("/", 1)
+    owner = parts[0] if len(parts) > 0 else ""
+    repo_name = parts[1] if len(parts) > 1 else ""
+
+    # 截断仓库名以避免长名称重叠（移动端稍长的截断点）
+    # Truncate repo name to avoid overlap with long names (slightly longer cutoff for mobile)
+    truncated_repo_name = truncate_repo_name(repo_name, max_length=24)
+
+    # Stars 片段放在 owner 之后
+    # Stars snippet placed after owner
+    delta_text = format_delta(repo["stars_delta"])
+    show_delta = delta_text != "0"
+    approx_char_width = 12  # rough monospace estimate for 24px owner font
+    owner_start_x = 140
+    owner_font_size = 24
+
+    # XML 转义 XML escaping
+    owner_escaped = xml_escape(owner)
+    repo_name_escaped = xml_escape(truncated_repo_name)
+
+    star_x = owner_start_x + (len(owner) * approx_char_width) + 22
+    star_str = f"{format_number(repo['stars'])} ⭐"
+    delta_str = f" {delta_text}" if show_delta else ""
+    metrics = xml_escape(f" | {star_str}{delta_str}")
+
+    # 名称在上、owner 在下；flip 时 owner 在上、名称在下（下半部分）
+    # Names on top with owner just below; flipped puts owner on top and the name below (lower half)
+    template, star_y = (REPO_GROUP_FLIPPED_SVG, 102) if flip else (REPO_GROUP_SVG, 64)
+    star_snippet = STAR_SNIPPET_SVG.render(star_x=star_x, y_pos=star_y, stars=colors["stars"], metrics=metrics)
+    return template.render(
+        full_name=repo["full_name"],
+        x_offset=x_offset,
+        text=colors["text"],
+        repo_name=repo_name_escaped,
+        owner_start_x=owner_start_x,
+        owner_font_size=owner_font_size,
+        owner=owner_escaped,
+        star_snippet=star_snippet,
+    )
+
+
+def generate_ticker_svg(repos: list[dict[str, Any]], theme: str = "dark", step: Optional[int] = None) -> str:
+    """
+    生成完整的 ticker SVG。
+    Generate complete ticker SVG.
+
+    Args:
+        repos: List of repository data
+        theme: "dark" or "light"
+        step: Rotation step from rotation_step(), None for a random sample
+
+    Returns:
+        Complete SVG as string
+    """
+    # 选出 10 个仓库并复制以实现无缝滚动
+    # Select 10 repos and duplicate for seamless scrolling
+    sampled = select_repos(repos, step)
+
+    # 颜色方案 Color schemes
+    if theme == "dark":
+        colors = {
+            "bg_start": "#001a00",
+            "bg_mid": "#002200",
+            "bg_opacity_start": "0.95",
+            "bg_opacity_mid": "0.98",
+            "border_1": "#33ff33",
+            "border_2": "#00ffff",
+            "border_3": "#66ff66",
+            "border_4": "#00ff99",
+            "label_bg": "#001100",
+            "label_title": "#33ff33",
+            "label_subtitle": "#00ffff",
+            "pulse": "#33ff33",
+            "text": "#ffffff",
+            "stars": "#00ffff",
+            "watchers": "#66ff66",
+            "forks": "#00ff99",
+            "fade_color": "#001a00",
+            "delta_positive": "#33ff33",
+            "delta_negative": "#ff3333",
+            "delta_neutral": "#888888",
+            "glow_blur": "0.2",
+        }
+    else:  # light
+        colors = {
+            "bg_start": "#fff8f0",
+            "bg_mid": "#fff5eb",
+            "bg_opacity_start": "0.98",
+            "bg_opacity_mid": "1",
+            "border_1": "#FF6B35",
+            "border_2": "#9C4EFF",
+            "border_3": "#FFD700",
+            "border_4": "#FF6B35",
+            "label_bg": "#fff0e6",
+            "label_title": "#FF6B35",
+            "label_subtitle": "#9C4EFF",
+            "pulse": "#FF6B35",
+            "text": "#2d2d2d",
+            "stars": "#9C4EFF",
+            "watchers": "#FF6B35",
+            "forks": "#FFD700",
+            "fade_color": "#fff8f0",
+            "delta_positive": "#00aa00",
+            "delta_negative": "#cc0000",
+            "delta_neutral": "#888888",
+            "glow_blur": "0.15",
+        }
+
+    # 生成仓库组 Generate repo groups
+    repo_groups_1 = []
+    repo_groups_2 = []
+    x_pos = 0
+
+    for idx, repo in enumerate(sampled):
+        group_svg = generate_repo_group(repo, x_pos, colors, flip=bool(idx % 2))
+        repo_groups_1.append(group_svg)
+        repo_groups_2.append(group_svg)
+        x_pos += 300  # 仓库之间的间距（紧凑的股票行情样式）Space between repos (compact stock ticker style)
+
+    repos_svg_1 = "\n".join(repo_groups_1)
+    repos_svg_2 = "\n".join(repo_groups_2)
+
+    # 根据内容宽度计算动画持续时间
+    # Calculate animation duration based on content width
+    content_width = x_pos
+    duration = max(28, content_width // 55)  # slightly slower to aid legibility on mobile
+
+    return TICKER_SVG.render(
+        content_width=content_width,
+        duration=duration,
+        repos_svg_1=repos_svg_1,
+        repos_svg_2=repos_svg_2,
+        **colors,
+    )
+
+
+def write_if_changed(path: Path, content: str) -> bool:
+    """
+    内容变化时才写入文件。
+    Write a file only when its content changed.
+
+    Args:
+        path: Output path
+        content: New content
+
+    Returns:
+        Whether the file was written
+    """
+    if path.exists() and path.read_text(encoding="utf-8") == content:
+        return False
+    path.write_text(content, encoding="utf-8")
+    return True
 
 
 def main() -> None:
     """生成 ticker SVG 的主函数。Main function to generate ticker SVGs."""
+    parser = argparse.ArgumentParser(description="Generate repo ticker SVGs")
+    parser.add_argument("--rotation", choices=ROTATION_MODES, default="date", help="How the shown repos rotate")
+    parser.add_argument("--date", type=date.fromisoformat, default=None, help="Date for --rotation date (YYYY-MM-DD)")
+    args = parser.parse_args()
+
     repo_root = Path(__file__).parent.parent
     csv_path = repo_root / "data" / "repo-ticker.csv"
     output_dir = repo_root / "assets"
@@ -462,22 +590,22 @@ def main() -> None:
         print("⚠ 使用静态 ticker SVG（已创建）Using static ticker SVGs (already created)")
         return
 
+    # 两个主题使用同一步长，展示相同的仓库 Both themes share one step and show the same repos
+    step = rotation_step(repos, args.rotation, args.date)
+    print(f"✓ 轮换模式 Rotation: {args.rotation}" + (f" (step {step})" if step is not None else ""))
+
     # 生成 SVG Generate SVGs
     print("正在生成 ticker SVG... Generating ticker SVGs...")
 
-    # 深色主题 Dark theme
-    dark_svg = generate_ticker_svg(repos, "dark")
-    dark_path = output_dir / "repo-ticker.svg"
-    with dark_path.open("w", encoding="utf-8") as f:
-        f.write(dark_svg)
-    print(f"✓ 已生成深色主题 Generated dark theme: {dark_path}")
-
-    # 浅色主题 Light theme
-    light_svg = generate_ticker_svg(repos, "light")
-    light_path = output_dir / "repo-ticker-light.svg"
-    with light_path.open("w", encoding="utf-8") as f:
-        f.write(light_svg)
-    print(f"✓ 已生成浅色主题 Generated light theme: {light_path}")
+    outputs = [
+        ("dark", "深色主题 dark theme", output_dir / "repo-ticker.svg"),
+        ("light", "浅色主题 light theme", output_dir / "repo-ticker-light.svg"),
+    ]
+    for theme, label, path in outputs:
+        if write_if_changed(path, generate_ticker_svg(repos, theme, step)):
+            print(f"✓ 已生成{label}: {path}")
+        else:
+            print(f"✓ {label} 未变化，跳过写入 Unchanged, skipped: {path}")
 
     print("✓ Ticker SVG 生成成功！Ticker SVGs generated successfully!")
 
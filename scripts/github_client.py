@@ -0,0 +1,278 @@
+#!/usr/bin/env python3
+"""
+共享 GitHub 客户端 / Shared GitHub Client
+
+所有访问 GitHub 的脚本共用的 HTTP 客户端：
+1. 连接池复用的 keep-alive Session（避免每次请求重新握手）
+2. 基于 X-RateLimit-* 响应头的配额预算和主动限速
+3. 二级速率限制（secondary rate limit）处理，遵循 Retry-After
+4. 可选的多 token 轮换（GITHUB_TOKENS=token1,token2）
+
+Shared HTTP client for every script that talks to GitHub:
+1. Pooled keep-alive Session (no TLS handshake per request)
+2. Quota budgeting and proactive throttling from X-RateLimit-* headers
+3. Secondary rate limit handling that honours Retry-After
+4. Optional token rotation (GITHUB_TOKENS=token1,token2)
+
+用法 / Usage:
+    from scripts.github_client import get_client
+
+    response = get_client().get("https://api.github.com/repos/anthropics/claude-code")
+"""
+
+import os
+import threading
+import time
+from typing import Callable, Dict, List, Optional
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+
+USER_AGENT = "AwesomeClaudeCode-Bot/1.0 (+https://github.com/yiancode/AwesomeClaudeCode)"
+
+# 会附加认证头的主机 / Hosts that receive the Authorization header
+GITHUB_API_HOSTS = {"api.github.com"}
+
+# 连接池大小 / Connection pool size
+POOL_CONNECTIONS = 10
+POOL_MAXSIZE = 32
+
+# 剩余配额低于限额的该比例时开始平摊请求 / Start spreading requests below this share of the quota
+RESERVE_RATIO = 0.1
+
+# 单次主动等待的上限（秒）/ Upper bound for a single proactive wait (seconds)
+MAX_THROTTLE_WAIT = 60
+
+# 主配额耗尽时换 token / 等待重置后的重试次数 / Retries after rotating or waiting out a spent quota
+PRIMARY_RETRIES = 5
+
+# 二级速率限制重试 / Secondary rate limit retries
+SECONDARY_RETRIES = 3
+SECONDARY_DEFAULT_WAIT = 60
+
+
+def load_tokens_from_env() -> List[str]:
+    """
+    从环境变量加载 token / Load tokens from environment
+
+    GITHUB_TOKENS 为逗号分隔的 token 池，GITHUB_TOKEN 为单个 token。
+    GITHUB_TOKENS is a comma-separated pool, GITHUB_TOKEN a single token.
+    """
+    tokens = [t.strip() for t in os.environ.get("GITHUB_TOKENS", "").split(",") if t.strip()]
+    single = os.environ.get("GITHUB_TOKEN", "").strip()
+    if single and single not in tokens:
+        tokens.append(single)
+    return tokens
+
+
+def rate_limit_resource(url: str) -> str:
+    """推断请求所属的配额类别 / Infer which quota bucket a request uses"""
+    path = urlparse(url).path
+    if path.startswith("/search/"):
+        return "search"
+    if path.startswith("/graphql"):
+        return "graphql"
+    return "core"
+
+
+class _Quota:
+    """单个 token 在某个配额类别上的状态 / Quota state of one token for one bucket"""
+
+    __slots__ = ("limit", "remaining", "reset")
+
+    def __init__(self):
+        self.limit: Optional[int] = None
+        self.remaining: Optional[int] = None
+        self.reset: float = 0.0
+
+    def available(self, now: float) -> bool:
+        return self.remaining is None or self.remaining > 0 or now >= self.reset
+
+
+class GitHubClient:
+    """
+    GitHub HTTP 客户端 / GitHub HTTP client
+
+    线程安全，可在并发验证中共享。
+    Thread-safe; can be shared by concurrent workers.
+    """
+
+    def __init__(
+        self,
+        tokens: Optional[List[str]] = None,
+        user_agent: str = USER_AGENT,
+        clock: Callable[[], float] = time.time,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        """
+        Args:
+            tokens: token 池，默认从环境变量加载 / Token pool, loaded from the environment by default
+            user_agent: User-Agent 请求头 / User-Agent header
+            clock: 当前时间（秒）/ Current time in seconds
+            sleep: 等待函数 / Wait function
+        """
+        self.clock = clock
+        self.sleep = sleep
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=POOL_CONNECTIONS, pool_maxsize=POOL_MAXSIZE)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.session.headers.update({"User-Agent": user_agent})
+
+        self.tokens: List[str] = list(tokens) if tokens is not None else load_tokens_from_env()
+        self._quotas: Dict[str, Dict[str, _Quota]] = {}
+        self._lock = threading.Lock()
+
+    def add_token(self, token: Optional[str]):
+        """向 token 池追加 token / Add a token to the pool"""
+        if token:
+            with self._lock:
+                if token not in self.tokens:
+                    self.tokens.append(token)
+
+    def _quota(self, token: Optional[str], resource: str) -> _Quota:
+        return self._quotas.setdefault(token or "", {}).setdefault(resource, _Quota())
+
+    def _pick_token(self, resource: str) -> Optional[str]:
+        """
+        选择剩余配额最多的 token，全部耗尽时等待最早的重置
+        Pick the token with the most quota left, waiting for the earliest reset when all are spent
+        """
+        while True:
+            with self._lock:
+                candidates = self.tokens or [None]
+                now = self.clock()
+                usable = [t for t in candidates if self._quota(t, resource).available(now)]
+                if usable:
+                    token = max(usable, key=lambda t: self._budget_left(self._quota(t, resource)))
+                    delay = self._throttle_delay(self._quota(token, resource), now)
+                    break
+                wait = min(self._quota(t, resource).reset for t in candidates) - now + 1
+
+            print(f"   ⏳ GitHub {resource} 配额耗尽，等待 {int(wait)} 秒...")
+            self.sleep(max(wait, 1))
+
+        if delay > 0:
+            self.sleep(delay)
+        return token
+
+    @staticmethod
+    def _budget_left(quota: _Quota) -> float:
+        return float("inf") if quota.remaining is None else quota.remaining
+
+    @staticmethod
+    def _throttle_delay(quota: _Quota, now: float) -> float:
+        """
+        剩余配额不足时把请求平摊到重置时间之前
+        Spread requests over the time until reset once the quota runs low
+        """
+        if quota.remaining is None or quota.limit is None or now >= quota.reset:
+            return 0.0
+        if quota.remaining > quota.limit * RESERVE_RATIO:
+            return 0.0
+        return min((quota.reset - now) / max(quota.remaining, 1), MAX_THROTTLE_WAIT)
+
+    def _record(self, token: Optional[str], resource: str, response: requests.Response):
+        """根据响应头更新配额 / Update quota from response headers"""
+        headers = response.headers
+        if "X-RateLimit-Remaining" not in headers:
+            return
+
+        resource = headers.get("X-RateLimit-Resource", resource)
+        with self._lock:
+            quota = self._quota(token, resource)
+            try:
+                quota.remaining = int(headers["X-RateLimit-Remaining"])
+                quota.limit = int(headers.get("X-RateLimit-Limit", quota.limit or 0)) or None
+                quota.reset = float(headers.get("X-RateLimit-Reset", quota.reset))
+            except ValueError:
+                pass
+
+    @staticmethod
+    def _secondary_wait(response: requests.Response, attempt: int) -> Optional[float]:
+        """
+        二级速率限制的等待时间，不是二级限制时返回 None
+        Wait time for a secondary rate limit, None if the response is not one
+        """
+        if response.status_code not in (403, 429):
+            return None
+
+        retry_after = response.headers.get("Retry-After")
+        if retry_after and retry_after.isdigit():
+            return float(retry_after)
+        if "secondary rate limit" in response.text.lower():
+            return SECONDARY_DEFAULT_WAIT * (2**attempt)
+        return None
+
+    def request(self, method: str, url: str, **kwargs) -> requests.Response:
+        """
+        发起请求 / Send a request
+
+        GitHub API 请求自动附加轮换的 token 并遵守配额；其他主机只复用连接池。
+        GitHub API requests get a rotated token and respect quotas; other hosts only share the pool.
+        """
+        kwargs.setdefault("timeout", 30)
+        if urlparse(url).netloc.lower() not in GITHUB_API_HOSTS:
+            return self.session.request(method, url, **kwargs)
+
+        resource = rate_limit_resource(url)
+        headers = dict(kwargs.pop("headers", None) or {})
+        headers.pop("Authorization", None)
+
+        attempt = 0
+        primary_attempts = 0
+        while True:
+            token = self._pick_token(resource)
+            request_headers = dict(headers)
+            if token:
+                request_headers["Authorization"] = f"Bearer {token}"
+
+            response = self.session.request(method, url, headers=request_headers, **kwargs)
+            self._record(token, resource, response)
+
+            # 主配额耗尽：换 token 或等待重置 / Primary quota spent: rotate or wait for reset
+            if response.status_code in (403, 429) and response.headers.get("X-RateLimit-Remaining") == "0":
+                if primary_attempts < PRIMARY_RETRIES:
+                    primary_attempts += 1
+                    continue
+                return response
+
+            wait = self._secondary_wait(response, attempt)
+            if wait is None or attempt >= SECONDARY_RETRIES:
+                return response
+
+            print(f"   ⏳ GitHub 二级速率限制，等待 {int(wait)} 秒...")
+            self.sleep(wait)
+            attempt += 1
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        """GET 请求 / GET request"""
+        return self.request("GET", url, **kwargs)
+
+    def head(self, url: str, **kwargs) -> requests.Response:
+        """HEAD 请求 / HEAD request"""
+        return self.request("HEAD", url, **kwargs)
+
+    def post(self, url: str, **kwargs) -> requests.Response:
+        """POST 请求 / POST request"""
+        return self.request("POST", url, **kwargs)
+
+
+_client: Optional[GitHubClient] = None
+_client_lock = threading.Lock()
+
+
+def get_client(token: Optional[str] = None) -> GitHubClient:
+    """
+    获取进程内共享的客户端 / Get the process-wide shared client
+
+    Args:
+        token: 额外加入 token 池的 token / Extra token to add to the pool
+    """
+    global _client
+    with _client_lock:
+        if _client is None:
+            _client = GitHubClient()
+    _client.add_token(token)
+    return _client
@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+"""
+GitHub GraphQL 批量元数据获取 / GitHub GraphQL Batch Metadata Fetcher
+
+使用 GraphQL 别名在一次请求中解析多个仓库（默认每批 50 个），
+替代逐仓库调用 REST API。
+Resolves many repositories per request (50 per batch by default) using GraphQL
+aliases, instead of one REST call per repository.
+
+用法 / Usage:
+    from scripts.github_graphql import fetch_repos_metadata
+
+    metadata = fetch_repos_metadata([("anthropics", "claude-code")], token)
+    metadata["anthropics/claude-code"]["stars"]
+"""
+
+import argparse
+import os
+import sys
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import requests
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from scripts.github_client import GitHubClient, get_client
+
+GRAPHQL_URL = "https://api.github.com/graphql"
+
+# 单次查询的仓库数（GitHub 单个查询最多 100 个节点）/ Repositories per query (GitHub allows up to 100 nodes)
+DEFAULT_BATCH_SIZE = 50
+MAX_BATCH_SIZE = 100
+
+REPO_FRAGMENT = """
+fragment RepoFields on Repository {
+  nameWithOwner
+  url
+  description
+  stargazerCount
+  forkCount
+  watchers { totalCount }
+  issues(states: OPEN) { totalCount }
+  pullRequests(states: OPEN) { totalCount }
+  licenseInfo { spdxId }
+  owner { login url }
+  primaryLanguage { name }
+  defaultBranchRef { name }
+  pushedAt
+  updatedAt
+  isArchived
+  repositoryTopics(first: 20) { nodes { topic { name } } }
+}
+"""
+
+
+def repo_key(owner: str, repo: str) -> str:
+    """仓库结果字典的键 / Key used in the result dict"""
+    return f"{owner}/{repo}".lower()
+
+
+def build_batch_query(repos: List[Tuple[str, str]]) -> Tuple[str, dict]:
+    """
+    构建带别名的批量查询 / Build an aliased batch query
+
+    Args:
+        repos: [(owner, repo), ...]
+
+    Returns:
+        (query, variables)
+    """
+    declarations = []
+    selections = []
+    variables = {}
+
+    for i, (owner, repo) in enumerate(repos):
+        declarations.append(f"$o{i}: String!, $n{i}: String!")
+        selections.append(f"  r{i}: repository(owner: $o{i}, name: $n{i}) {{ ...RepoFields }}")
+        variables[f"o{i}"] = owner
+        variables[f"n{i}"] = repo
+
+    query = f"query({', '.join(declarations)}) {{\n" + "\n".join(selections) + "\n}\n" + REPO_FRAGMENT
+    return query, variables
+
+
+def parse_repo_node(node: dict) -> dict:
+    """
+    将 GraphQL 仓库节点转换为通用元数据 / Convert a GraphQL repository node to common metadata
+
+    字段名和含义与 analyze_github_trends.parse_repo_stats() 一致；watchers 是关注者数
+    （REST 的 subscribers_count），不是 star 数。
+    Field names and meanings match analyze_github_trends.parse_repo_stats(); watchers is the
+    number of subscribers (REST subscribers_count), not stars.
+    """
+    owner = node.get("owner") or {}
+    license_info = node.get("licenseInfo") or {}
+    language = node.get("primaryLanguage") or {}
+    default_branch = node.get("defaultBranchRef") or {}
+    topics = [t["topic"]["name"] for t in (node.get("repositoryTopics") or {}).get("nodes", []) if t.get("topic")]
+
+    return {
+        "full_name": node.get("nameWithOwner", ""),
+        "html_url": node.get("url", ""),
+        "description": node.get("description"),
+        "stars": node.get("stargazerCount", 0),
+        "forks": node.get("forkCount", 0),
+        "watchers": (node.get("watchers") or {}).get("totalCount", 0),
+        "open_issues": (node.get("issues") or {}).get("totalCount", 0)
+        + (node.get("pullRequests") or {}).get("totalCount", 0),
+        "license": license_info.get("spdxId") or "",
+        "owner": owner.get("login", ""),
+        "owner_url": owner.get("url", ""),
+        "language": language.get("name"),
+        "default_branch": default_branch.get("name"),
+        "pushed_at": node.get("pushedAt"),
+        "updated_at": node.get("updatedAt"),
+        "archived": node.get("isArchived", False),
+        "topics": topics,
+    }
+
+
+def fetch_batch(repos: List[Tuple[str, str]], client: GitHubClient) -> Optional[Dict[str, dict]]:
+    """
+    获取一批仓库的元数据 / Fetch metadata for one batch of repositories
+
+    Returns:
+        {owner/repo: metadata}，不存在的仓库为 {"error": "not_found"}；请求失败返回 None
+        {owner/repo: metadata}, missing repositories map to {"error": "not_found"}; None on request failure
+    """
+    query, variables = build_batch_query(repos)
+    headers = {"Accept": "application/vnd.github+json"}
+
+    try:
+        response = client.post(GRAPHQL_URL, json={"query": query, "variables": variables}, headers=headers, timeout=60)
+        response.raise_for_status()
+        payload = response.json()
+    except (requests.exceptions.RequestException, ValueError) as e:
+        print(f"   ⚠️ GraphQL 请求失败: {e}")
+        return None
+
+    data = payload.get("data") or {}
+    if not data and payload.get("errors"):
+        print(f"   ⚠️ GraphQL 错误: {payload['errors'][0].get('message', 'unknown')}")
+        return None
+
+    results = {}
+    for i, (owner, repo) in enumerate(repos):
+        node = data.get(f"r{i}")
+        results[repo_key(owner, repo)] = parse_repo_node(node) if node else {"error": "not_found"}
+    return results
+
+
+def fetch_repos_metadata(
+    repos: Iterable[Tuple[str, str]],
+    token: Optional[str] = None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    client: Optional[GitHubClient] = None,
+) -> Dict[str, dict]:
+    """
+    批量获取仓库元数据 / Fetch repository metadata in batches
+
+    GraphQL API 需要 token；客户端 token 池为空时返回空字典，调用方应回退到 REST。
+    The GraphQL API requires a token; with an empty client token pool an empty dict
+    is returned and callers should fall back to REST.
+
+    Args:
+        repos: [(owner, repo), ...]，重复项会被合并 / duplicates are merged
+        token: 额外加入 token 池的 GitHub token / GitHub token added to the pool
+        batch_size: 每次查询的仓库数 / Repositories per query
+        client: 可选的 GitHubClient，默认使用共享客户端 / Optional client, defaults to the shared one
+
+    Returns:
+        {owner/repo（小写）: metadata}；失败的批次不包含在结果中
+        {owner/repo (lowercase): metadata}; failed batches are left out
+    """
+    client = client or get_client()
+    client.add_token(token)
+    if not client.tokens:
+        return {}
+
+    batch_size = max(1, min(batch_size, MAX_BATCH_SIZE))
+
+    unique = {}
+    for owner, repo in repos:
+        unique.setdefault(repo_key(owner, repo), (owner, repo))
+    pending = list(unique.values())
+
+    results: Dict[str, dict] = {}
+    for start in range(0, len(pending), batch_size):
+        batch_results = fetch_batch(pending[start : start + batch_size], client)
+        if batch_results:
+            results.update(batch_results)
+
+    return results
+
+
+def main():
+    """主函数 / Main function"""
+    parser = argparse.ArgumentParser(description="Fetch GitHub repository metadata via GraphQL")
+    parser.add_argument("repos", nargs="+", help="Repositories as owner/repo")
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE, help="Repositories per query")
+    args = parser.parse_args()
+
+    if not get_client().tokens:
+        print("❌ GraphQL API 需要 GITHUB_TOKEN / GraphQL API requires GITHUB_TOKEN")
+        return 1
+
+    repos = [tuple(name.split("/", 1)) for name in args.repos if "/" in name]
+    results = fetch_repos_metadata(repos, batch_size=args.batch_size)
+
+    for key, metadata in results.items():
+        if metadata.get("error"):
+            print(f"{key}: ❌ {metadata['error']}")
+        else:
+            print(f"{key}: ⭐ {metadata['stars']}  🍴 {metadata['forks']}  {metadata['license'] or 'N/A'}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -6,11 +6,12 @@
 Runs all crawlers to discover Claude Code related resources from multiple sources.
 
 用法 / Usage:
-    python scripts/multi_source_crawl.py [--dry-run] [--sources SOURCE1,SOURCE2] [--limit N]
+    python scripts/multi_source_crawl.py [--dry-run] [--sources SOURCE1,SOURCE2] [--limit N] [--parallel] [--async] [--full]
 """
 
 import argparse
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import List, Optional
 
@@ -20,11 +21,15 @@ import yaml
 PROJECT_ROOT = Path(__file__).parent.parent
 sys.path.insert(0, str(PROJECT_ROOT))
 
+from scripts.candidate_store import get_candidate_store
 from scripts.crawlers import (
+    HAS_AIOHTTP,
     RedditCrawler,
     AwesomeListCrawler,
     RSSCrawler,
     HackerNewsCrawler,
+    AsyncRSSCrawler,
+    AsyncHackerNewsCrawler,
 )
 
 
@@ -35,14 +40,23 @@ def load_config() -> dict:
         return yaml.safe_load(f)
 
 
-def get_available_crawlers() -> dict:
-    """获取可用的爬虫 / Get available crawlers"""
-    return {
+def get_available_crawlers(use_async: bool = False) -> dict:
+    """
+    获取可用的爬虫 / Get available crawlers
+
+    Args:
+        use_async: 对支持的数据源使用 aiohttp 异步爬虫 / Use aiohttp crawlers where available
+    """
+    crawlers = {
         "reddit": RedditCrawler,
         "awesome": AwesomeListCrawler,
         "rss": RSSCrawler,
         "hackernews": HackerNewsCrawler,
     }
+    if use_async:
+        crawlers["rss"] = AsyncRSSCrawler
+        crawlers["hackernews"] = AsyncHackerNewsCrawler
+    return crawlers
 
 
 def run_crawler(crawler_class, config: dict, dry_run: bool = False, limit: int = 10) -> tuple:
@@ -81,6 +95,18 @@ def main():
         help='Comma-separated list of sources (reddit,awesome,rss,hackernews) or "all"',
     )
     parser.add_argument("--limit", type=int, default=10, help="Maximum resources per source")
+    parser.add_argument(
+        "--parallel", action="store_true", help="Run crawlers concurrently and fan out feeds/lists/keywords"
+    )
+    parser.add_argument(
+        "--async",
+        dest="use_async",
+        action="store_true",
+        help="Use asyncio crawlers (requires aiohttp) for RSS and Hacker News",
+    )
+    parser.add_argument(
+        "--full", action="store_true", help="Ignore incremental checkpoints and rescan the whole window"
+    )
     args = parser.parse_args()
 
     print("🕸️  多源资源爬取 / Multi-source Resource Crawl")
@@ -89,9 +115,23 @@ def main():
     # 加载配置
     print("\n📂 加载配置...")
     config = load_config()
+    parallel_config = config.setdefault("parallel", {})
+    if args.parallel:
+        parallel_config["enabled"] = True
+    if args.use_async:
+        parallel_config["async"] = True
+
+    if args.full:
+        config.setdefault("incremental", {})["enabled"] = False
+        print("   全量模式：忽略增量检查点 / Full mode: ignoring incremental checkpoints")
+
+    use_async = parallel_config.get("async", False)
+    if use_async and not HAS_AIOHTTP:
+        print("   ⚠️ aiohttp 未安装，回退到同步爬虫 / aiohttp not installed, using sync crawlers")
+        use_async = False
 
     # 获取要运行的爬虫
-    available_crawlers = get_available_crawlers()
+    available_crawlers = get_available_crawlers(use_async)
 
     if args.sources == "all":
         sources_to_run = list(available_crawlers.keys())
@@ -114,19 +154,33 @@ def main():
     total_added = 0
     results = {}
 
-    for source in sources_to_run:
+    def run_source(source: str) -> dict:
         crawler_class = available_crawlers[source]
 
         try:
             discovered, added = run_crawler(crawler_class, config, dry_run=args.dry_run, limit=args.limit)
-
-            results[source] = {"discovered": discovered, "added": added}
-            total_discovered += discovered
-            total_added += added
+            return {"discovered": discovered, "added": added}
 
         except Exception as e:
             print(f"   ❌ {source} 爬取失败: {e}")
-            results[source] = {"discovered": 0, "added": 0, "error": str(e)}
+            return {"discovered": 0, "added": 0, "error": str(e)}
+
+    if parallel_config.get("enabled") and len(sources_to_run) > 1:
+        max_crawlers = parallel_config.get("max_crawlers", len(sources_to_run))
+        print(f"   并行模式：{min(max_crawlers, len(sources_to_run))} 个爬虫同时运行")
+        with ThreadPoolExecutor(max_workers=max_crawlers) as executor:
+            source_results = list(executor.map(run_source, sources_to_run))
+    else:
+        source_results = [run_source(source) for source in sources_to_run]
+
+    for source, result in zip(sources_to_run, source_results):
+        results[source] = result
+        total_discovered += result["discovered"]
+        total_added += result["added"]
+
+    # 所有爬虫结束后导出一次队列 / Export the queues once after every crawler finished
+    if not args.dry_run:
+        get_candidate_store().export()
 
     # 输出摘要
     print("\n" + "=" * 50)
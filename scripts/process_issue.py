@@ -25,9 +25,12 @@ from urllib.parse import urlparse
 import requests
 import yaml
 
-
 # 项目根目录 / Project root
 PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from scripts.candidate_store import get_candidate_store
+from scripts.url_index import UrlIndex
 
 # 分类名称映射（从 Issue 表单选项到 category ID）
 # Category name mapping (from Issue form options to category IDs)
@@ -217,42 +220,16 @@ def validate_url(url: str, timeout: int = 10) -> tuple:
         return False, 0, str(e)
 
 
-def check_duplicate(url: str, pending_file: Path, rejected_file: Path) -> tuple:
+def check_duplicate(url: str, index: Optional[UrlIndex] = None) -> tuple:
     """
-    检查 URL 是否已存在（在待审核或已拒绝列表中）
-    Check if URL already exists (in pending or rejected list)
+    检查 URL 是否已存在（在待审核、已拒绝列表或主 CSV 中）
+    Check if URL already exists (in pending list, rejected list or main CSV)
 
     Returns: (is_duplicate, location)
     """
-    # 规范化 URL
-    normalized_url = url.rstrip("/").lower()
-
-    # 检查待审核列表
-    if pending_file.exists():
-        with open(pending_file, "r", encoding="utf-8") as f:
-            data = json.load(f)
-            for res in data.get("resources", []):
-                if res.get("PrimaryLink", "").rstrip("/").lower() == normalized_url:
-                    return True, "pending"
-
-    # 检查已拒绝列表
-    if rejected_file.exists():
-        with open(rejected_file, "r", encoding="utf-8") as f:
-            data = json.load(f)
-            for res in data.get("resources", []):
-                if res.get("PrimaryLink", "").rstrip("/").lower() == normalized_url:
-                    return True, "rejected"
-
-    # 检查主 CSV
-    csv_file = PROJECT_ROOT / "THE_RESOURCES_TABLE.csv"
-    if csv_file.exists():
-        import csv
-
-        with open(csv_file, "r", encoding="utf-8") as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                if row.get("PrimaryLink", "").rstrip("/").lower() == normalized_url:
-                    return True, "csv"
+    match = (index or UrlIndex()).lookup(url)
+    if match:
+        return True, match[0]
 
     return False, None
 
@@ -386,28 +363,12 @@ def create_candidate_resource(parsed_data: dict, issue_number: int, categories_p
     return resource
 
 
-def add_to_pending(resource: dict, pending_file: Path) -> bool:
+def add_to_pending(resource: dict) -> bool:
     """
     添加资源到待审核队列
     Add resource to pending queue
     """
-    # 加载现有数据
-    if pending_file.exists():
-        with open(pending_file, "r", encoding="utf-8") as f:
-            data = json.load(f)
-    else:
-        data = {
-            "_comment": "候选资源队列 - 待审核的资源 / Candidate resource queue - resources pending review",
-            "_schema_version": "1.0",
-            "resources": [],
-        }
-
-    # 添加新资源
-    data["resources"].append(resource)
-
-    # 保存
-    with open(pending_file, "w", encoding="utf-8") as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+    get_candidate_store().append("pending", [resource])
 
     return True
 
@@ -457,10 +418,7 @@ def main():
     print(f"\n🔗 验证 URL: {url}")
 
     # 检查重复
-    pending_file = PROJECT_ROOT / "candidates" / "pending_resources.json"
-    rejected_file = PROJECT_ROOT / "candidates" / "rejected_resources.json"
-
-    is_dup, dup_location = check_duplicate(url, pending_file, rejected_file)
+    is_dup, dup_location = check_duplicate(url)
     if is_dup:
         print(f"⚠️  发现重复资源 (在 {dup_location} 中)")
         print(f"⚠️  Duplicate resource found (in {dup_location})")
@@ -496,7 +454,8 @@ def main():
 
     # 添加到待审核队列
     print("\n💾 添加到待审核队列...")
-    add_to_pending(resource, pending_file)
+    add_to_pending(resource)
+    get_candidate_store().export()
 
     print("\n✅ 处理完成！")
     print("✅ Processing complete!")
@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""
+批量生成资源 badge SVG / Batch Resource Badge Rendering
+
+为 THE_RESOURCES_TABLE.csv 中每个活跃资源生成 badge：
+1. 规划：计算每个 badge 的输入哈希，与已有文件首行的哈希比较，跳过未变化的
+2. 渲染：需要生成的 badge 分块交给进程池，每个进程渲染（模板导入时已预编译）并原子写入
+3. 回收（可选）：删除不再被引用的生成资产
+每个阶段分别计时。
+
+Renders a badge for every active resource in THE_RESOURCES_TABLE.csv:
+1. Plan: compute each badge's input hash and compare it with the hash on the first line
+   of the existing file, skipping unchanged badges
+2. Render: badges that need generating are chunked across a process pool; each process
+   renders (the template is precompiled at import) and writes atomically
+3. Collect (optional): remove generated assets that are no longer referenced
+Each phase is timed separately.
+
+用法 / Usage:
+    python scripts/render_badges.py [--workers 4] [--force] [--gc]
+"""
+
+import argparse
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+# 项目根目录 / Project root
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from scripts.generate_readme import (
+    badge_asset_key,
+    badge_filename,
+    generate_resource_badge_svg,
+    load_csv_resources,
+)
+from scripts.svg_assets import ASSET_MARKER, ASSETS_DIR, collect_garbage, read_asset_key, write_atomic
+
+# 每个任务块的 badge 数 / Badges per task chunk
+CHUNK_SIZE = 256
+
+# 少于该数量时在当前进程渲染，省去进程池启动开销 / Below this, render in-process to skip pool start-up
+MIN_PARALLEL_BADGES = 512
+
+# (路径, 输入哈希, 显示名称, 作者) / (path, input hash, display name, author)
+BadgeJob = Tuple[str, str, str, str]
+
+
+def plan_badges(resources: List[Dict], assets_dir: Path, force: bool = False) -> Tuple[List[BadgeJob], int]:
+    """
+    规划需要生成的 badge / Plan which badges need generating
+
+    同名资源只生成第一个（与 README 顺序一致）。
+    Resources sharing a name only get the first one's badge (README order).
+
+    Returns:
+        (任务列表, 已是最新的数量) / (jobs, number already up to date)
+    """
+    jobs = []
+    seen = set()
+    up_to_date = 0
+    for resource in resources:
+        name = resource.get("DisplayName", "")
+        filename = badge_filename(name)
+        if not name or filename in seen:
+            continue
+        seen.add(filename)
+
+        author = resource.get("Author", "").strip()
+        path = assets_dir / filename
+        key = badge_asset_key(name, author)
+        if not force and read_asset_key(path) == key:
+            up_to_date += 1
+            continue
+        jobs.append((str(path), key, name, author))
+    return jobs, up_to_date
+
+
+def render_batch(jobs: List[BadgeJob]) -> int:
+    """渲染并写入一批 badge（进程池任务）/ Render and write a batch of badges (process pool task)"""
+    for path, key, name, author in jobs:
+        write_atomic(Path(path), ASSET_MARKER.format(key) + generate_resource_badge_svg(name, author))
+    return len(jobs)
+
+
+def render_badges(
+    resources: List[Dict],
+    assets_dir: Path = ASSETS_DIR,
+    workers: Optional[int] = None,
+    force: bool = False,
+    gc: bool = False,
+) -> Dict:
+    """
+    批量生成 badge / Render badges in batch
+
+    Args:
+        resources: 资源列表 / Resources
+        assets_dir: 资产目录 / Assets directory
+        workers: 进程数，默认 CPU 数 / Worker processes, CPU count by default
+        force: 忽略哈希全部重新生成 / Regenerate everything regardless of hashes
+        gc: 生成后回收未引用的 badge / Collect unreferenced badges afterwards
+
+    Returns:
+        统计与各阶段耗时（毫秒）/ Counts and per-phase timings in milliseconds
+    """
+    stats = {"written": 0, "up_to_date": 0, "removed": [], "timings": {}}
+    timings = stats["timings"]
+    assets_dir.mkdir(parents=True, exist_ok=True)
+
+    start = time.perf_counter()
+    jobs, stats["up_to_date"] = plan_badges(resources, assets_dir, force)
+    timings["plan"] = (time.perf_counter() - start) * 1000
+
+    start = time.perf_counter()
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(jobs) < MIN_PARALLEL_BADGES:
+        stats["written"] = render_batch(jobs)
+    else:
+        chunks = [jobs[i : i + CHUNK_SIZE] for i in range(0, len(jobs), CHUNK_SIZE)]
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            stats["written"] = sum(executor.map(render_batch, chunks))
+    timings["render"] = (time.perf_counter() - start) * 1000
+
+    if gc:
+        start = time.perf_counter()
+        # 只回收 badge，标题等其他生成资产保留 / Only badges are collected, other generated assets stay
+        referenced = {badge_filename(r.get("DisplayName", "")) for r in resources}
+        referenced.update(p.name for p in assets_dir.glob("*.svg") if not p.name.startswith("badge-"))
+        stats["removed"] = collect_garbage(assets_dir, referenced)
+        timings["gc"] = (time.perf_counter() - start) * 1000
+
+    return stats
+
+
+def main():
+    """主函数 / Main function"""
+    parser = argparse.ArgumentParser(description="Render resource badge SVGs in batch")
+    parser.add_argument("--csv", type=Path, default=PROJECT_ROOT / "THE_RESOURCES_TABLE.csv", help="Resources CSV")
+    parser.add_argument("--assets-dir", type=Path, default=ASSETS_DIR, help="Assets directory")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (default: CPU count)")
+    parser.add_argument("--force", action="store_true", help="Regenerate every badge")
+    parser.add_argument("--gc", action="store_true", help="Remove badges no resource references")
+    args = parser.parse_args()
+
+    print("🏷️  批量生成资源 badge / Batch Badge Rendering")
+    print("=" * 50)
+
+    start = time.perf_counter()
+    resources = load_csv_resources(args.csv)
+    load_ms = (time.perf_counter() - start) * 1000
+
+    stats = render_badges(resources, args.assets_dir, args.workers, args.force, args.gc)
+
+    print(f"\n📊 {len(resources)} 个资源: 生成 {stats['written']} 个，{stats['up_to_date']} 个已是最新")
+    if args.gc:
+        print(f"   🗑️  回收 {len(stats['removed'])} 个未引用的 badge")
+
+    print("\n⏱️  各阶段耗时 / Phase timings:")
+    print(f"   load    {load_ms:>9.1f} ms")
+    for phase, ms in stats["timings"].items():
+        print(f"   {phase:<7} {ms:>9.1f} ms")
+
+    print("\n✅ 完成！")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
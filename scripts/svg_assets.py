@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""
+内容寻址的 SVG 资产 / Content-Addressed SVG Assets
+
+README 标题和资源 badge SVG 的写入管线：
+1. 按生成输入（类型、文本、图标、作者、主题、生成器版本）计算哈希，写在 SVG 首行注释中
+2. 已有文件的哈希相同时跳过生成和写入，不产生文件系统改动和 git diff
+3. 写入先写临时文件再 os.replace，读者不会看到半个文件
+4. 回收：删除带哈希注释、但不再被任何资源或 README 引用的 SVG；
+   logo、ticker 等手工维护的 SVG 没有哈希注释，不会被删除
+
+Write pipeline for README heading and resource badge SVGs:
+1. The generation inputs (kind, text, icon, author, theme, generator version) are hashed
+   and the hash is stored in a comment on the first line of the SVG
+2. When an existing file carries the same hash, generation and the write are skipped,
+   so there is no filesystem churn and no git diff
+3. Writes go to a temporary file followed by os.replace, so readers never see half a file
+4. Garbage collection removes SVGs that carry a hash comment but are no longer referenced
+   by any resource or the README; hand-maintained SVGs such as the logo and ticker have
+   no hash comment and are never removed
+
+用法 / Usage:
+    python scripts/svg_assets.py --gc [--dry-run]
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import re
+import sys
+from pathlib import Path
+from typing import Callable, Iterable, List, Optional, Set, Tuple
+
+# 项目根目录 / Project root
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+ASSETS_DIR = PROJECT_ROOT / "assets"
+
+# SVG 首行的哈希注释 / Hash comment on the first line of an SVG
+ASSET_MARKER = "<!-- svg-asset:{} -->\n"
+ASSET_MARKER_RE = re.compile(rb"^<!-- svg-asset:([0-9a-f]+) -->")
+
+# README 中对资产的引用 / Asset references in the README
+ASSET_REFERENCE_RE = re.compile(r"assets/([\w.-]+\.svg)")
+
+
+def asset_key(kind: str, **inputs) -> str:
+    """
+    生成输入的哈希 / Hash of the generation inputs
+
+    Args:
+        kind: 资产类型（h2 / h3 / badge）/ Asset kind (h2 / h3 / badge)
+        inputs: 文本、图标、作者、主题、生成器版本等 / Text, icon, author, theme, generator version, ...
+    """
+    payload = json.dumps({"kind": kind, **inputs}, ensure_ascii=False, sort_keys=True)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:32]
+
+
+def read_asset_key(path: Path) -> Optional[str]:
+    """读取 SVG 首行的哈希，没有时返回 None / Read the hash from an SVG's first line, None if absent"""
+    try:
+        with open(path, "rb") as f:
+            match = ASSET_MARKER_RE.match(f.read(64))
+    except OSError:
+        return None
+    return match.group(1).decode("ascii") if match else None
+
+
+def write_atomic(path: Path, content: str):
+    """原子写入文本文件 / Atomically write a text file"""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    with open(tmp_path, "w", encoding="utf-8", newline="") as f:
+        f.write(content)
+    os.replace(tmp_path, path)
+
+
+def ensure_svg_asset(path: Path, key: str, render: Callable[[], str]) -> bool:
+    """
+    确保 SVG 资产与输入一致 / Make sure an SVG asset matches its inputs
+
+    Args:
+        path: 资产路径 / Asset path
+        key: asset_key() 计算的输入哈希 / Input hash from asset_key()
+        render: 生成 SVG 内容的函数，只在需要时调用 / Renders the SVG, only called when needed
+
+    Returns:
+        是否写入了文件 / Whether the file was written
+    """
+    if read_asset_key(path) == key:
+        return False
+    write_atomic(path, ASSET_MARKER.format(key) + render())
+    return True
+
+
+def managed_assets(assets_dir: Path) -> List[Path]:
+    """带哈希注释的 SVG / SVGs carrying a hash comment"""
+    if not assets_dir.exists():
+        return []
+    return sorted(path for path in assets_dir.glob("*.svg") if read_asset_key(path))
+
+
+def collect_garbage(assets_dir: Path, referenced: Iterable[str], dry_run: bool = False) -> List[str]:
+    """
+    删除不再被引用的生成资产 / Remove generated assets that are no longer referenced
+
+    Args:
+        assets_dir: 资产目录 / Assets directory
+        referenced: 仍被引用的文件名 / Filenames still referenced
+        dry_run: 只列出不删除 / List without removing
+
+    Returns:
+        被（或将被）删除的文件名 / Filenames removed (or to be removed)
+    """
+    keep: Set[str] = set(referenced)
+    orphaned = [path for path in managed_assets(assets_dir) if path.name not in keep]
+    if not dry_run:
+        for path in orphaned:
+            path.unlink()
+    return [path.name for path in orphaned]
+
+
+def referenced_assets(readme_path: Path, csv_path: Path) -> Tuple[Set[str], int]:
+    """
+    README 中引用的资产，加上所有活跃资源的 badge
+    Assets referenced by the README plus the badge of every active resource
+
+    Returns:
+        (文件名集合, 活跃资源数) / (set of filenames, number of active resources)
+    """
+    from scripts.generate_readme import badge_filename, load_csv_resources
+
+    referenced = set()
+    if readme_path.exists():
+        referenced.update(ASSET_REFERENCE_RE.findall(readme_path.read_text(encoding="utf-8")))
+
+    resources = load_csv_resources(csv_path) if csv_path.exists() else []
+    referenced.update(badge_filename(r.get("DisplayName", "")) for r in resources)
+    return referenced, len(resources)
+
+
+def main():
+    """主函数 / Main function"""
+    parser = argparse.ArgumentParser(description="Manage generated SVG assets")
+    parser.add_argument("--gc", action="store_true", help="Remove generated SVGs no longer referenced")
+    parser.add_argument("--dry-run", action="store_true", help="List orphaned SVGs without removing them")
+    parser.add_argument("--assets-dir", type=Path, default=ASSETS_DIR, help="Assets directory")
+    args = parser.parse_args()
+
+    if not args.gc:
+        parser.print_help()
+        return 0
+
+    print("🧹 回收未引用的 SVG 资产 / Collecting orphaned SVG assets")
+    referenced, resource_count = referenced_assets(PROJECT_ROOT / "README.md", PROJECT_ROOT / "THE_RESOURCES_TABLE.csv")
+    print(f"   📋 {resource_count} 个活跃资源，{len(referenced)} 个引用的资产")
+
+    orphaned = collect_garbage(args.assets_dir, referenced, dry_run=args.dry_run)
+    for name in orphaned:
+        print(f"   🗑️  {name}")
+
+    action = "将删除" if args.dry_run else "已删除"
+    print(f"\n✅ 完成！{action} {len(orphaned)} 个未引用的资产")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+预编译 SVG 模板 / Precompiled SVG Templates
+
+模板源码只解析一次，拆成静态片段和插槽，再编译成一个 f-string 函数；渲染时直接调用，
+不再每次重新解析格式字符串或逐个 .replace。模板语法与 str.format 相同：{slot} 为插槽，
+{{ 和 }} 为字面大括号，插槽只支持简单字段名（表达式需在调用方预先计算）。
+xml_escape() 是各生成器共用的 XML 转义。
+
+A template's source is parsed once into static chunks and slots and compiled into an
+f-string function, so rendering is a single call instead of re-parsing a format string
+or chaining .replace calls. The syntax matches str.format: {slot} is a slot and {{ / }}
+are literal braces. Slots are plain field names only (expressions are computed by the
+caller beforehand). xml_escape() is the XML escaper shared by every generator.
+
+用法 / Usage:
+    from scripts.svg_template import SvgTemplate, xml_escape
+
+    BADGE = SvgTemplate('<svg width="{width}"><text>{name}</text></svg>')
+    svg = BADGE.render(width=220, name=xml_escape(name))
+"""
+
+import hashlib
+import keyword
+from string import Formatter
+from typing import Tuple
+
+
+def xml_escape(text: str, quote: bool = True) -> str:
+    """
+    转义 XML 特殊字符 / Escape XML special characters
+
+    CPython 中链式 str.replace 每次都是 C 层面的一次扫描，实测比 str.translate 或正则单遍替换更快。
+    In CPython each chained str.replace is one C-level scan, which measured faster than a
+    single-pass str.translate or regex substitution.
+
+    Args:
+        text: 原始文本 / Raw text
+        quote: 是否同时转义引号（属性值中需要）/ Also escape quotes (needed in attribute values)
+    """
+    text = text.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
+    if quote:
+        text = text.replace('"', "&quot;").replace("'", "&apos;")
+    return text
+
+
+class SvgTemplate:
+    """
+    预编译的 SVG 模板 / Precompiled SVG template
+
+    静态片段原样嵌入生成的 f-string，插槽成为函数参数；多余的关键字参数会被忽略，
+    可以直接传入整个配色字典。
+    Static chunks are embedded verbatim in a generated f-string and slots become function
+    parameters; extra keyword arguments are ignored, so a whole color dict can be passed in.
+    """
+
+    def __init__(self, source: str):
+        self.source = source
+        # 模板源码哈希，用作生成器版本 / Hash of the template source, used as the generator version
+        self.digest = hashlib.sha256(source.encode("utf-8")).hexdigest()[:16]
+
+        chunks = []
+        slots = []
+        for literal, field, spec, conversion in Formatter().parse(source):
+            chunks.append(literal.replace("{", "{{").replace("}", "}}"))
+            if field is None:
+                continue
+            if not field.isidentifier() or keyword.iskeyword(field) or spec or conversion:
+                raise ValueError(f"模板插槽只支持简单字段名 / Template slots must be plain names: {{{field}}}")
+            chunks.append("{" + field + "}")
+            if field not in slots:
+                slots.append(field)
+
+        self.slots: Tuple[str, ...] = tuple(slots)
+        params = ", ".join(["*"] + slots + ["**_"]) if slots else "**_"
+        self._render = eval(f"lambda {params}: f{''.join(chunks)!r}", {})
+
+    def render(self, **values) -> str:
+        """
+        填入插槽 / Fill in the slots
+
+        Raises:
+            TypeError: 缺少插槽的值 / A slot has no value
+        """
+        return self._render(**values)
@@ -0,0 +1,301 @@
+#!/usr/bin/env python3
+"""
+URL 规范化与资源索引 / URL Canonicalization and Resource Index
+
+所有脚本共用的 URL 规范化规则，以及持久化的资源索引：
+1. canonical_url()：去协议、www、末尾斜杠、查询参数、锚点和 .git 后缀并转小写，结果带缓存
+2. UrlIndex：覆盖 THE_RESOURCES_TABLE.csv、待审核和已拒绝队列的 SQLite 索引
+   （candidates/url_index.db），保存规范化 URL、GitHub owner/repo 键、资源 ID 和资源行。
+   源文件的 mtime/大小变化时先比较内容哈希，只有内容确实改变的源文件才重新解析。
+
+Canonicalization rules shared by every script, plus a persisted resource index:
+1. canonical_url(): strips scheme, www, trailing slash, query, fragment and .git and
+   lowercases; results are memoized
+2. UrlIndex: a SQLite index (candidates/url_index.db) over THE_RESOURCES_TABLE.csv and
+   the pending and rejected queues, holding canonical URLs, GitHub owner/repo keys,
+   resource IDs and the resource rows. When a source file's mtime/size changes its
+   content hash is compared first, and only files whose content really changed are
+   parsed again.
+
+用法 / Usage:
+    from scripts.url_index import UrlIndex, canonical_url
+
+    index = UrlIndex()
+    if url in index:
+        source, resource_id = index.lookup(url)
+
+    # 只读取一个分区时只刷新该分区，用完关闭 / Reading one partition refreshes only it and closes afterwards
+    with UrlIndex(sources={"csv": INDEX_SOURCES["csv"]}) as index:
+        rows = index.resources("csv")
+"""
+
+import csv
+import hashlib
+import io
+import json
+import re
+import sqlite3
+import threading
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple
+
+# 项目根目录 / Project root
+PROJECT_ROOT = Path(__file__).parent.parent
+
+# 持久化索引 / Persisted index
+URL_INDEX_FILE = PROJECT_ROOT / "candidates" / "url_index.db"
+
+# 索引覆盖的源文件（按查找优先级）/ Source files covered by the index (lookup priority order)
+INDEX_SOURCES = {
+    "pending": PROJECT_ROOT / "candidates" / "pending_resources.json",
+    "rejected": PROJECT_ROOT / "candidates" / "rejected_resources.json",
+    "csv": PROJECT_ROOT / "THE_RESOURCES_TABLE.csv",
+}
+
+# 结构变化时递增，旧索引会被丢弃重建 / Bump on schema changes; older indexes are rebuilt
+INDEX_SCHEMA_VERSION = 1
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS sources (
+    name TEXT PRIMARY KEY, path TEXT, mtime_ns INTEGER, size INTEGER, sha1 TEXT
+);
+CREATE TABLE IF NOT EXISTS resources (
+    source TEXT, position INTEGER, resource_id TEXT, data TEXT, PRIMARY KEY (source, position)
+);
+CREATE TABLE IF NOT EXISTS urls (
+    url TEXT, source TEXT, resource_id TEXT, PRIMARY KEY (url, source)
+);
+CREATE TABLE IF NOT EXISTS github_repos (
+    owner TEXT, repo TEXT, source TEXT, resource_id TEXT, PRIMARY KEY (owner, repo, source)
+);
+"""
+
+
+@lru_cache(maxsize=65536)
+def canonical_url(url: str) -> str:
+    """
+    规范化 URL / Canonicalize URL
+
+    "https://www.GitHub.com/Owner/Repo.git/?tab=readme#top" → "github.com/owner/repo"
+
+    Args:
+        url: 原始 URL / Original URL
+
+    Returns:
+        规范化后的 URL（无协议）/ Canonical URL (without scheme)
+    """
+    if not url:
+        return ""
+
+    url = url.strip().lower()
+    url = re.sub(r"^https?://", "", url)
+    url = re.sub(r"^www\.", "", url)
+    url = re.sub(r"[?#].*$", "", url)
+    url = url.rstrip("/")
+    url = re.sub(r"\.git$", "", url)
+    return url
+
+
+def extract_github_repo(url: str) -> Optional[Tuple[str, str]]:
+    """
+    从 URL 提取 GitHub owner/repo / Extract GitHub owner/repo from URL
+
+    Returns: (owner, repo) or None
+    """
+    match = re.match(r"github\.com/([^/]+)/([^/]+)", canonical_url(url))
+    if match:
+        return (match.group(1), match.group(2))
+
+    return None
+
+
+def _file_signature(path: Path) -> Optional[Tuple[int, int]]:
+    """源文件签名（mtime_ns, size），文件不存在时为 None / Source file signature, None when missing"""
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _read_rows(content: bytes, suffix: str) -> List[dict]:
+    """解析源文件内容 / Parse source file content"""
+    text = content.decode("utf-8")
+    if suffix == ".csv":
+        return list(csv.DictReader(io.StringIO(text, newline="")))
+    return json.loads(text).get("resources", []) if text.strip() else []
+
+
+class UrlIndex:
+    """
+    资源索引 / Resource index
+
+    按源文件分区；查找走 SQLite 主键索引，不再解析源文件。
+    Partitioned by source file; lookups use SQLite primary keys instead of parsing the sources.
+    """
+
+    def __init__(
+        self,
+        index_file: Path = URL_INDEX_FILE,
+        sources: Optional[Dict[str, Path]] = None,
+        persist: bool = True,
+    ):
+        """
+        Args:
+            index_file: 索引文件 / Index file
+            sources: 分区名 → 源文件，默认为 CSV、待审核和已拒绝 / Partition → source file
+            persist: 是否使用索引文件，否则在内存中构建 / Use the index file, otherwise build in memory
+        """
+        self.index_file = index_file
+        self.sources = sources if sources is not None else INDEX_SOURCES
+        self.refreshed: Set[str] = set()
+
+        # 爬虫线程共享同一连接 / Crawler threads share one connection
+        self._lock = threading.Lock()
+        # 本次运行中登记、尚未写入源文件的 URL / URLs registered this run, not yet in the source files
+        self._added: Dict[str, Tuple[str, str]] = {}
+
+        if persist:
+            index_file.parent.mkdir(parents=True, exist_ok=True)
+            self._db = sqlite3.connect(str(index_file), timeout=30, check_same_thread=False)
+        else:
+            self._db = sqlite3.connect(":memory:", check_same_thread=False)
+
+        with self._lock, self._db:
+            self._ensure_schema()
+            for name, path in self.sources.items():
+                self._refresh(name, path)
+
+    def _ensure_schema(self):
+        """创建表，结构版本不符时清空重建 / Create tables, dropping them on a schema version mismatch"""
+        version = self._db.execute("PRAGMA user_version").fetchone()[0]
+        if version != INDEX_SCHEMA_VERSION:
+            for table in ("sources", "resources", "urls", "github_repos"):
+                self._db.execute(f"DROP TABLE IF EXISTS {table}")
+            self._db.execute(f"PRAGMA user_version = {INDEX_SCHEMA_VERSION}")
+        self._db.executescript(SCHEMA)
+
+    def _refresh(self, name: str, path: Path):
+        """
+        刷新一个分区 / Refresh one partition
+
+        mtime 和大小未变直接复用；变化时比较内容哈希，哈希相同只更新签名。
+        Reused as is when mtime and size match; otherwise the content hash decides
+        whether only the signature is updated or the partition is rebuilt.
+        """
+        row = self._db.execute("SELECT path, mtime_ns, size, sha1 FROM sources WHERE name = ?", (name,)).fetchone()
+        signature = _file_signature(path)
+        if row and row[0] == str(path) and signature and (row[1], row[2]) == signature:
+            return
+
+        content = path.read_bytes() if signature else b""
+        sha1 = hashlib.sha1(content).hexdigest()
+        mtime_ns, size = signature or (None, None)
+        self._db.execute(
+            "INSERT OR REPLACE INTO sources (name, path, mtime_ns, size, sha1) VALUES (?, ?, ?, ?, ?)",
+            (name, str(path), mtime_ns, size, sha1),
+        )
+        if row and row[0] == str(path) and row[3] == sha1:
+            return
+
+        self.refreshed.add(name)
+        for table in ("resources", "urls", "github_repos"):
+            self._db.execute(f"DELETE FROM {table} WHERE source = ?", (name,))
+
+        rows = _read_rows(content, path.suffix) if content else []
+        for position, res in enumerate(rows):
+            resource_id = res.get("ID", "")
+            link = res.get("PrimaryLink", "")
+            self._db.execute(
+                "INSERT INTO resources VALUES (?, ?, ?, ?)",
+                (name, position, resource_id, json.dumps(res, ensure_ascii=False)),
+            )
+            url = canonical_url(link)
+            if url:
+                self._db.execute("INSERT OR IGNORE INTO urls VALUES (?, ?, ?)", (url, name, resource_id))
+            github_repo = extract_github_repo(link)
+            if github_repo:
+                self._db.execute(
+                    "INSERT OR IGNORE INTO github_repos VALUES (?, ?, ?, ?)", (*github_repo, name, resource_id)
+                )
+
+    def _first_by_priority(self, matches: List[Tuple[str, str]]) -> Optional[Tuple[str, str]]:
+        """按分区优先级取第一个匹配 / Pick the first match in partition priority order"""
+        if not matches:
+            return None
+        order = list(self.sources)
+        return min(matches, key=lambda m: order.index(m[0]) if m[0] in order else len(order))
+
+    def lookup(self, url: str) -> Optional[Tuple[str, str]]:
+        """
+        按规范化 URL 查找 / Look up by canonical URL
+
+        Returns:
+            (分区名, 资源 ID) 或 None / (partition, resource ID) or None
+        """
+        key = canonical_url(url)
+        if not key:
+            return None
+        with self._lock:
+            matches = self._db.execute("SELECT source, resource_id FROM urls WHERE url = ?", (key,)).fetchall()
+        return self._first_by_priority(matches) or self._added.get(key)
+
+    def lookup_github(self, url: str) -> Optional[Tuple[str, str]]:
+        """
+        按 GitHub owner/repo 查找（忽略 /tree/... 等子路径）
+        Look up by GitHub owner/repo (ignoring sub-paths such as /tree/...)
+
+        Returns:
+            (分区名, 资源 ID) 或 None / (partition, resource ID) or None
+        """
+        github_repo = extract_github_repo(url)
+        if not github_repo:
+            return None
+        with self._lock:
+            matches = self._db.execute(
+                "SELECT source, resource_id FROM github_repos WHERE owner = ? AND repo = ?", github_repo
+            ).fetchall()
+        return self._first_by_priority(matches)
+
+    def close(self):
+        """关闭索引连接 / Close the index connection"""
+        with self._lock:
+            self._db.close()
+
+    def __enter__(self) -> "UrlIndex":
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __contains__(self, url: str) -> bool:
+        return self.lookup(url) is not None
+
+    def __len__(self) -> int:
+        return len(self.urls())
+
+    def add(self, url: str, resource_id: str = "", source: str = "pending"):
+        """
+        登记本次运行新增的 URL（源文件写入后下次加载会自动刷新）
+        Register a URL added this run (the partition refreshes from disk on the next load)
+        """
+        key = canonical_url(url)
+        if key:
+            self._added.setdefault(key, (source, resource_id))
+
+    def urls(self) -> Set[str]:
+        """所有规范化 URL / All canonical URLs"""
+        with self._lock:
+            rows = self._db.execute("SELECT DISTINCT url FROM urls").fetchall()
+        return {url for (url,) in rows} | set(self._added)
+
+    def resources(self, source: str) -> List[dict]:
+        """
+        某个分区的资源行（按源文件中的顺序）/ Resource rows of a partition in source file order
+        """
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT data FROM resources WHERE source = ? ORDER BY position", (source,)
+            ).fetchall()
+        return [json.loads(data) for (data,) in rows]
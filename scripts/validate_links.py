@@ -6,29 +6,43 @@ Validates resource URLs and updates CSV with current status, respecting manual o
 Features:
 - Validates Primary/Secondary Link URLs using HTTP requests
 - Supports GitHub API for repository URLs with license detection
-- Fetches last modified dates for GitHub resources using Commits API
+- Reads license and pushed_at from a single repository request per GitHub repo
+- Prefetches repository metadata for GitHub file links in GraphQL batches
+- Fetches last modified dates for GitHub files using Commits API
 - Implements exponential backoff retry logic
+- Shares the pooled, rate-limit aware GitHub client (scripts/github_client.py)
 - Respects field overrides from resource-overrides.yaml
 - Updates CSV with Active status, Last Checked timestamp, and Last Modified date
 - Provides detailed logging and broken link summary
 - GitHub Action mode for CI/CD integration
+- Concurrent validation mode (--workers) with per-host concurrency caps
+- Conditional requests (ETag / Last-Modified) backed by an on-disk cache
 """
 
 import argparse
 import csv
 import json
 import logging
+import math
 import os
 import random
 import re
 import sys
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from urllib.parse import urlencode, urlparse
 
 import requests
 import yaml  # type: ignore[import-untyped]
 from dotenv import load_dotenv
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from scripts.github_client import get_client
+from scripts.github_graphql import DEFAULT_BATCH_SIZE, fetch_repos_metadata, repo_key
+
 logger = logging.getLogger(__name__)
 
 load_dotenv()
@@ -39,6 +53,7 @@ USER_AGENT = "awesome-claude-code Link Validator/2.0"
 INPUT_FILE = "THE_RESOURCES_TABLE.csv"
 OUTPUT_FILE = "THE_RESOURCES_TABLE.csv"
 OVERRIDE_FILE = "templates/resource-overrides.yaml"
+HTTP_CACHE_FILE = "candidates/http_cache.json"
 # CSV 字段名（与实际 CSV 文件的表头一致）
 PRIMARY_LINK_HEADER_NAME = "PrimaryLink"
 SECONDARY_LINK_HEADER_NAME = "SecondaryLink"
@@ -47,12 +62,122 @@ LAST_CHECKED_HEADER_NAME = "LastChecked"
 LAST_MODIFIED_HEADER_NAME = "LastModified"
 LICENSE_HEADER_NAME = "License"
 ID_HEADER_NAME = "ID"
+# Authorization is added by the shared GitHub client for api.github.com only
 HEADERS = {"User-Agent": USER_AGENT, "Accept": "application/vnd.github+json"}
-if GITHUB_TOKEN:
-    HEADERS["Authorization"] = f"Bearer {GITHUB_TOKEN}"
+
+# 并发验证默认值 / Concurrent validation defaults
+DEFAULT_WORKERS = 1
+DEFAULT_PER_HOST_LIMIT = 4
 
 PRINT_FILE = None
 
+# 条件请求缓存（validate_links() 中启用）/ Conditional-request cache (enabled in validate_links())
+HTTP_CACHE = None
+
+# 本次运行内按 owner/repo 复用的仓库元数据 / Repository metadata reused within a run, keyed by owner/repo
+REPO_METADATA = {}
+# 相比逐项请求 license/commits 节省的 GitHub 请求数 / GitHub requests saved vs. separate license/commits calls
+GITHUB_REQUESTS_SAVED = 0
+_METADATA_LOCK = threading.Lock()
+
+
+class HTTPValidationCache:
+    """
+    Persistent ETag / Last-Modified cache keyed by request URL.
+
+    Each entry stores the validators from the last 200 response together with the
+    data derived from it, so a 304 Not Modified can be answered from disk.
+    """
+
+    def __init__(self, path=HTTP_CACHE_FILE):
+        self.path = path
+        self.entries = {}
+        self.hits = 0
+        self._dirty = False
+        self._lock = threading.Lock()
+
+        if os.path.exists(path):
+            try:
+                with open(path, encoding="utf-8") as f:
+                    self.entries = json.load(f).get("entries", {})
+            except (OSError, ValueError, AttributeError) as e:
+                logger.warning(f"Ignoring unreadable HTTP cache {path}: {e}")
+
+    @staticmethod
+    def key(namespace, url, params=None):
+        """Build the cache key for a lookup kind, a URL and its query parameters."""
+        if params:
+            url = f"{url}?{urlencode(sorted(params.items()))}"
+        return f"{namespace} {url}"
+
+    def conditional_headers(self, key):
+        """Return If-None-Match / If-Modified-Since headers for a cached key."""
+        with self._lock:
+            entry = self.entries.get(key)
+        if not entry:
+            return {}
+
+        headers = {}
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def get(self, key):
+        """Return the data cached for a key after a 304 response."""
+        with self._lock:
+            entry = self.entries.get(key)
+        return entry.get("data") if entry else None
+
+    def record_hit(self):
+        """Count a 304 Not Modified answer."""
+        with self._lock:
+            self.hits += 1
+
+    def store(self, key, response, data=None):
+        """Remember the validators of a 200 response and the data derived from it."""
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if not etag and not last_modified:
+            return
+
+        with self._lock:
+            self.entries[key] = {"etag": etag, "last_modified": last_modified, "data": data}
+            self._dirty = True
+
+    def save(self):
+        """Write the cache back to disk if it changed."""
+        if not self._dirty:
+            return
+
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(self.path, "w", encoding="utf-8") as f:
+            json.dump({"entries": self.entries}, f, ensure_ascii=False, indent=2, sort_keys=True)
+        self._dirty = False
+
+
+def send_request(namespace, method, url, params=None, **kwargs):
+    """
+    Send a request with cache validators attached.
+
+    `namespace` separates lookups that hit the same URL but cache different data
+    (e.g. link status vs. license). Returns (response, cache_key); cache_key is None
+    when the cache is disabled.
+    """
+    headers = dict(HEADERS)
+    cache_key = None
+    if HTTP_CACHE is not None:
+        cache_key = HTTP_CACHE.key(namespace, url, params)
+        headers.update(HTTP_CACHE.conditional_headers(cache_key))
+
+    response = get_client().request(method, url, headers=headers, params=params, timeout=10, **kwargs)
+    if cache_key and response.status_code == 304:
+        HTTP_CACHE.record_hit()
+    return response, cache_key
+
 
 def load_overrides():
     """Load override configuration from YAML file."""
@@ -172,18 +297,63 @@ def parse_github_url(url) -> tuple[str, bool, str | None, str | None]:
     return url, False, None, None
 
 
-def get_github_license(owner, repo):
-    """Fetch license information from GitHub API."""
+def count_saved_requests(count=1):
+    """Record GitHub requests avoided by the consolidated metadata path."""
+    global GITHUB_REQUESTS_SAVED
+    with _METADATA_LOCK:
+        GITHUB_REQUESTS_SAVED += count
+
+
+def extract_repo_metadata(data):
+    """Pick license, default branch and pushed_at out of a repository API payload."""
+    license_info = data.get("license") or {}
+    return {
+        "license": license_info.get("spdx_id"),
+        "default_branch": data.get("default_branch"),
+        "pushed_at": data.get("pushed_at"),
+    }
+
+
+def read_repo_response(owner, repo, response, cache_key):
+    """
+    Turn a 200 or 304 repository API response into metadata.
+    The result is remembered for the rest of the run and in the HTTP cache.
+    """
+    metadata = None
+    if response.status_code == 304 and cache_key:
+        metadata = HTTP_CACHE.get(cache_key)
+    elif response.status_code == 200:
+        metadata = extract_repo_metadata(response.json())
+        if cache_key:
+            HTTP_CACHE.store(cache_key, response, metadata)
+
+    if metadata is not None:
+        with _METADATA_LOCK:
+            REPO_METADATA[repo_key(owner, repo)] = metadata
+    return metadata
+
+
+def get_github_repo_metadata(owner, repo):
+    """Fetch license, default branch and pushed_at with one repository request per run."""
+    with _METADATA_LOCK:
+        metadata = REPO_METADATA.get(repo_key(owner, repo))
+    if metadata is not None:
+        count_saved_requests()
+        return metadata
+
     api_url = f"https://api.github.com/repos/{owner}/{repo}"
     try:
-        response = requests.get(api_url, headers=HEADERS, timeout=10)
-        if response.status_code == 200:
-            data = response.json()
-            license_info = data.get("license")
-            if license_info and license_info.get("spdx_id"):
-                return license_info["spdx_id"]
+        response, cache_key = send_request("repo", "GET", api_url)
+        return read_repo_response(owner, repo, response, cache_key)
     except Exception:
-        pass
+        return None
+
+
+def get_github_license(owner, repo):
+    """Fetch license information from GitHub API."""
+    metadata = get_github_repo_metadata(owner, repo)
+    if metadata and metadata.get("license"):
+        return metadata["license"]
     return "NOT_FOUND"
 
 
@@ -213,11 +383,18 @@ def get_github_last_modified(owner, repo, path=None):
     try:
         api_url = f"https://api.github.com/repos/{owner}/{repo}/commits"
         params = {"per_page": 1, "path": path} if path else {"per_page": 1}
-        response = requests.get(api_url, headers=HEADERS, params=params, timeout=10)
+        response, cache_key = send_request("commits", "GET", api_url, params=params)
+        if response.status_code == 304 and cache_key:
+            cached = HTTP_CACHE.get(cache_key)
+            if cached and cached.get("last_modified"):
+                return cached["last_modified"]
         if response.status_code == 200:
             commit_date = get_committer_date_from_response(response)
-            if commit_date:
-                return format_commit_date(commit_date)
+            last_modified = format_commit_date(commit_date) if commit_date else None
+            if cache_key:
+                HTTP_CACHE.store(cache_key, response, {"last_modified": last_modified})
+            if last_modified:
+                return last_modified
     except Exception as e:
         print(f"Error fetching last modified date for {owner}/{repo}: {e}")
     return None
@@ -233,13 +410,20 @@ def validate_url(url, max_retries=5):
 
     # Convert GitHub URLs to API endpoints
     api_url, is_github, owner, repo = parse_github_url(url)
+    # Repository root URLs hit the repo endpoint, which already carries license and pushed_at
+    is_repo_root = is_github and api_url == f"https://api.github.com/repos/{owner}/{repo}"
 
     for attempt in range(max_retries):
         try:
-            if is_github:
-                response = requests.get(api_url, headers=HEADERS, timeout=10)
+            # A 304 Not Modified means the resource is unchanged since the cached check
+            if is_repo_root:
+                response, cache_key = send_request("repo", "GET", api_url)
+            elif is_github:
+                response, cache_key = send_request("link", "GET", api_url)
             else:
-                response = requests.head(url, headers=HEADERS, timeout=10, allow_redirects=True)
+                response, cache_key = send_request("link", "HEAD", url, allow_redirects=True)
+            if response.status_code == 200 and cache_key and not is_repo_root:
+                HTTP_CACHE.store(cache_key, response)
 
             # Check if we hit GitHub rate limit
             if response.status_code == 403 and "X-RateLimit-Remaining" in response.headers:
@@ -255,11 +439,19 @@ def validate_url(url, max_retries=5):
             if response.status_code < 400:
                 license_info = None
                 last_modified = None
-                if is_github and response.status_code == 200:
+                if is_github and response.status_code in (200, 304):
                     # Extract owner/repo/path from original URL
                     # Try to match file URL first
                     file_match = re.match(r"https://github\.com/([^/]+)/([^/]+)/blob/[^/]+/(.+)", url)
-                    if file_match:
+                    if is_repo_root:
+                        # License and pushed_at come from the validation response itself
+                        metadata = read_repo_response(owner, repo, response, cache_key) or {}
+                        license_info = metadata.get("license") or "NOT_FOUND"
+                        if metadata.get("pushed_at"):
+                            last_modified = format_commit_date(metadata["pushed_at"])
+                        count_saved_requests(2)
+                    elif file_match:
+                        # Only file paths need the commits API
                         owner, repo, path = file_match.groups()
                         license_info = get_github_license(owner, repo)
                         last_modified = get_github_last_modified(owner, repo, path)
@@ -268,8 +460,11 @@ def validate_url(url, max_retries=5):
                         repo_match = re.match(r"https://github\.com/([^/]+)/([^/]+)", url)
                         if repo_match:
                             owner, repo = repo_match.groups()
-                            license_info = get_github_license(owner, repo)
-                            last_modified = get_github_last_modified(owner, repo)
+                            metadata = get_github_repo_metadata(owner, repo) or {}
+                            license_info = metadata.get("license") or "NOT_FOUND"
+                            if metadata.get("pushed_at"):
+                                last_modified = format_commit_date(metadata["pushed_at"])
+                            count_saved_requests()
                 return True, response.status_code, license_info, last_modified
 
             # Client errors (except rate limit) don't need retry
@@ -295,10 +490,101 @@ def validate_url(url, max_retries=5):
     return False, "Max retries exceeded", None, None
 
 
-def validate_links(csv_file, max_links=None, ignore_overrides=False):
+class HostLimiter:
+    """Cap the number of in-flight requests per host across worker threads."""
+
+    def __init__(self, per_host_limit=DEFAULT_PER_HOST_LIMIT):
+        self.per_host_limit = max(1, per_host_limit)
+        self._semaphores = {}
+        self._lock = threading.Lock()
+
+    def _semaphore_for(self, host):
+        with self._lock:
+            semaphore = self._semaphores.get(host)
+            if semaphore is None:
+                semaphore = threading.BoundedSemaphore(self.per_host_limit)
+                self._semaphores[host] = semaphore
+            return semaphore
+
+    def validate(self, url):
+        """Run validate_url() while holding the slot for the URL's request host."""
+        api_url, is_github, _, _ = parse_github_url(url)
+        host = urlparse(api_url if is_github else url).netloc.lower()
+        with self._semaphore_for(host):
+            return validate_url(url)
+
+
+def prefetch_repo_metadata(urls):
+    """
+    Fill REPO_METADATA for GitHub file/tree links with batched GraphQL queries.
+    Repository root URLs are skipped: their validation request already returns the metadata.
+    Returns the number of repositories prefetched.
+    """
+    global GITHUB_REQUESTS_SAVED
+    if not get_client().tokens:
+        return 0
+
+    repos = set()
+    for url in urls:
+        api_url, is_github, owner, repo = parse_github_url(url)
+        if is_github and api_url != f"https://api.github.com/repos/{owner}/{repo}":
+            repos.add((owner, repo))
+    if not repos:
+        return 0
+
+    prefetched = 0
+    for key, stats in fetch_repos_metadata(repos).items():
+        if stats.get("error"):
+            continue
+        REPO_METADATA[key] = {
+            "license": stats.get("license") or None,
+            "default_branch": stats.get("default_branch"),
+            "pushed_at": stats.get("pushed_at"),
+        }
+        prefetched += 1
+
+    if prefetched:
+        # The batch queries themselves are GitHub requests too
+        GITHUB_REQUESTS_SAVED -= math.ceil(len(repos) / DEFAULT_BATCH_SIZE)
+    return prefetched
+
+
+def validate_urls(urls, workers=DEFAULT_WORKERS, per_host_limit=DEFAULT_PER_HOST_LIMIT):
+    """
+    Validate a list of URLs, optionally in parallel.
+    Returns the validate_url() results in the same order as the input URLs.
+    """
+    if workers <= 1 or len(urls) <= 1:
+        return [validate_url(url) for url in urls]
+
+    limiter = HostLimiter(per_host_limit)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(limiter.validate, urls))
+
+
+def validate_links(
+    csv_file,
+    max_links=None,
+    ignore_overrides=False,
+    workers=DEFAULT_WORKERS,
+    per_host_limit=DEFAULT_PER_HOST_LIMIT,
+    use_cache=True,
+):
     """
     Validate links in the CSV file and update the Active status and timestamp.
+
+    Rows are selected serially (overrides, skips, max_links), the selected URLs are
+    validated with up to `workers` threads, and results are applied back in row order
+    so the output CSV is identical to a serial run.
+
+    With use_cache, requests carry ETag / Last-Modified validators from previous runs
+    and 304 responses are answered from HTTP_CACHE_FILE.
     """
+    global HTTP_CACHE, GITHUB_REQUESTS_SAVED
+    HTTP_CACHE = HTTPValidationCache(HTTP_CACHE_FILE) if use_cache else None
+    REPO_METADATA.clear()
+    GITHUB_REQUESTS_SAVED = 0
+
     # Load overrides
     overrides = {} if ignore_overrides else load_overrides()
 
@@ -321,9 +607,13 @@ def validate_links(csv_file, max_links=None, ignore_overrides=False):
     print(f"Starting validation of {total_resources} resources...")
     if overrides and not ignore_overrides:
         print(f"Loaded {len(overrides)} resource overrides")
+    if workers > 1:
+        print(f"Concurrent mode: {workers} workers, max {per_host_limit} requests per host")
 
+    # Select rows to validate
+    jobs = []
     for _, row in enumerate(rows):
-        if max_links and processed >= max_links:
+        if max_links and len(jobs) >= max_links:
             print(f"\nReached maximum link limit ({max_links}). Stopping validation.")
             break
 
@@ -351,13 +641,22 @@ def validate_links(csv_file, max_links=None, ignore_overrides=False):
         primary_url = row.get(PRIMARY_LINK_HEADER_NAME, "").strip()
         # secondary_url = row.get(SECONDARY_LINK_HEADER_NAME, "").strip()  # Ignoring secondary URLs
 
+        jobs.append((row, locked_fields, primary_url))
+
+    prefetched = prefetch_repo_metadata([primary_url for _, _, primary_url in jobs])
+    if prefetched:
+        print(f"Prefetched metadata for {prefetched} GitHub repositories via GraphQL")
+
+    # Validate primary URLs
+    results = validate_urls([primary_url for _, _, primary_url in jobs], workers, per_host_limit)
+
+    for (row, locked_fields, primary_url), result in zip(jobs, results):
+        primary_valid, primary_status, license_info, last_modified = result
+
         # Track GitHub links
         if "github.com" in primary_url:
             github_links += 1
 
-        # Validate primary URL
-        primary_valid, primary_status, license_info, last_modified = validate_url(primary_url)
-
         # Update license if found and not locked
         if license_info and "license" not in locked_fields:
             row[LICENSE_HEADER_NAME] = license_info
@@ -412,6 +711,9 @@ def validate_links(csv_file, max_links=None, ignore_overrides=False):
 
         processed += 1
 
+    if HTTP_CACHE is not None:
+        HTTP_CACHE.save()
+
     # Write updated CSV
     with open(OUTPUT_FILE, "w", encoding="utf-8", newline="") as f:
         assert fieldnames is not None
@@ -425,8 +727,11 @@ def validate_links(csv_file, max_links=None, ignore_overrides=False):
     print(f"Processed: {processed}")
     print(f"GitHub links: {github_links}")
     print(f"GitHub API calls: {github_api_calls}")
+    print(f"GitHub API requests saved: {GITHUB_REQUESTS_SAVED}")
     if last_modified_updates:
         print(f"Last modified dates fetched: {last_modified_updates}")
+    if HTTP_CACHE is not None:
+        print(f"Not modified (304) cache hits: {HTTP_CACHE.hits}")
     if override_count:
         print(f"Resources with overrides: {override_count}")
         print(f"Total locked fields: {locked_field_count}")
@@ -453,6 +758,8 @@ def validate_links(csv_file, max_links=None, ignore_overrides=False):
         "newly_broken": len(newly_broken_links),
         "github_links": github_links,
         "github_api_calls": github_api_calls,
+        "github_requests_saved": GITHUB_REQUESTS_SAVED,
+        "cache_hits": HTTP_CACHE.hits if HTTP_CACHE is not None else 0,
         "override_count": override_count,
         "locked_fields": locked_field_count,
         "broken_links": broken_links,
@@ -466,6 +773,16 @@ def main():
     parser.add_argument("--max-links", type=int, help="Maximum number of links to validate")
     parser.add_argument("--github-action", action="store_true", help="Run in GitHub Action mode")
     parser.add_argument("--ignore-overrides", action="store_true", help="Ignore override configuration")
+    parser.add_argument(
+        "--workers", type=int, default=DEFAULT_WORKERS, help="Number of concurrent validation workers (default: 1)"
+    )
+    parser.add_argument(
+        "--per-host",
+        type=int,
+        default=DEFAULT_PER_HOST_LIMIT,
+        help=f"Maximum concurrent requests per host in concurrent mode (default: {DEFAULT_PER_HOST_LIMIT})",
+    )
+    parser.add_argument("--no-cache", action="store_true", help="Disable the ETag / Last-Modified request cache")
     args = parser.parse_args()
 
     csv_file = INPUT_FILE
@@ -474,7 +791,9 @@ def main():
         sys.exit(1)
 
     try:
-        results = validate_links(csv_file, args.max_links, args.ignore_overrides)
+        results = validate_links(
+            csv_file, args.max_links, args.ignore_overrides, args.workers, args.per_host, not args.no_cache
+        )
 
         if args.github_action:
             # Output JSON for GitHub Action
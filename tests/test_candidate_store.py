@@ -0,0 +1,255 @@
+"""
+候选队列存储测试
+Candidate Queue Storage Tests
+
+根据 CLAUDE.md 要求:
+- 使用真实数据，不使用 Mock
+- 跟踪所有验证失败
+- 有意义的断言验证具体预期值
+"""
+
+import json
+import sys
+import tempfile
+import threading
+from pathlib import Path
+
+# 添加项目根目录到 Python 路径
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from scripts.candidate_store import JsonCandidateStore, SqliteCandidateStore, read_queue_file
+
+
+def make_resource(number: int) -> dict:
+    """构造测试资源 / Build a test resource"""
+    return {
+        "ID": f"tool-{number:04d}",
+        "DisplayName": f"Tool {number}",
+        "Category": "tooling",
+        "PrimaryLink": f"https://github.com/example/tool-{number}",
+        "_status": "pending",
+    }
+
+
+def exercise_store(store, queue_files: dict) -> list:
+    """对存储执行同一组操作并检查导出结果 / Run the same operations on a store and check the export"""
+    failures = []
+    name = store.backend
+
+    store.append("pending", [make_resource(i) for i in range(5)])
+    store.update("pending", dict(make_resource(1), DisplayName="Tool One"))
+    store.remove("pending", ["tool-0003"])
+    moved = store.move("tool-0002", "pending", "rejected", _status="rejected", _reject_reason="dup")
+    store.export()
+
+    if not moved or moved.get("_reject_reason") != "dup":
+        failures.append(f"❌ [{name}] move 未返回更新后的资源: {moved}")
+
+    if not store.contains_url("pending", "https://www.github.com/Example/tool-4/"):
+        failures.append(f"❌ [{name}] contains_url 未找到规范化后的 URL")
+    if store.contains_url("pending", "https://github.com/example/tool-3"):
+        failures.append(f"❌ [{name}] 已移除的 URL 仍在队列中")
+
+    pending = read_queue_file(queue_files["pending"])
+    rejected = read_queue_file(queue_files["rejected"])
+    expected_pending = ["tool-0000", "tool-0001", "tool-0004"]
+    if [r["ID"] for r in pending] != expected_pending:
+        failures.append(f"❌ [{name}] 导出的 pending 错误: {[r['ID'] for r in pending]}")
+    if pending[1:2] and pending[1]["DisplayName"] != "Tool One":
+        failures.append(f"❌ [{name}] update 未生效: {pending[1]['DisplayName']}")
+    if [(r["ID"], r["_status"]) for r in rejected] != [("tool-0002", "rejected")]:
+        failures.append(f"❌ [{name}] 导出的 rejected 错误: {rejected}")
+
+    return failures
+
+
+def test_backends_agree():
+    """测试 JSON 与 SQLite 后端行为一致。Test the JSON and SQLite backends behave the same."""
+    failures = []
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for backend in ("json", "sqlite"):
+            folder = Path(tmp) / backend
+            queue_files = {"pending": folder / "pending.json", "rejected": folder / "rejected.json"}
+            if backend == "json":
+                store = JsonCandidateStore(queue_files)
+            else:
+                store = SqliteCandidateStore(folder / "candidates.db", queue_files)
+            failures.extend(exercise_store(store, queue_files))
+
+    return failures
+
+
+def test_sqlite_reimports_edited_json():
+    """测试 JSON 被外部修改后 SQLite 重新导入。Test SQLite re-imports JSON edited outside the store."""
+    failures = []
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        queue_files = {"pending": tmp / "pending.json", "rejected": tmp / "rejected.json"}
+        store = SqliteCandidateStore(tmp / "candidates.db", queue_files)
+        store.append("pending", [make_resource(1)])
+        store.export()
+
+        # 未修改：重新打开后内容不变 / Untouched: reopening keeps the rows
+        reopened = SqliteCandidateStore(tmp / "candidates.db", queue_files)
+        if [r["ID"] for r in reopened.load("pending")] != ["tool-0001"]:
+            failures.append(f"❌ 重新打开后内容错误: {reopened.load('pending')}")
+
+        # 手工编辑 JSON（如 git pull）/ Hand-edited JSON (e.g. git pull)
+        data = {"resources": [make_resource(7), make_resource(8)]}
+        queue_files["pending"].write_text(json.dumps(data), encoding="utf-8")
+        edited = SqliteCandidateStore(tmp / "candidates.db", queue_files)
+        if [r["ID"] for r in edited.load("pending")] != ["tool-0007", "tool-0008"]:
+            failures.append(f"❌ 未从修改后的 JSON 重新导入: {[r['ID'] for r in edited.load('pending')]}")
+
+    return failures
+
+
+def test_sqlite_export_from_another_process():
+    """测试写操作不导出，另一个存储实例可以补做导出。Test writes do not export and another store instance can export them."""
+    failures = []
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        queue_files = {"pending": tmp / "pending.json", "rejected": tmp / "rejected.json"}
+        writer = SqliteCandidateStore(tmp / "candidates.db", queue_files)
+        writer.append("pending", [make_resource(1), make_resource(2)])
+        writer.move("tool-0002", "pending", "rejected", _status="rejected")
+
+        if queue_files["pending"].exists() or queue_files["rejected"].exists():
+            failures.append("❌ 写操作不应导出 JSON")
+
+        # 相当于单独运行 --export / Equivalent to a separate --export run
+        SqliteCandidateStore(tmp / "candidates.db", queue_files).export()
+        pending = [r["ID"] for r in read_queue_file(queue_files["pending"])]
+        rejected = [r["ID"] for r in read_queue_file(queue_files["rejected"])]
+        if pending != ["tool-0001"] or rejected != ["tool-0002"]:
+            failures.append(f"❌ 另一个实例导出的结果错误: pending {pending}，rejected {rejected}")
+
+        # 已导出的队列不再重写 / Exported queues are not rewritten again
+        mtime = queue_files["pending"].stat().st_mtime_ns
+        writer.export()
+        if queue_files["pending"].stat().st_mtime_ns != mtime:
+            failures.append("❌ 没有改动的队列被重新导出")
+
+    return failures
+
+
+def test_journal_parallel_producers():
+    """测试多个生产者并行追加不丢数据，日志合并进快照。Test parallel producers lose nothing and the journal compacts."""
+    failures = []
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        queue_files = {"pending": tmp / "pending.json", "rejected": tmp / "rejected.json"}
+
+        # 每个生产者用独立的存储实例，只靠文件锁互斥 / One store per producer, excluded only by the file lock
+        def produce(worker: int):
+            store = JsonCandidateStore(queue_files, compact_every=25)
+            for i in range(40):
+                store.append("pending", [make_resource(worker * 100 + i)])
+
+        threads = [threading.Thread(target=produce, args=(worker,)) for worker in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        store = JsonCandidateStore(queue_files)
+        if len(store.load("pending")) != 160:
+            failures.append(f"❌ 并行追加丢失数据: 期望 160，实际 {len(store.load('pending'))}")
+
+        # 写入中断留下的半行被跳过 / A half line from an interrupted write is skipped
+        with open(store.journal_file, "ab") as f:
+            f.write(b'{"op": "remove", "queue": "pend')
+        store.move("tool-0001", "pending", "rejected", _status="rejected")
+        store.export()
+
+        if store.journal_file.stat().st_size != 0:
+            failures.append("❌ export() 后日志未清空")
+        pending_ids = {r["ID"] for r in read_queue_file(queue_files["pending"])}
+        rejected_ids = [r["ID"] for r in read_queue_file(queue_files["rejected"])]
+        if len(pending_ids) != 159 or "tool-0001" in pending_ids or rejected_ids != ["tool-0001"]:
+            failures.append(f"❌ 合并后的快照错误: pending {len(pending_ids)} 个，rejected {rejected_ids}")
+
+    return failures
+
+
+def test_journal_compacts_touched_queues():
+    """测试合并只重写日志改动过的队列。Test compaction only rewrites the queues the journal touched."""
+    failures = []
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        queue_files = {"pending": tmp / "pending.json", "rejected": tmp / "rejected.json"}
+        store = JsonCandidateStore(queue_files, compact_every=3)
+
+        # 达到 compact_every 时自动合并，无需 export() / Compacts on its own at compact_every, no export() needed
+        store.append("pending", [make_resource(i) for i in range(3)])
+        if store.journal_file.stat().st_size != 0:
+            failures.append("❌ 达到 compact_every 后日志未合并")
+        if queue_files["rejected"].exists():
+            failures.append("❌ 日志未改动 rejected，却重写了它的快照")
+
+        store.move("tool-0001", "pending", "rejected", _status="rejected")
+        store.export()
+        rejected_mtime = queue_files["rejected"].stat().st_mtime_ns
+
+        store.update("pending", dict(make_resource(0), DisplayName="Tool Zero"))
+        store.export()
+        if queue_files["rejected"].stat().st_mtime_ns != rejected_mtime:
+            failures.append("❌ 只改动 pending 时重写了 rejected 快照")
+        if read_queue_file(queue_files["pending"])[0]["DisplayName"] != "Tool Zero":
+            failures.append("❌ pending 快照未包含更新")
+
+    return failures
+
+
+def run_all_tests():
+    """运行所有测试并报告结果。Run all tests and report results."""
+    print("=" * 80)
+    print("候选队列存储测试 | Candidate Queue Storage Tests")
+    print("=" * 80)
+    print()
+
+    all_failures = []
+    total_tests = 0
+
+    # 定义所有测试
+    tests = [
+        ("JSON 与 SQLite 后端一致", test_backends_agree),
+        ("SQLite 重新导入修改过的 JSON", test_sqlite_reimports_edited_json),
+        ("SQLite 由另一个进程导出", test_sqlite_export_from_another_process),
+        ("日志并行写入与合并", test_journal_parallel_producers),
+        ("日志只合并改动过的队列", test_journal_compacts_touched_queues),
+    ]
+
+    # 运行所有测试
+    for test_name, test_func in tests:
+        total_tests += 1
+        print(f"🧪 测试: {test_name}")
+        failures = test_func()
+
+        if failures:
+            all_failures.extend(failures)
+            print(f"   ❌ 失败 ({len(failures)} 个问题)")
+            for failure in failures:
+                print(f"      {failure}")
+        else:
+            print("   ✅ 通过")
+        print()
+
+    # 最终结果
+    print("=" * 80)
+    if all_failures:
+        print(f"❌ 验证失败 - {len(all_failures)} 个问题，共 {total_tests} 个测试")
+        return 1
+    else:
+        print(f"✅ 验证通过 - 所有 {total_tests} 个测试成功")
+        return 0
+
+
+if __name__ == "__main__":
+    sys.exit(run_all_tests())
@@ -0,0 +1,296 @@
+"""
+增量爬取游标测试
+Incremental Crawl Cursor Tests
+
+根据 CLAUDE.md 要求:
+- 使用真实数据，不使用 Mock
+- 跟踪所有验证失败
+- 有意义的断言验证具体预期值
+"""
+
+import json
+import sys
+import tempfile
+from pathlib import Path
+
+# 添加项目根目录到 Python 路径
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from scripts.crawlers.awesome_list_crawler import AwesomeListCrawler
+from scripts.crawlers.hackernews_crawler import HackerNewsCrawler
+from scripts.crawlers.rss_crawler import RSSCrawler
+
+CONFIG = {"incremental": {"enabled": True}}
+
+
+def make_hit(number: int, created_at_i: int) -> dict:
+    """构造 HN 搜索结果 / Build an HN search hit"""
+    return {
+        "objectID": str(number),
+        "title": f"Claude Code tool {number}",
+        "url": f"https://github.com/example/claude-tool-{number}",
+        "author": "alice",
+        "points": 50,
+        "created_at_i": created_at_i,
+    }
+
+
+def test_hackernews_rewind():
+    """测试 HN 游标不越过未保存的结果。Test the HN cursor does not move past unsaved hits."""
+    failures = []
+
+    crawler = HackerNewsCrawler(CONFIG)
+    crawler._cursors = {"claude code": {"created_at_i": 1000}}
+
+    hits = [make_hit(1, 1300), make_hit(2, 1200), make_hit(3, 1100)]
+    resources = crawler._resources_from_hits([("claude code", hits)])
+    if crawler._new_cursors["claude code"]["created_at_i"] != 1300:
+        failures.append(f"❌ 游标未推进到最新结果: {crawler._new_cursors}")
+
+    # 1200 和 1100 超出数量限制 / 1200 and 1100 fall past the limit
+    crawler._rewind_cursors(resources[1:])
+    if crawler._new_cursors["claude code"]["created_at_i"] != 1099:
+        failures.append(f"❌ 游标应退回到 1099，实际 {crawler._new_cursors['claude code']}")
+
+    return failures
+
+
+def test_rss_rewind():
+    """测试 RSS 游标不越过未保存的条目。Test the RSS cursor does not move past unsaved entries."""
+    failures = []
+
+    feed_url = "https://example.com/feed.xml"
+    crawler = RSSCrawler(CONFIG)
+    crawler._cursors = {}
+
+    entries = [
+        {
+            "title": f"Claude Code hooks {n}",
+            "link": f"https://github.com/example/hooks-{n}",
+            "guid": f"post-{n}",
+            "published": f"2099-01-0{n}T10:00:00+00:00",
+        }
+        for n in (3, 2, 1)
+    ]
+    resources = crawler._resources_from_entries(entries, {"name": "Example", "url": feed_url})
+    if len(resources) != 3:
+        failures.append(f"❌ 应发现 3 个资源，实际 {len(resources)}")
+        return failures
+
+    # post-2 超出数量限制 / post-2 falls past the limit
+    crawler._rewind_cursors([resources[1]])
+    cursor = crawler._new_cursors[feed_url]
+    if "post-2" in cursor["seen_guids"] or "post-3" not in cursor["seen_guids"]:
+        failures.append(f"❌ seen_guids 错误: {cursor['seen_guids']}")
+    if cursor["last_published"] != "2099-01-02T09:59:59+00:00":
+        failures.append(f"❌ last_published 应退回到 post-2 之前: {cursor['last_published']}")
+
+    # 下次运行重新获取 post-2，但不会重复 post-3 / The next run fetches post-2 again but not post-3
+    crawler._cursors = {feed_url: cursor}
+    again = [entry["guid"] for entry in crawler._new_entries(feed_url, entries)]
+    if again != ["post-2"]:
+        failures.append(f"❌ 下次运行应只重新获取 post-2，实际 {again}")
+
+    return failures
+
+
+def test_corrupt_checkpoint_replaced():
+    """测试损坏的检查点文件被替换而不是报错。Test a corrupt checkpoint file is replaced instead of raising."""
+    failures = []
+
+    with tempfile.TemporaryDirectory() as tmp:
+        crawler = HackerNewsCrawler(CONFIG)
+        crawler.CHECKPOINT_FILE = Path(tmp) / "crawl_checkpoints.json"
+        crawler.CHECKPOINT_FILE.write_text('{"sources": {"hackernews": {"claude co', encoding="utf-8")
+
+        crawler._new_cursors = {"claude code": {"created_at_i": 1300}}
+        try:
+            crawler.save_checkpoint()
+        except ValueError as e:
+            failures.append(f"❌ 损坏的检查点导致保存失败: {e}")
+            return failures
+
+        data = json.loads(crawler.CHECKPOINT_FILE.read_text(encoding="utf-8"))
+        if data.get("sources", {}).get("hackernews") != {"claude code": {"created_at_i": 1300}}:
+            failures.append(f"❌ 检查点应只包含新游标: {data.get('sources')}")
+        if sorted(p.name for p in Path(tmp).iterdir()) != ["crawl_checkpoints.json"]:
+            failures.append(f"❌ 不应留下临时文件: {sorted(p.name for p in Path(tmp).iterdir())}")
+
+    return failures
+
+
+def make_readme(count: int) -> str:
+    """构造含 count 个链接的 README / Build a README with count links"""
+    return "\n".join(
+        f"- [Claude agent {n}](https://github.com/example/claude-agent-{n}) - Claude Code agent" for n in range(count)
+    )
+
+
+README = make_readme(5)
+
+LIST_URL = "https://github.com/example/awesome-claude"
+
+
+class FixedReadmeCrawler(AwesomeListCrawler):
+    """
+    README 内容固定的 Awesome List 爬虫，记录检查过的链接
+    Awesome list crawler with a fixed README, recording examined links
+    """
+
+    readme = README
+
+    def __init__(self, config: dict):
+        super().__init__(config)
+        self.examined = []
+
+    def _resolve_readme(self, owner, repo, list_url):
+        return self._readme_sha(self.readme), self.readme
+
+    def _filter_link(self, title, url, description, keywords):
+        self.examined.append(url.rsplit("-", 1)[1])
+        return super()._filter_link(title, url, description, keywords)
+
+
+def test_awesome_list_cap():
+    """测试达到链接上限时 README SHA 不推进。Test the README SHA does not advance when the link cap is hit."""
+    failures = []
+
+    config = {**CONFIG, "awesome_lists": {"deep_parse": False, "max_links_per_list": 2}}
+    list_config = {"name": "Awesome Claude", "url": LIST_URL}
+    crawler = FixedReadmeCrawler(config)
+    crawler._cursors = {}
+    crawler._readme_cache = {}
+
+    seen = []
+    for run in range(3):
+        resources = crawler._crawl_awesome_list(list_config)
+        seen.extend(resource["PrimaryLink"] for resource in resources)
+        crawler._cursors = {LIST_URL: crawler._new_cursors[LIST_URL]}
+        crawler._new_cursors = {}
+
+        complete = run == 2
+        if ("readme_sha" in crawler._cursors[LIST_URL]) != complete:
+            failures.append(f"❌ 第 {run + 1} 次运行后游标错误: {crawler._cursors[LIST_URL]}")
+
+    expected = [f"https://github.com/example/claude-agent-{n}" for n in range(5)]
+    if seen != expected:
+        failures.append(f"❌ 三次运行应依次处理全部 5 个链接，实际 {seen}")
+    if crawler._cursors[LIST_URL].get("processed_urls") != []:
+        failures.append(f"❌ 完成后应清空 processed_urls: {crawler._cursors[LIST_URL]}")
+
+    # 完成后 README 未变化则跳过 / Once complete an unchanged README is skipped
+    if crawler._crawl_awesome_list(list_config):
+        failures.append("❌ README 未变化时不应再发现资源")
+
+    return failures
+
+
+def test_awesome_list_rewind():
+    """测试未保存的链接下次重新获取。Test unsaved links are fetched again next run."""
+    failures = []
+
+    config = {**CONFIG, "awesome_lists": {"deep_parse": False, "max_links_per_list": 10}}
+    list_config = {"name": "Awesome Claude", "url": LIST_URL}
+    crawler = FixedReadmeCrawler(config)
+    crawler._cursors = {}
+    crawler._readme_cache = {}
+
+    resources = crawler._crawl_awesome_list(list_config)
+    # 只保存了前 3 个 / Only the first 3 were saved
+    crawler._rewind_cursors(resources[3:])
+    cursor = crawler._new_cursors[LIST_URL]
+    if "readme_sha" in cursor:
+        failures.append(f"❌ 有未保存链接时不应记录 README SHA: {cursor}")
+
+    crawler._cursors = {LIST_URL: cursor}
+    crawler._new_cursors = {}
+    again = [resource["PrimaryLink"] for resource in crawler._crawl_awesome_list(list_config)]
+    if again != [resource["PrimaryLink"] for resource in resources[3:]]:
+        failures.append(f"❌ 下次运行应只重新获取未保存的链接，实际 {again}")
+
+    return failures
+
+
+def test_awesome_list_resume_changed_readme():
+    """测试 README 变化后分多次处理时不重复检查旧链接。Test a changed README resumed over several runs never re-examines old links."""
+    failures = []
+
+    config = {**CONFIG, "awesome_lists": {"deep_parse": False, "max_links_per_list": 10}}
+    list_config = {"name": "Awesome Claude", "url": LIST_URL}
+    crawler = FixedReadmeCrawler(config)
+    crawler._cursors = {}
+    crawler._readme_cache = {}
+
+    def run() -> list:
+        crawler.examined = []
+        crawler._crawl_awesome_list(list_config)
+        crawler._cursors = {LIST_URL: crawler._new_cursors[LIST_URL]}
+        crawler._new_cursors = {}
+        return crawler.examined
+
+    # README A 完整处理 / README A is fully processed
+    if run() != ["0", "1", "2", "3", "4"]:
+        failures.append(f"❌ README A 应处理全部链接，实际 {crawler.examined}")
+
+    # README B 新增 5 个链接，上限 2：分三次处理 / README B adds 5 links; with a cap of 2 it takes three runs
+    crawler.readme = make_readme(10)
+    crawler.max_links_per_list = 2
+    runs = [run() for _ in range(3)]
+    if runs != [["5", "6"], ["7", "8"], ["9"]]:
+        failures.append(f"❌ 应只检查 README B 新增的链接，实际 {runs}")
+
+    cursor = crawler._cursors[LIST_URL]
+    if cursor.get("readme_sha") != crawler._readme_sha(crawler.readme) or cursor.get("processed_urls") != []:
+        failures.append(f"❌ README B 处理完成后游标错误: {cursor}")
+
+    return failures
+
+
+def run_all_tests():
+    """运行所有测试并报告结果。Run all tests and report results."""
+    print("=" * 80)
+    print("增量爬取游标测试 | Incremental Crawl Cursor Tests")
+    print("=" * 80)
+    print()
+
+    all_failures = []
+    total_tests = 0
+
+    # 定义所有测试
+    tests = [
+        ("HN 游标回退", test_hackernews_rewind),
+        ("RSS 游标回退", test_rss_rewind),
+        ("损坏的检查点文件", test_corrupt_checkpoint_replaced),
+        ("Awesome List 链接上限", test_awesome_list_cap),
+        ("Awesome List 游标回退", test_awesome_list_rewind),
+        ("Awesome List README 变化后续处理", test_awesome_list_resume_changed_readme),
+    ]
+
+    # 运行所有测试
+    for test_name, test_func in tests:
+        total_tests += 1
+        print(f"🧪 测试: {test_name}")
+        failures = test_func()
+
+        if failures:
+            all_failures.extend(failures)
+            print(f"   ❌ 失败 ({len(failures)} 个问题)")
+            for failure in failures:
+                print(f"      {failure}")
+        else:
+            print("   ✅ 通过")
+        print()
+
+    # 最终结果
+    print("=" * 80)
+    if all_failures:
+        print(f"❌ 验证失败 - {len(all_failures)} 个问题，共 {total_tests} 个测试")
+        return 1
+    else:
+        print(f"✅ 验证通过 - 所有 {total_tests} 个测试成功")
+        return 0
+
+
+if __name__ == "__main__":
+    sys.exit(run_all_tests())
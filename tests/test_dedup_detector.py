@@ -0,0 +1,160 @@
+"""
+重复检测测试
+Duplicate Detection Tests
+
+根据 CLAUDE.md 要求:
+- 使用真实数据，不使用 Mock
+- 跟踪所有验证失败
+- 有意义的断言验证具体预期值
+"""
+
+import random
+import sys
+from pathlib import Path
+
+# 添加项目根目录到 Python 路径
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from scripts.dedup_detector import (
+    DuplicateDetector,
+    bounded_levenshtein,
+    extract_package_name,
+    levenshtein_distance,
+    load_existing_resources,
+    name_similarity,
+)
+
+
+def test_bounded_levenshtein():
+    """测试带上限的编辑距离与完整 DP 一致。Test bounded edit distance agrees with the full DP."""
+    failures = []
+
+    rng = random.Random(7)
+    alphabet = "abc de"
+    for _ in range(2000):
+        s1 = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 12)))
+        s2 = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 12)))
+        max_dist = rng.randint(0, 6)
+
+        exact = levenshtein_distance(s1, s2)
+        bounded = bounded_levenshtein(s1, s2, max_dist)
+        expected = exact if exact <= max_dist else max_dist + 1
+        if bounded != expected:
+            failures.append(f"❌ bounded_levenshtein({s1!r}, {s2!r}, {max_dist}) = {bounded}，期望 {expected}")
+            break
+
+    return failures
+
+
+def test_name_index_matches_full_scan():
+    """测试三元组索引的名称查找与全表扫描一致。Test trigram name lookup agrees with a full scan."""
+    failures = []
+
+    resources = [r for r in load_existing_resources() if r.get("DisplayName")]
+    if not resources:
+        failures.append("❌ THE_RESOURCES_TABLE.csv 没有资源")
+        return failures
+
+    detector = DuplicateDetector(existing_resources=resources, rejected_resources=[], persist_index=False)
+
+    rng = random.Random(11)
+    for res in rng.sample(resources, min(40, len(resources))):
+        name = res["DisplayName"]
+        # 制造一个拼写变体 / Introduce a typo
+        pos = rng.randrange(len(name))
+        query = name[:pos] + name[pos + 1 :]
+
+        expected = {r["ID"] for r in resources if name_similarity(query, r["DisplayName"]) >= detector.name_threshold}
+        actual = {r["ID"] for r, _ in detector.check_name_similarity(query)}
+        if actual != expected:
+            failures.append(f"❌ 名称 {query!r} 的相似结果不一致: 索引 {sorted(actual)}，全表 {sorted(expected)}")
+
+    return failures
+
+
+def test_cluster_pending_groups():
+    """测试待审核队列内部聚类。Test clustering the pending queue against itself."""
+    failures = []
+
+    pending = [
+        {"ID": "p1", "DisplayName": "Claudemesh sessions", "PrimaryLink": "https://www.npmjs.com/package/claudemesh"},
+        {
+            "ID": "p2",
+            "DisplayName": "claudemesh",
+            "PrimaryLink": "https://github.com/alice/claudemesh",
+            "_relevance_score": 80,
+        },
+        {"ID": "p3", "DisplayName": "Show HN: Claudemesh", "PrimaryLink": "https://github.com/Alice/claudemesh/"},
+        {"ID": "p4", "DisplayName": "mcp-server", "PrimaryLink": "https://github.com/finmap-org/mcp-server"},
+        {"ID": "p5", "DisplayName": "npm", "PrimaryLink": "https://www.npmjs.com/package/@roamzy/mcp-server"},
+        {
+            "ID": "p6",
+            "DisplayName": "Roamzy MCP",
+            "PrimaryLink": "https://github.com/roamzy/roamzy-mcp",
+            "SecondaryLink": "https://www.npmjs.com/package/@roamzy/mcp-server",
+        },
+        # 两个同名仓库：无作用域的包无法判断属于哪一个 / Two repos share a name: the unscoped package is ambiguous
+        {"ID": "p7", "DisplayName": "Ledger hooks", "PrimaryLink": "https://github.com/owner-a/claude-tools"},
+        {"ID": "p8", "DisplayName": "Prompt vault", "PrimaryLink": "https://github.com/owner-b/claude-tools"},
+        {"ID": "p9", "DisplayName": "Session exporter", "PrimaryLink": "https://www.npmjs.com/package/claude-tools"},
+    ]
+    expected = {("p2", ("p1", "p3")), ("p6", ("p5",))}
+
+    detector = DuplicateDetector(existing_resources=[], rejected_resources=[], persist_index=False)
+    groups = detector.cluster_pending(pending)
+    actual = {(g["canonical"]["ID"], tuple(sorted(r["ID"] for r in g["duplicates"]))) for g in groups}
+
+    if actual != expected:
+        failures.append(f"❌ 重复组错误: 期望 {sorted(expected)}，实际 {sorted(actual)}")
+
+    if extract_package_name("https://pypi.org/project/Agent_Cost.CLI/0.1.0/") != "agent-cost-cli":
+        failures.append("❌ PyPI 包名未规范化")
+
+    return failures
+
+
+def run_all_tests():
+    """运行所有测试并报告结果。Run all tests and report results."""
+    print("=" * 80)
+    print("重复检测测试 | Duplicate Detection Tests")
+    print("=" * 80)
+    print()
+
+    all_failures = []
+    total_tests = 0
+
+    # 定义所有测试
+    tests = [
+        ("带上限的编辑距离", test_bounded_levenshtein),
+        ("名称索引与全表扫描一致", test_name_index_matches_full_scan),
+        ("待审核队列内部聚类", test_cluster_pending_groups),
+    ]
+
+    # 运行所有测试
+    for test_name, test_func in tests:
+        total_tests += 1
+        print(f"🧪 测试: {test_name}")
+        failures = test_func()
+
+        if failures:
+            all_failures.extend(failures)
+            print(f"   ❌ 失败 ({len(failures)} 个问题)")
+            for failure in failures:
+                print(f"      {failure}")
+        else:
+            print("   ✅ 通过")
+        print()
+
+    # 最终结果
+    print("=" * 80)
+    if all_failures:
+        print(f"❌ 验证失败 - {len(all_failures)} 个问题，共 {total_tests} 个测试")
+        return 1
+    else:
+        print(f"✅ 验证通过 - 所有 {total_tests} 个测试成功")
+        return 0
+
+
+if __name__ == "__main__":
+    sys.exit(run_all_tests())
@@ -0,0 +1,232 @@
+"""
+流式 feed 解析测试
+Streaming Feed Parser Tests
+
+根据 CLAUDE.md 要求:
+- 使用真实数据，不使用 Mock
+- 跟踪所有验证失败
+- 有意义的断言验证具体预期值
+"""
+
+import sys
+from pathlib import Path
+
+# 添加项目根目录到 Python 路径
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from scripts.crawlers import HAS_AIOHTTP, AsyncRSSCrawler, RSSCrawler
+from scripts.crawlers.feed_parser import FeedStreamParser, parse_feed
+from scripts.multi_source_crawl import load_config
+
+RSS_FEED = b"""<?xml version="1.0" encoding="UTF-8"?>
+<rss version="2.0"
+     xmlns:dc="http://purl.org/dc/elements/1.1/"
+     xmlns:content="http://purl.org/rss/1.0/modules/content/"
+     xmlns:atom="http://www.w3.org/2005/Atom">
+  <channel>
+    <title>Example Feed</title>
+    <atom:link href="https://example.com/feed.xml" rel="self"/>
+    <item>
+      <title><![CDATA[Claude Code <b>hooks</b> guide]]></title>
+      <link>https://example.com/hooks</link>
+      <guid isPermaLink="false">post-2</guid>
+      <pubDate>Tue, 01 Sep 2026 10:00:00 +0000</pubDate>
+      <dc:creator>Alice</dc:creator>
+      <content:encoded><![CDATA[<p>Use hooks &amp; MCP servers</p>]]></content:encoded>
+    </item>
+    <item>
+      <title>MCP server roundup</title>
+      <link>https://example.com/mcp</link>
+      <guid>post-1</guid>
+      <description>Servers &lt;b&gt;worth&lt;/b&gt; trying</description>
+    </item>
+    <item>
+      <title>Third post</title>
+      <link>https://example.com/third</link>
+    </item>
+  </channel>
+</rss>
+"""
+
+ATOM_FEED = b"""<?xml version="1.0" encoding="utf-8"?>
+<feed xmlns="http://www.w3.org/2005/Atom">
+  <title>Atom Example</title>
+  <entry>
+    <title>Claude Code statusline</title>
+    <link rel="self" href="https://example.com/api/1"/>
+    <link rel="alternate" href="https://example.com/statusline"/>
+    <id>tag:example.com,2026:1</id>
+    <updated>2026-09-01T10:00:00Z</updated>
+    <author><name>Bob</name><uri>https://example.com/bob</uri></author>
+    <content type="xhtml"><div xmlns="http://www.w3.org/1999/xhtml">A <em>custom</em> statusline</div></content>
+    <source><title>Original Source</title></source>
+  </entry>
+</feed>
+"""
+
+
+def test_rss_fields():
+    """测试 RSS 2.0 字段、CDATA 和命名空间。Test RSS 2.0 fields, CDATA and namespaces."""
+    failures = []
+
+    entries = parse_feed([RSS_FEED])
+
+    if len(entries) != 3:
+        failures.append(f"❌ RSS 条目数错误: 期望 3，实际 {len(entries)}")
+        return failures
+
+    first = entries[0]
+    expected = {
+        "title": "Claude Code <b>hooks</b> guide",
+        "link": "https://example.com/hooks",
+        "guid": "post-2",
+        "published": "Tue, 01 Sep 2026 10:00:00 +0000",
+        "author": "Alice",
+        "description": "<p>Use hooks &amp; MCP servers</p>",
+    }
+    for field, value in expected.items():
+        if first.get(field) != value:
+            failures.append(f"❌ RSS 字段 {field} 错误: 期望 {value!r}，实际 {first.get(field)!r}")
+
+    if entries[1]["description"] != "Servers <b>worth</b> trying":
+        failures.append(f"❌ 转义的 description 未解码: {entries[1]['description']!r}")
+
+    return failures
+
+
+def test_atom_fields():
+    """测试 Atom 字段和嵌套元素。Test Atom fields and nested elements."""
+    failures = []
+
+    entries = parse_feed([ATOM_FEED])
+
+    if len(entries) != 1:
+        failures.append(f"❌ Atom 条目数错误: 期望 1，实际 {len(entries)}")
+        return failures
+
+    entry = entries[0]
+    expected = {
+        "title": "Claude Code statusline",
+        "link": "https://example.com/statusline",
+        "guid": "tag:example.com,2026:1",
+        "published": "2026-09-01T10:00:00Z",
+        "author": "Bob",
+        "description": "A custom statusline",
+    }
+    for field, value in expected.items():
+        if entry.get(field) != value:
+            failures.append(f"❌ Atom 字段 {field} 错误: 期望 {value!r}，实际 {entry.get(field)!r}")
+
+    return failures
+
+
+def test_limit_stops_reading():
+    """测试达到上限后停止读取。Test reading stops once the limit is reached."""
+    failures = []
+
+    parser = FeedStreamParser(limit=2)
+    consumed = 0
+    for i in range(len(RSS_FEED)):
+        consumed += 1
+        if parser.feed(RSS_FEED[i : i + 1]):
+            break
+    entries = parser.close()
+
+    if [e["link"] for e in entries] != ["https://example.com/hooks", "https://example.com/mcp"]:
+        failures.append(f"❌ 逐字节解析结果错误: {[e['link'] for e in entries]}")
+
+    if consumed >= len(RSS_FEED):
+        failures.append("❌ 达到上限后仍读取了整个文档")
+
+    return failures
+
+
+def test_malformed_feed_keeps_entries():
+    """测试格式错误时保留已解析条目。Test entries parsed before an error are kept."""
+    failures = []
+
+    broken = RSS_FEED.replace(b"<title>Third post</title>", b"<title>Third &nbsp; post</title>")
+    parser = FeedStreamParser()
+    parser.feed(broken)
+    entries = parser.close()
+
+    if parser.error is None:
+        failures.append("❌ 未记录解析错误")
+
+    if len(entries) != 2:
+        failures.append(f"❌ 错误前的条目应保留: 期望 2，实际 {len(entries)}")
+
+    return failures
+
+
+def test_feed_host_rate_limits():
+    """测试 feed 主机使用 rate_limits.rss 配置。Test feed hosts use the rate_limits.rss settings."""
+    failures = []
+
+    config = load_config()
+    rate_limits = config["rate_limits"]
+    crawler = RSSCrawler(config, rate_limits)
+
+    if crawler._min_interval_for("blog.example.com") != rate_limits["rss"]["min_interval"]:
+        failures.append(f"❌ feed 主机应使用 rss.min_interval，实际 {crawler._min_interval_for('blog.example.com')}")
+    # 已知主机仍按主机匹配 / Known hosts still match by host
+    if crawler._min_interval_for("hnrss.org") != rate_limits["hackernews"]["min_interval"]:
+        failures.append(f"❌ hnrss.org 应使用 hackernews 配置，实际 {crawler._min_interval_for('hnrss.org')}")
+
+    if HAS_AIOHTTP:
+        bucket = AsyncRSSCrawler(config, rate_limits)._bucket_for("rate-limit-test.example.com")
+        if bucket.capacity != rate_limits["rss"]["burst"]:
+            failures.append(f"❌ 令牌桶容量应为 rss.burst，实际 {bucket.capacity}")
+        if bucket.rate != rate_limits["rss"]["max_requests_per_minute"] / 60:
+            failures.append(f"❌ 令牌桶速率应来自 rss.max_requests_per_minute，实际 {bucket.rate}")
+
+    return failures
+
+
+def run_all_tests():
+    """运行所有测试并报告结果。Run all tests and report results."""
+    print("=" * 80)
+    print("流式 feed 解析测试 | Streaming Feed Parser Tests")
+    print("=" * 80)
+    print()
+
+    all_failures = []
+    total_tests = 0
+
+    # 定义所有测试
+    tests = [
+        ("RSS 2.0 字段", test_rss_fields),
+        ("Atom 字段", test_atom_fields),
+        ("上限提前停止", test_limit_stops_reading),
+        ("格式错误容错", test_malformed_feed_keeps_entries),
+        ("feed 主机速率限制", test_feed_host_rate_limits),
+    ]
+
+    # 运行所有测试
+    for test_name, test_func in tests:
+        total_tests += 1
+        print(f"🧪 测试: {test_name}")
+        failures = test_func()
+
+        if failures:
+            all_failures.extend(failures)
+            print(f"   ❌ 失败 ({len(failures)} 个问题)")
+            for failure in failures:
+                print(f"      {failure}")
+        else:
+            print("   ✅ 通过")
+        print()
+
+    # 最终结果
+    print("=" * 80)
+    if all_failures:
+        print(f"❌ 验证失败 - {len(all_failures)} 个问题，共 {total_tests} 个测试")
+        return 1
+    else:
+        print(f"✅ 验证通过 - 所有 {total_tests} 个测试成功")
+        return 0
+
+
+if __name__ == "__main__":
+    sys.exit(run_all_tests())
@@ -8,8 +8,10 @@ README Generation Tests
 - 有意义的断言验证具体预期值
 """
 
+import csv
 import sys
 import tempfile
+from datetime import datetime
 from pathlib import Path
 
 # 添加项目根目录到 Python 路径
@@ -18,6 +20,7 @@ sys.path.insert(0, str(PROJECT_ROOT))
 
 # 导入生成脚本
 from scripts.generate_readme import (
+    RenderCache,
     load_categories,
     load_csv_resources,
     generate_readme,
@@ -162,6 +165,101 @@ def test_generate_readme():
     return failures
 
 
+def test_render_cache():
+    """测试分类区块缓存只重新渲染修改过的分类。Test the section cache only re-renders changed categories."""
+    failures = []
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        csv_path = tmp / "resources.csv"
+        cache_path = tmp / "cache.json"
+        output_path = tmp / "README.md"
+        csv_path.write_bytes((PROJECT_ROOT / "THE_RESOURCES_TABLE.csv").read_bytes())
+
+        def run() -> bool:
+            return generate_readme(
+                csv_path=csv_path,
+                categories_path=PROJECT_ROOT / "templates" / "categories.yaml",
+                template_path=PROJECT_ROOT / "templates" / "README.template.md",
+                output_path=output_path,
+                overrides_path=None,
+                cache_path=cache_path,
+            )
+
+        if not run():
+            failures.append("❌ 首次生成未写入 README")
+        first = output_path.read_text(encoding="utf-8")
+
+        if run():
+            failures.append("❌ 内容未变化却重写了 README")
+
+        # 修改一个资源的中文描述 / Edit one resource's Chinese description
+        with open(csv_path, "r", encoding="utf-8", newline="") as f:
+            reader = csv.DictReader(f)
+            fieldnames = reader.fieldnames
+            rows = list(reader)
+        target = next(r for r in rows if r.get("IsActive", "").upper() == "TRUE")
+        target["Description_ZH"] = "缓存测试描述"
+        with open(csv_path, "w", encoding="utf-8", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=fieldnames)
+            writer.writeheader()
+            writer.writerows(rows)
+
+        cache = RenderCache(cache_path)
+        sections = cache.data["sections"]
+        if not run():
+            failures.append("❌ 资源修改后未重写 README")
+        content = output_path.read_text(encoding="utf-8")
+        if "缓存测试描述" not in content or content == first:
+            failures.append("❌ 修改后的描述未出现在 README 中")
+
+        updated = RenderCache(cache_path).data["sections"]
+        changed = {cat for cat in sections if sections[cat]["key"] != updated.get(cat, {}).get("key")}
+        if changed != {target["Category"]}:
+            failures.append(f"❌ 应只重新渲染 {target['Category']}，实际 {sorted(changed)}")
+
+    return failures
+
+
+def test_date_only_change_skipped():
+    """测试没有缓存文件时只差日期的 README 也不重写。Test a date-only difference is not rewritten even without a cache file."""
+    failures = []
+
+    with tempfile.TemporaryDirectory() as tmp:
+        output_path = Path(tmp) / "README.md"
+
+        def run() -> bool:
+            # 不使用渲染缓存，与 CI 中的全新检出一致 / No render cache, as in a fresh CI checkout
+            return generate_readme(
+                csv_path=PROJECT_ROOT / "THE_RESOURCES_TABLE.csv",
+                categories_path=PROJECT_ROOT / "templates" / "categories.yaml",
+                template_path=PROJECT_ROOT / "templates" / "README.template.md",
+                output_path=output_path,
+                overrides_path=None,
+                cache_path=None,
+            )
+
+        run()
+        today = datetime.now().strftime("%Y-%m-%d")
+        old = output_path.read_text(encoding="utf-8").replace(today, "2020-01-01")
+        output_path.write_text(old, encoding="utf-8")
+
+        if run():
+            failures.append("❌ 只有日期不同却重写了 README")
+        if output_path.read_text(encoding="utf-8") != old:
+            failures.append("❌ 应保留原 README 及其日期")
+
+        # 正文被改动时重新生成 / A changed body is regenerated
+        output_path.write_text(old.replace("Last Updated", "Last Edited"), encoding="utf-8")
+        if not run():
+            failures.append("❌ 正文变化后未重写 README")
+        content = output_path.read_text(encoding="utf-8")
+        if "Last Edited" in content or today not in content:
+            failures.append("❌ 重写后的 README 应使用当天日期")
+
+    return failures
+
+
 def test_readme_chinese_encoding():
     """测试 README 中文编码正确。Test README Chinese encoding."""
     failures = []
@@ -239,6 +337,8 @@ def run_all_tests():
         ("加载分类配置", test_load_categories),
         ("加载 CSV 资源", test_load_csv_resources),
         ("生成 README", test_generate_readme),
+        ("分类区块渲染缓存", test_render_cache),
+        ("只有日期变化时不重写", test_date_only_change_skipped),
         ("README 中文编码", test_readme_chinese_encoding),
         ("README 结构完整性", test_readme_structure),
     ]
@@ -0,0 +1,210 @@
+"""
+共享 GitHub 客户端测试
+Shared GitHub Client Tests
+
+根据 CLAUDE.md 要求:
+- 使用真实数据，不使用 Mock
+- 跟踪所有验证失败
+- 有意义的断言验证具体预期值
+
+请求由挂载在 session 上的传输适配器应答，不访问网络；时钟和等待由测试控制。
+Requests are answered by a transport adapter mounted on the session, without network
+access; the clock and waits are driven by the test.
+"""
+
+import sys
+from pathlib import Path
+
+import requests
+from requests.adapters import BaseAdapter
+
+# 添加项目根目录到 Python 路径
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from scripts.github_client import GitHubClient
+
+API_URL = "https://api.github.com/repos/anthropics/claude-code"
+START = 1_800_000_000.0
+
+
+class ScriptedAdapter(BaseAdapter):
+    """按顺序返回预设响应并记录请求 / Return scripted responses in order and record the requests"""
+
+    def __init__(self, responses):
+        super().__init__()
+        self.responses = list(responses)
+        self.requests = []
+
+    def send(self, request, **kwargs):
+        self.requests.append(request)
+        status, headers, body = self.responses.pop(0)
+        response = requests.Response()
+        response.status_code = status
+        response.headers.update(headers)
+        response._content = body.encode("utf-8")
+        response.url = request.url
+        response.request = request
+        return response
+
+    def close(self):
+        pass
+
+
+class FakeClock:
+    """等待时推进的时钟 / A clock that advances when waited on"""
+
+    def __init__(self):
+        self.now = START
+        self.waits = []
+
+    def time(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float):
+        self.waits.append(seconds)
+        self.now += seconds
+
+
+def make_client(tokens, responses):
+    """构造挂载了预设响应的客户端 / Build a client with scripted responses mounted"""
+    clock = FakeClock()
+    client = GitHubClient(tokens, clock=clock.time, sleep=clock.sleep)
+    adapter = ScriptedAdapter(responses)
+    client.session.mount("https://", adapter)
+    return client, adapter, clock
+
+
+def quota_headers(remaining: int, reset: float) -> dict:
+    """X-RateLimit-* 响应头 / X-RateLimit-* response headers"""
+    return {"X-RateLimit-Limit": "5000", "X-RateLimit-Remaining": str(remaining), "X-RateLimit-Reset": str(int(reset))}
+
+
+def test_rotates_spent_token():
+    """测试主配额耗尽时换用另一个 token。Test a spent primary quota rotates to another token."""
+    failures = []
+
+    client, adapter, clock = make_client(
+        ["token-a", "token-b"],
+        [
+            (403, quota_headers(0, START + 3600), "API rate limit exceeded"),
+            (200, quota_headers(4999, START + 3600), "{}"),
+        ],
+    )
+    response = client.get(API_URL)
+
+    auth = [request.headers.get("Authorization") for request in adapter.requests]
+    if auth != ["Bearer token-a", "Bearer token-b"]:
+        failures.append(f"❌ 应从 token-a 换到 token-b，实际 {auth}")
+    if response.status_code != 200:
+        failures.append(f"❌ 换 token 后应成功，实际 {response.status_code}")
+    if clock.waits:
+        failures.append(f"❌ 还有可用 token 时不应等待: {clock.waits}")
+
+    return failures
+
+
+def test_waits_when_all_tokens_spent():
+    """测试所有 token 耗尽时等待最早的重置。Test every token spent waits for the earliest reset."""
+    failures = []
+
+    client, adapter, clock = make_client(
+        ["token-a"],
+        [
+            (403, quota_headers(0, START + 30), "API rate limit exceeded"),
+            (200, quota_headers(4999, START + 3630), "{}"),
+        ],
+    )
+    response = client.get(API_URL)
+
+    if clock.waits != [31]:
+        failures.append(f"❌ 应等待到重置后 1 秒（31 秒），实际 {clock.waits}")
+    if len(adapter.requests) != 2 or response.status_code != 200:
+        failures.append(f"❌ 重置后应重试成功: {len(adapter.requests)} 次请求，状态 {response.status_code}")
+
+    return failures
+
+
+def test_honours_retry_after():
+    """测试二级速率限制遵循 Retry-After。Test secondary rate limits honour Retry-After."""
+    failures = []
+
+    client, adapter, clock = make_client(
+        ["token-a"],
+        [
+            (403, {"Retry-After": "7"}, "You have exceeded a secondary rate limit"),
+            (200, quota_headers(4998, START + 3600), "{}"),
+        ],
+    )
+    response = client.get(API_URL)
+
+    if clock.waits != [7.0]:
+        failures.append(f"❌ 应按 Retry-After 等待 7 秒，实际 {clock.waits}")
+    if len(adapter.requests) != 2 or response.status_code != 200:
+        failures.append(f"❌ 等待后应重试成功: {len(adapter.requests)} 次请求，状态 {response.status_code}")
+
+    return failures
+
+
+def test_token_only_sent_to_api_host():
+    """测试只向 api.github.com 发送认证头。Test the Authorization header only goes to api.github.com."""
+    failures = []
+
+    client, adapter, _ = make_client(["token-a"], [(200, {}, "readme"), (200, quota_headers(4999, START), "{}")])
+    client.get("https://raw.githubusercontent.com/anthropics/claude-code/main/README.md")
+    client.get(API_URL, headers={"Authorization": "token leaked"})
+
+    raw, api = adapter.requests
+    if "Authorization" in raw.headers:
+        failures.append(f"❌ 不应向 raw.githubusercontent.com 发送认证头: {raw.headers['Authorization']}")
+    if api.headers.get("Authorization") != "Bearer token-a":
+        failures.append(f"❌ api.github.com 应使用池中的 token，实际 {api.headers.get('Authorization')}")
+
+    return failures
+
+
+def run_all_tests():
+    """运行所有测试并报告结果。Run all tests and report results."""
+    print("=" * 80)
+    print("共享 GitHub 客户端测试 | Shared GitHub Client Tests")
+    print("=" * 80)
+    print()
+
+    all_failures = []
+    total_tests = 0
+
+    # 定义所有测试
+    tests = [
+        ("耗尽时换 token", test_rotates_spent_token),
+        ("全部耗尽时等待重置", test_waits_when_all_tokens_spent),
+        ("遵循 Retry-After", test_honours_retry_after),
+        ("认证头只发往 API 主机", test_token_only_sent_to_api_host),
+    ]
+
+    # 运行所有测试
+    for test_name, test_func in tests:
+        total_tests += 1
+        print(f"🧪 测试: {test_name}")
+        failures = test_func()
+
+        if failures:
+            all_failures.extend(failures)
+            print(f"   ❌ 失败 ({len(failures)} 个问题)")
+            for failure in failures:
+                print(f"      {failure}")
+        else:
+            print("   ✅ 通过")
+        print()
+
+    # 最终结果
+    print("=" * 80)
+    if all_failures:
+        print(f"❌ 验证失败 - {len(all_failures)} 个问题，共 {total_tests} 个测试")
+        return 1
+    else:
+        print(f"✅ 验证通过 - 所有 {total_tests} 个测试成功")
+        return 0
+
+
+if __name__ == "__main__":
+    sys.exit(run_all_tests())
@@ -0,0 +1,113 @@
+"""
+GitHub 元数据解析测试
+GitHub Metadata Parsing Tests
+
+根据 CLAUDE.md 要求:
+- 使用真实数据，不使用 Mock
+- 跟踪所有验证失败
+- 有意义的断言验证具体预期值
+"""
+
+import sys
+from pathlib import Path
+
+# 添加项目根目录到 Python 路径
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from scripts.analyze_github_trends import parse_repo_stats
+from scripts.github_graphql import parse_repo_node
+
+# 同一个仓库的 REST 响应与 GraphQL 节点（字段取自 GitHub API 文档）
+# REST response and GraphQL node for the same repository (fields from the GitHub API docs)
+REST_RESPONSE = {
+    "full_name": "anthropics/claude-code",
+    "description": "Claude Code is an agentic coding tool",
+    "stargazers_count": 1250,
+    "watchers_count": 1250,
+    "subscribers_count": 98,
+    "forks_count": 156,
+    "open_issues_count": 42,
+    "pushed_at": "2026-01-30T10:00:00Z",
+    "updated_at": "2026-01-31T08:00:00Z",
+    "archived": False,
+    "language": "TypeScript",
+    "topics": ["ai", "cli"],
+}
+
+GRAPHQL_NODE = {
+    "nameWithOwner": "anthropics/claude-code",
+    "description": "Claude Code is an agentic coding tool",
+    "stargazerCount": 1250,
+    "forkCount": 156,
+    "watchers": {"totalCount": 98},
+    "issues": {"totalCount": 30},
+    "pullRequests": {"totalCount": 12},
+    "pushedAt": "2026-01-30T10:00:00Z",
+    "updatedAt": "2026-01-31T08:00:00Z",
+    "isArchived": False,
+    "primaryLanguage": {"name": "TypeScript"},
+    "repositoryTopics": {"nodes": [{"topic": {"name": "ai"}}, {"topic": {"name": "cli"}}]},
+}
+
+
+def test_rest_and_graphql_agree():
+    """测试 REST 与 GraphQL 解析出相同的统计。Test the REST and GraphQL parsers produce the same stats."""
+    failures = []
+
+    rest = parse_repo_stats(REST_RESPONSE)
+    graphql = parse_repo_node(GRAPHQL_NODE)
+
+    for field, value in rest.items():
+        if graphql.get(field) != value:
+            failures.append(f"❌ 字段 {field} 不一致: REST {value!r}，GraphQL {graphql.get(field)!r}")
+
+    # watchers 是关注者数，不是 star 数 / watchers is subscribers, not stars
+    if rest["watchers"] != 98:
+        failures.append(f"❌ watchers 应为关注者数 98，实际 {rest['watchers']}")
+
+    return failures
+
+
+def run_all_tests():
+    """运行所有测试并报告结果。Run all tests and report results."""
+    print("=" * 80)
+    print("GitHub 元数据解析测试 | GitHub Metadata Parsing Tests")
+    print("=" * 80)
+    print()
+
+    all_failures = []
+    total_tests = 0
+
+    # 定义所有测试
+    tests = [
+        ("REST 与 GraphQL 解析一致", test_rest_and_graphql_agree),
+    ]
+
+    # 运行所有测试
+    for test_name, test_func in tests:
+        total_tests += 1
+        print(f"🧪 测试: {test_name}")
+        failures = test_func()
+
+        if failures:
+            all_failures.extend(failures)
+            print(f"   ❌ 失败 ({len(failures)} 个问题)")
+            for failure in failures:
+                print(f"      {failure}")
+        else:
+            print("   ✅ 通过")
+        print()
+
+    # 最终结果
+    print("=" * 80)
+    if all_failures:
+        print(f"❌ 验证失败 - {len(all_failures)} 个问题，共 {total_tests} 个测试")
+        return 1
+    else:
+        print(f"✅ 验证通过 - 所有 {total_tests} 个测试成功")
+        return 0
+
+
+if __name__ == "__main__":
+    sys.exit(run_all_tests())
@@ -9,6 +9,8 @@ SVG Generation Tests
 """
 
 import sys
+import tempfile
+from datetime import date
 from pathlib import Path
 
 # 添加项目根目录到 Python 路径
@@ -17,7 +19,12 @@ sys.path.insert(0, str(PROJECT_ROOT))
 
 # 导入生成脚本
 from scripts.generate_logo_svgs import generate_logo_svg
-from scripts.generate_ticker_svg import generate_ticker_svg, load_repos
+from scripts.generate_readme import create_h2_svg_file, generate_resource_badge_svg, save_resource_badge_svg
+from scripts.generate_ticker_data import build_ticker_rows, render_ticker_csv
+from scripts.generate_ticker_svg import TICKER_SIZE, generate_ticker_svg, load_repos, rotation_step, select_repos
+from scripts.render_badges import MIN_PARALLEL_BADGES, render_badges
+from scripts.svg_assets import collect_garbage, read_asset_key
+from scripts.svg_template import SvgTemplate, xml_escape
 
 
 def test_generate_logo_svgs():
@@ -182,6 +189,78 @@ def test_generate_ticker_svg():
     return failures
 
 
+def test_ticker_rotation():
+    """测试 ticker 轮换可复现且覆盖全部仓库。Test ticker rotation is reproducible and covers every repo."""
+    failures = []
+
+    repos = [
+        {
+            "full_name": f"owner-{i}/repo-{i}",
+            "stars": i,
+            "watchers": 0,
+            "forks": 0,
+            "stars_delta": 0,
+            "watchers_delta": 0,
+            "forks_delta": 0,
+        }
+        for i in range(23)
+    ]
+
+    # 内容相同、行顺序不同：输出逐字节相同 / Same content, shuffled rows: byte-identical output
+    shuffled = list(reversed(repos))
+    first = generate_ticker_svg(repos, "dark", rotation_step(repos, "content"))
+    if first != generate_ticker_svg(shuffled, "dark", rotation_step(shuffled, "content")):
+        failures.append("❌ 相同输入生成的 ticker 不一致")
+
+    # 连续 3 天覆盖全部 23 个仓库 / Three consecutive days cover all 23 repos
+    first_day = date(2026, 1, 1).toordinal()
+    shown = set()
+    for day in range(first_day, first_day + 3):
+        selected = select_repos(repos, day)
+        if len(selected) != TICKER_SIZE:
+            failures.append(f"❌ 每次应展示 {TICKER_SIZE} 个仓库，实际 {len(selected)}")
+        shown.update(repo["full_name"] for repo in selected)
+    if len(shown) != len(repos):
+        failures.append(f"❌ 轮换未覆盖全部仓库: {len(shown)}/{len(repos)}")
+
+    return failures
+
+
+def test_ticker_data_from_history():
+    """测试从趋势快照计算增量并取涨幅最大的仓库。Test deltas from trend snapshots and the top movers."""
+    failures = []
+
+    def snapshot(day: int, stars: int, forks: int = 0) -> dict:
+        return {"timestamp": f"2026-01-{day:02d}T08:00:00", "stars": stars, "forks": forks, "watchers": 1}
+
+    resources = [
+        {"PrimaryLink": "https://github.com/owner/slow"},
+        {"PrimaryLink": "https://github.com/owner/fast/tree/main"},
+        {"PrimaryLink": "https://github.com/Owner/Fast"},
+        {"PrimaryLink": "https://github.com/owner/new"},
+        {"PrimaryLink": "https://example.com/not-github"},
+    ]
+    history = {
+        "repos": {
+            "owner/slow": {"snapshots": [snapshot(1, 10), snapshot(2, 12, 1)]},
+            # 同一天的两次快照不作为基准 / A same-day snapshot is not the baseline
+            "owner/fast": {"snapshots": [snapshot(1, 100), snapshot(2, 140, 5), snapshot(2, 150, 6)]},
+            "owner/new": {"snapshots": [snapshot(2, 7)]},
+        }
+    }
+
+    rows = build_ticker_rows(resources, history, top=2)
+    summary = [(r["full_name"], r["stars"], r["stars_delta"], r["forks_delta"]) for r in rows]
+    if summary != [("owner/fast", 150, 50, 6), ("owner/slow", 12, 2, 1)]:
+        failures.append(f"❌ 增量或 top-k 错误: {summary}")
+
+    csv_text = render_ticker_csv(build_ticker_rows(resources, history))
+    if "owner/new,7,1,0,0,0,0" not in csv_text or "owner/fast,150,1,6,+50,0,+6" not in csv_text:
+        failures.append(f"❌ ticker CSV 格式错误: {csv_text}")
+
+    return failures
+
+
 def test_svg_chinese_encoding():
     """测试 SVG 中文编码正确。Test SVG Chinese encoding correctness."""
     failures = []
@@ -243,6 +322,101 @@ def test_svg_file_sizes():
     return failures
 
 
+def test_svg_asset_cache():
+    """测试输入未变化时跳过写入，以及回收未引用的资产。Test unchanged inputs skip the write and orphans are collected."""
+    failures = []
+
+    with tempfile.TemporaryDirectory() as tmp:
+        assets_dir = Path(tmp)
+        badge = assets_dir / save_resource_badge_svg("Claude Hooks", "Alice", tmp)
+        heading = assets_dir / create_h2_svg_file("官方资源", "h2-official.svg", tmp, icon="📘")
+        (assets_dir / "logo-light.svg").write_text(generate_logo_svg("light"), encoding="utf-8")
+
+        content = badge.read_text(encoding="utf-8")
+        if "Claude Hooks" not in content or "{" + "name_escaped}" in content:
+            failures.append("❌ badge 内容未填充")
+
+        # 输入相同：不重写 / Same inputs: no rewrite
+        stamp = badge.stat().st_mtime_ns
+        inode = badge.stat().st_ino
+        save_resource_badge_svg("Claude Hooks", "Alice", tmp)
+        if (badge.stat().st_mtime_ns, badge.stat().st_ino) != (stamp, inode):
+            failures.append("❌ 输入未变化却重写了 badge")
+
+        # 作者变化：重新生成 / Author changed: regenerated
+        key = read_asset_key(badge)
+        save_resource_badge_svg("Claude Hooks", "Bob", tmp)
+        if read_asset_key(badge) == key or "by Bob" not in badge.read_text(encoding="utf-8"):
+            failures.append("❌ 作者变化后 badge 未重新生成")
+
+        # 只回收未引用的生成资产，不动 logo / Only unreferenced generated assets are collected, not the logo
+        removed = collect_garbage(assets_dir, [heading.name])
+        remaining = sorted(p.name for p in assets_dir.glob("*.svg"))
+        if removed != [badge.name] or remaining != ["h2-official.svg", "logo-light.svg"]:
+            failures.append(f"❌ 回收结果错误: 删除 {removed}，剩余 {remaining}")
+
+    return failures
+
+
+def test_svg_template():
+    """测试预编译模板与 str.format 输出一致并正确转义。Test precompiled templates match str.format and escape correctly."""
+    failures = []
+
+    template = SvgTemplate('<svg width="{width}"><style>.a {{ fill: {color}; }}</style><text>{name}</text></svg>')
+    values = {"width": 220, "color": "#fff", "name": xml_escape('A & <B> "C"')}
+    expected = template.source.format(**values)
+    if template.render(**values, unused="ignored") != expected:
+        failures.append(f"❌ 渲染结果与 str.format 不一致: {template.render(**values)}")
+    if template.slots != ("width", "color", "name"):
+        failures.append(f"❌ 插槽解析错误: {template.slots}")
+    if "&amp; &lt;B&gt; &quot;C&quot;" not in expected:
+        failures.append(f"❌ XML 转义错误: {expected}")
+
+    try:
+        SvgTemplate("<text>{name.upper()}</text>")
+        failures.append("❌ 表达式插槽未被拒绝")
+    except ValueError:
+        pass
+
+    # badge 中名称和作者都被转义 / Both name and author are escaped in badges
+    badge = generate_resource_badge_svg("Tom & Jerry's <Tools>", "O'Neil")
+    if "Tom &amp; Jerry&apos;s &lt;Tools&gt;" not in badge or "by O&apos;Neil" not in badge:
+        failures.append("❌ badge 未正确转义名称或作者")
+
+    return failures
+
+
+def test_batch_badge_rendering():
+    """测试批量生成与逐个生成一致，并跳过未变化的 badge。Test batch output matches single renders and skips unchanged badges."""
+    failures = []
+
+    resources = [
+        {"DisplayName": f"Tool {i}", "Author": "Alice" if i % 2 else ""} for i in range(MIN_PARALLEL_BADGES)
+    ] + [{"DisplayName": "Tool 0", "Author": "Duplicate"}]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        batch_dir = Path(tmp) / "batch"
+        single_dir = Path(tmp) / "single"
+        single_dir.mkdir()
+
+        stats = render_badges(resources, batch_dir, workers=2)
+        if stats["written"] != MIN_PARALLEL_BADGES:
+            failures.append(f"❌ 生成数量错误: 期望 {MIN_PARALLEL_BADGES}，实际 {stats['written']}")
+
+        for resource in resources[:MIN_PARALLEL_BADGES]:
+            name = save_resource_badge_svg(resource["DisplayName"], resource["Author"], str(single_dir))
+            if (batch_dir / name).read_bytes() != (single_dir / name).read_bytes():
+                failures.append(f"❌ {name} 批量生成结果与逐个生成不一致")
+                break
+
+        # 删除一个资源后重复运行：不重写，只回收 / Re-run without one resource: nothing rewritten, one collected
+        rerun = render_badges(resources[1:MIN_PARALLEL_BADGES], batch_dir, workers=2, gc=True)
+        if rerun["written"] != 0 or rerun["removed"] != ["badge-tool-0.svg"]:
+            failures.append(f"❌ 重复运行结果错误: 生成 {rerun['written']}，回收 {rerun['removed']}")
+
+    return failures
+
+
 def run_all_tests():
     """运行所有测试并报告结果。Run all tests and report results."""
     print("=" * 80)
@@ -258,6 +432,11 @@ def run_all_tests():
         ("生成 Logo SVG", test_generate_logo_svgs),
         ("加载 Ticker 数据", test_load_ticker_data),
         ("生成 Ticker SVG", test_generate_ticker_svg),
+        ("Ticker 轮换", test_ticker_rotation),
+        ("从趋势历史生成 Ticker 数据", test_ticker_data_from_history),
+        ("SVG 资产缓存与回收", test_svg_asset_cache),
+        ("预编译 SVG 模板", test_svg_template),
+        ("批量生成 badge", test_batch_badge_rendering),
         ("SVG 中文编码", test_svg_chinese_encoding),
         ("SVG 文件大小", test_svg_file_sizes),
     ]
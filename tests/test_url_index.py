@@ -0,0 +1,148 @@
+"""
+URL 规范化与索引测试
+URL Canonicalization and Index Tests
+
+根据 CLAUDE.md 要求:
+- 使用真实数据，不使用 Mock
+- 跟踪所有验证失败
+- 有意义的断言验证具体预期值
+"""
+
+import json
+import os
+import sqlite3
+import sys
+import tempfile
+from pathlib import Path
+
+# 添加项目根目录到 Python 路径
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from scripts.url_index import UrlIndex, canonical_url
+
+
+def test_canonical_url():
+    """测试各种 URL 写法规范化为同一形式。Test URL spellings canonicalize to one form."""
+    failures = []
+
+    expected = "github.com/owner/repo"
+    variants = [
+        "https://github.com/owner/repo",
+        "http://www.github.com/Owner/Repo/",
+        "  https://github.com/owner/repo.git  ",
+        "https://github.com/owner/repo?tab=readme-ov-file#install",
+        "github.com/OWNER/repo/",
+    ]
+    for url in variants:
+        if canonical_url(url) != expected:
+            failures.append(f"❌ canonical_url({url!r}) = {canonical_url(url)!r}，期望 {expected!r}")
+
+    if canonical_url("") != "":
+        failures.append("❌ 空 URL 应返回空字符串")
+
+    return failures
+
+
+def test_index_refreshes_changed_sources():
+    """测试索引查找，以及只重建修改过的源文件分区。Test lookups and that only changed sources are rebuilt."""
+    failures = []
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        csv_file = tmp / "table.csv"
+        pending_file = tmp / "pending.json"
+        csv_file.write_text("ID,PrimaryLink\ncsv-1,https://github.com/a/one\n", encoding="utf-8")
+        pending_file.write_text(
+            json.dumps({"resources": [{"ID": "p-1", "PrimaryLink": "https://www.npmjs.com/package/two/"}]}),
+            encoding="utf-8",
+        )
+        sources = {"pending": pending_file, "csv": csv_file}
+        index_file = tmp / "url_index.db"
+
+        index = UrlIndex(index_file, sources)
+        if index.lookup("HTTPS://GitHub.com/a/one/") != ("csv", "csv-1"):
+            failures.append(f"❌ CSV URL 查找错误: {index.lookup('https://github.com/a/one')}")
+        if index.lookup("https://npmjs.com/package/two") != ("pending", "p-1"):
+            failures.append(f"❌ pending URL 查找错误: {index.lookup('https://npmjs.com/package/two')}")
+
+        if index.lookup_github("https://github.com/a/one/tree/main/docs") != ("csv", "csv-1"):
+            failures.append("❌ GitHub owner/repo 查找错误")
+
+        # 只改 mtime、内容不变：哈希相同，不重建 / mtime changes but content does not: same hash, no rebuild
+        os.utime(csv_file, ns=(0, 0))
+        reloaded = UrlIndex(index_file, sources)
+        if reloaded.refreshed:
+            failures.append(f"❌ 源文件内容未修改却重建了分区: {sorted(reloaded.refreshed)}")
+        if reloaded.resources("csv") != [{"ID": "csv-1", "PrimaryLink": "https://github.com/a/one"}]:
+            failures.append(f"❌ 索引中的资源行错误: {reloaded.resources('csv')}")
+
+        pending_file.write_text(
+            json.dumps({"resources": [{"ID": "p-2", "PrimaryLink": "https://github.com/b/three"}]}),
+            encoding="utf-8",
+        )
+        updated = UrlIndex(index_file, sources)
+        if updated.refreshed != {"pending"}:
+            failures.append(f"❌ 应只重建 pending 分区，实际 {sorted(updated.refreshed)}")
+        if "https://npmjs.com/package/two" in updated or "https://github.com/b/three" not in updated:
+            failures.append("❌ 重建后的 pending 分区内容错误")
+        updated.close()
+
+        # 单分区索引只刷新该分区，退出时关闭 / A single-partition index refreshes only it and closes on exit
+        csv_file.write_text("ID,PrimaryLink\ncsv-2,https://github.com/a/two\n", encoding="utf-8")
+        pending_file.write_text(json.dumps({"resources": []}), encoding="utf-8")
+        with UrlIndex(index_file, {"csv": csv_file}) as partial:
+            if partial.refreshed != {"csv"} or partial.resources("csv")[0]["ID"] != "csv-2":
+                failures.append(f"❌ 单分区索引刷新错误: {sorted(partial.refreshed)}")
+        try:
+            partial.resources("csv")
+            failures.append("❌ 退出 with 块后索引连接应已关闭")
+        except sqlite3.ProgrammingError:
+            pass
+
+    return failures
+
+
+def run_all_tests():
+    """运行所有测试并报告结果。Run all tests and report results."""
+    print("=" * 80)
+    print("URL 规范化与索引测试 | URL Canonicalization and Index Tests")
+    print("=" * 80)
+    print()
+
+    all_failures = []
+    total_tests = 0
+
+    # 定义所有测试
+    tests = [
+        ("URL 规范化", test_canonical_url),
+        ("索引按源文件刷新", test_index_refreshes_changed_sources),
+    ]
+
+    # 运行所有测试
+    for test_name, test_func in tests:
+        total_tests += 1
+        print(f"🧪 测试: {test_name}")
+        failures = test_func()
+
+        if failures:
+            all_failures.extend(failures)
+            print(f"   ❌ 失败 ({len(failures)} 个问题)")
+            for failure in failures:
+                print(f"      {failure}")
+        else:
+            print("   ✅ 通过")
+        print()
+
+    # 最终结果
+    print("=" * 80)
+    if all_failures:
+        print(f"❌ 验证失败 - {len(all_failures)} 个问题，共 {total_tests} 个测试")
+        return 1
+    else:
+        print(f"✅ 验证通过 - 所有 {total_tests} 个测试成功")
+        return 0
+
+
+if __name__ == "__main__":
+    sys.exit(run_all_tests())
@@ -0,0 +1,186 @@
+"""
+链接验证条件请求缓存测试
+Link Validation Conditional Request Cache Tests
+
+根据 CLAUDE.md 要求:
+- 使用真实数据，不使用 Mock
+- 跟踪所有验证失败
+- 有意义的断言验证具体预期值
+
+请求由挂载在共享客户端 session 上的传输适配器应答，不访问网络。
+Requests are answered by a transport adapter mounted on the shared client's session,
+without network access.
+"""
+
+import json
+import sys
+import tempfile
+from pathlib import Path
+
+import requests
+from requests.adapters import BaseAdapter
+
+# 添加项目根目录到 Python 路径
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from scripts import github_client, validate_links
+from scripts.github_client import GitHubClient
+from scripts.validate_links import HTTPValidationCache, validate_url
+
+REPO_URL = "https://github.com/anthropics/claude-code"
+
+# 仓库 API 响应（字段取自 GitHub API 文档）/ Repository API response (fields from the GitHub API docs)
+REPO_RESPONSE = {
+    "full_name": "anthropics/claude-code",
+    "license": {"spdx_id": "MIT"},
+    "default_branch": "main",
+    "pushed_at": "2026-01-30T10:00:00Z",
+}
+
+VALIDATORS = {"ETag": 'W/"5f1e"', "Last-Modified": "Fri, 30 Jan 2026 10:00:00 GMT"}
+
+
+class ScriptedAdapter(BaseAdapter):
+    """按顺序返回预设响应并记录请求 / Return scripted responses in order and record the requests"""
+
+    def __init__(self, responses):
+        super().__init__()
+        self.responses = list(responses)
+        self.requests = []
+
+    def send(self, request, **kwargs):
+        self.requests.append(request)
+        status, headers, body = self.responses.pop(0)
+        response = requests.Response()
+        response.status_code = status
+        response.headers.update(headers)
+        response._content = body.encode("utf-8")
+        response.url = request.url
+        response.request = request
+        return response
+
+    def close(self):
+        pass
+
+
+def validate_with(cache: HTTPValidationCache, responses: list):
+    """用预设响应和给定缓存验证仓库链接 / Validate the repo link against scripted responses and a cache"""
+    client = GitHubClient(["token-a"])
+    adapter = ScriptedAdapter(responses)
+    client.session.mount("https://", adapter)
+
+    saved = github_client._client, validate_links.HTTP_CACHE
+    github_client._client, validate_links.HTTP_CACHE = client, cache
+    validate_links.REPO_METADATA.clear()
+    try:
+        return validate_url(REPO_URL), adapter.requests
+    finally:
+        github_client._client, validate_links.HTTP_CACHE = saved
+        validate_links.REPO_METADATA.clear()
+
+
+def test_not_modified_reuses_cache():
+    """测试发送缓存的验证器，304 时复用缓存结果。Test stored validators are sent and a 304 reuses the cached result."""
+    failures = []
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = str(Path(tmp) / "http_cache.json")
+
+        cache = HTTPValidationCache(path)
+        first, _ = validate_with(cache, [(200, VALIDATORS, json.dumps(REPO_RESPONSE))])
+        cache.save()
+
+        # 下次运行从磁盘加载缓存 / The next run loads the cache from disk
+        reloaded = HTTPValidationCache(path)
+        second, sent = validate_with(reloaded, [(304, {}, "")])
+
+        headers = sent[0].headers
+        if headers.get("If-None-Match") != VALIDATORS["ETag"]:
+            failures.append(f"❌ 未发送 If-None-Match: {headers.get('If-None-Match')}")
+        if headers.get("If-Modified-Since") != VALIDATORS["Last-Modified"]:
+            failures.append(f"❌ 未发送 If-Modified-Since: {headers.get('If-Modified-Since')}")
+
+        expected = (True, 200, "MIT", "2026-01-30:10-00-00")
+        if first != expected:
+            failures.append(f"❌ 首次验证结果错误: {first}")
+        if second != (True, 304, "MIT", "2026-01-30:10-00-00"):
+            failures.append(f"❌ 304 应复用缓存的 license 和 pushed_at: {second}")
+        if reloaded.hits != 1:
+            failures.append(f"❌ 应记录 1 次 304 命中，实际 {reloaded.hits}")
+
+    return failures
+
+
+def test_corrupt_cache_ignored():
+    """测试损坏的缓存文件被忽略。Test a corrupt cache file is ignored."""
+    failures = []
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "http_cache.json"
+        path.write_text('{"entries": {"repo https://api.github.com/re', encoding="utf-8")
+
+        cache = HTTPValidationCache(str(path))
+        if cache.entries:
+            failures.append(f"❌ 损坏的缓存应被忽略: {cache.entries}")
+
+        # JSON 合法但结构不对 / Valid JSON with the wrong shape
+        path.write_text("[]", encoding="utf-8")
+        if HTTPValidationCache(str(path)).entries:
+            failures.append("❌ 结构错误的缓存应被忽略")
+
+        result, sent = validate_with(cache, [(200, VALIDATORS, json.dumps(REPO_RESPONSE))])
+        if "If-None-Match" in sent[0].headers or result != (True, 200, "MIT", "2026-01-30:10-00-00"):
+            failures.append(f"❌ 忽略损坏缓存后应正常验证: {result}")
+
+        # 保存时覆盖损坏的文件 / Saving replaces the corrupt file
+        cache.save()
+        if not HTTPValidationCache(str(path)).entries:
+            failures.append("❌ 保存后缓存文件应可读")
+
+    return failures
+
+
+def run_all_tests():
+    """运行所有测试并报告结果。Run all tests and report results."""
+    print("=" * 80)
+    print("链接验证缓存测试 | Link Validation Cache Tests")
+    print("=" * 80)
+    print()
+
+    all_failures = []
+    total_tests = 0
+
+    # 定义所有测试
+    tests = [
+        ("304 复用缓存结果", test_not_modified_reuses_cache),
+        ("忽略损坏的缓存文件", test_corrupt_cache_ignored),
+    ]
+
+    # 运行所有测试
+    for test_name, test_func in tests:
+        total_tests += 1
+        print(f"🧪 测试: {test_name}")
+        failures = test_func()
+
+        if failures:
+            all_failures.extend(failures)
+            print(f"   ❌ 失败 ({len(failures)} 个问题)")
+            for failure in failures:
+                print(f"      {failure}")
+        else:
+            print("   ✅ 通过")
+        print()
+
+    # 最终结果
+    print("=" * 80)
+    if all_failures:
+        print(f"❌ 验证失败 - {len(all_failures)} 个问题，共 {total_tests} 个测试")
+        return 1
+    else:
+        print(f"✅ 验证通过 - 所有 {total_tests} 个测试成功")
+        return 0
+
+
+if __name__ == "__main__":
+    sys.exit(run_all_tests())